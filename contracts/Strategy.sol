@@ -15,6 +15,8 @@ import "../interfaces/ISGETH.sol";
 import "../interfaces/Stargate/IStargateRouter.sol";
 import "../interfaces/Stargate/IPool.sol";
 import "../interfaces/Stargate/ILPStaking.sol";
+import "../interfaces/ISwapper.sol";
+import "../interfaces/IPriceOracle.sol";
 import "./ySwaps/ITradeFactory.sol";
 
 contract Strategy is BaseStrategy {
@@ -22,25 +24,64 @@ contract Strategy is BaseStrategy {
     using Address for address;
 
     uint256 private constant max = type(uint256).max;
-    bool internal isOriginal = true;
+    uint256 private constant BPS = 10_000;
+    address private constant ETH = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE; // how IPriceOracle names native ETH
 
     address public tradeFactory;
-
-
-    uint256 public liquidityPoolID;
-    uint256 public liquidityPoolIDInLPStaking; // Each pool has a main Pool ID and then a separate Pool ID that refers to the pool in the LPStaking contract.
-
-    IERC20 public reward;
-    IPool public liquidityPool;
-    IERC20 public lpToken;
-    IStargateRouter public stargateRouter;
-    ILPStaking public lpStaker;
-
-    string internal strategyName;
-    bool public wantIsWETH;
-    bool public emissionTokenIsSTG;
-
     bool internal unstakeLPOnMigration; //if True it would unstake the LP on `prepareMigration`, if not it would skip this step
+    // Set by prepareReturn and liquidateAllPositions, which harvest() runs before adjustPosition and tend() does
+    // not; adjustPosition clears it. Packed into the slot of the flag above, which is never zero, so setting and
+    // clearing it in one harvest costs little.
+    bool internal harvesting;
+    string internal strategyName;
+    uint256 public minRewardToClaim; // in reward token, harvests leave smaller pending rewards in LPStaking
+    // Want of redeems queued with queueRedeemLocal that has not arrived yet. Their LP is already burned, so this
+    // keeps it in estimatedTotalAssets until the remote chain pays out (see _settleQueuedRedeems).
+    uint256 public queuedRedeemLD;
+    // Want and LP held after our own last move of them while redeems are queued. Whatever is above them since
+    // was paid out by a queued redeem.
+    uint256 internal queuedRedeemWantMark;
+    uint256 internal queuedRedeemLPMark;
+
+    // Unset by default, rewards are then left for yswaps. Once set, every harvest sells all rewards for want
+    // through it, so the profit is reported and re-deposited in the same transaction.
+    ISwapper public swapper;
+    uint256 public maxSlippage; // in basis points below the priceOracle value of the rewards sold
+
+    // Prices rewards and the keeper's call cost in want for harvestTrigger. Unset, only the delays and
+    // creditThreshold trigger harvests.
+    IPriceOracle public priceOracle;
+    uint256 public harvestProfitFactor; // harvest once the profit waiting to be realized is worth this many call costs
+
+    // tendTrigger fires once loose want or unstaked LP is worth more than this, in want. 0 turns that check off.
+    uint256 public tendThreshold;
+
+    event RewardClaimSkipped(uint256 pendingRewards, uint256 minRewardToClaim);
+
+    // Pool configuration never changes after deployment, so it is never kept in storage: the original
+    // reads it from immutables and clones made by StrategyFactory read it from the args appended to
+    // their EIP-1167 bytecode. Clone args layout (86 bytes, abi.encodePacked, see StrategyFactory.cloneArgs):
+    // lpStaker | liquidityPool | stargateRouter | reward | liquidityPoolIDInLPStaking (uint16) |
+    // liquidityPoolID (uint16) | wantIsWETH | emissionTokenIsSTG
+    uint256 private constant CLONE_CODE_SIZE = 0x2d; // EIP-1167 runtime, the args start right after it
+    uint256 private constant ARG_LP_STAKER = 0;
+    uint256 private constant ARG_LIQUIDITY_POOL = 20;
+    uint256 private constant ARG_STARGATE_ROUTER = 40;
+    uint256 private constant ARG_REWARD = 60;
+    uint256 private constant ARG_LIQUIDITY_POOL_ID_IN_LP_STAKING = 80;
+    uint256 private constant ARG_LIQUIDITY_POOL_ID = 82;
+    uint256 private constant ARG_WANT_IS_WETH = 84;
+    uint256 private constant ARG_EMISSION_TOKEN_IS_STG = 85;
+
+    address public immutable original;
+    ILPStaking private immutable originalLpStaker;
+    IPool private immutable originalLiquidityPool; // the Stargate pool is also its own LP token, see lpToken()
+    IStargateRouter private immutable originalStargateRouter;
+    IERC20 private immutable originalReward;
+    uint16 private immutable originalLiquidityPoolIDInLPStaking; // Each pool has a main Pool ID and then a separate Pool ID that refers to the pool in the LPStaking contract.
+    uint16 private immutable originalLiquidityPoolID;
+    bool private immutable originalWantIsWETH;
+    bool private immutable originalEmissionTokenIsSTG;
 
     constructor(
         address _vault,
@@ -50,47 +91,41 @@ contract Strategy is BaseStrategy {
         bool _emissionTokenIsSTG,
         string memory _strategyName
     ) public BaseStrategy(_vault) {
-        _initializeThis(
-            _lpStaker,
-            _liquidityPoolIDInLPStaking,
-            _wantIsWETH,
-            _emissionTokenIsSTG,
-            _strategyName
-        );
+        IPool _liquidityPool = IPool(address(ILPStaking(_lpStaker).poolInfo(_liquidityPoolIDInLPStaking).lpToken));
+
+        original = address(this);
+        originalLpStaker = ILPStaking(_lpStaker);
+        originalLiquidityPool = _liquidityPool;
+        originalStargateRouter = IStargateRouter(_liquidityPool.router());
+        originalReward = IERC20(_emissionTokenIsSTG ? ILPStaking(_lpStaker).stargate() : ILPStaking(_lpStaker).eToken());
+        originalLiquidityPoolIDInLPStaking = _liquidityPoolIDInLPStaking;
+        originalLiquidityPoolID = uint16(_liquidityPool.poolId()); // the router only takes uint16 pool ids
+        originalWantIsWETH = _wantIsWETH;
+        originalEmissionTokenIsSTG = _emissionTokenIsSTG;
+
+        _initializeThis(_lpStaker, _liquidityPool, _wantIsWETH, _strategyName);
     }
 
+    // Only called by StrategyFactory on a fresh clone, whose pool configuration is already in its bytecode
     function initialize(
         address _vault,
         address _strategist,
         address _rewards,
         address _keeper,
-        address _lpStaker,
-        uint16 _liquidityPoolIDInLPStaking,
-        bool _wantIsWETH,
-        bool _emissionTokenIsSTG,
         string memory _strategyName
     ) public {
-        // Make sure we only initialize one time
-        require(address(lpStaker) == address(0)); // dev: strategy already initialized
-
-        // Initialize BaseStrategy
+        // Initialize BaseStrategy, reverts if this strategy was already initialized
         _initialize(_vault, _strategist, _rewards, _keeper);
 
         // Initialize cloned instance
-        _initializeThis(
-            _lpStaker,
-            _liquidityPoolIDInLPStaking,
-            _wantIsWETH,
-            _emissionTokenIsSTG,
-            _strategyName
-        );
+        _initializeThis(address(lpStaker()), liquidityPool(), wantIsWETH(), _strategyName);
     }
 
+    // NOTE: this also runs in the constructor, so it must not read the pool configuration getters
     function _initializeThis(
         address _lpStaker,
-        uint16 _liquidityPoolIDInLPStaking,
+        IPool _liquidityPool,
         bool _wantIsWETH,
-        bool _emissionTokenIsSTG,
         string memory _strategyName
     ) internal {
         minReportDelay = 21 days; // time to trigger harvesting by keeper depending on gas base fee
@@ -98,74 +133,84 @@ contract Strategy is BaseStrategy {
         creditThreshold = 1e6 * (uint(10)**(IERC20Metadata(address(want)).decimals())); //Credit threshold is in want token, and will trigger a harvest if strategy credit is above this amount.
         healthCheck = 0xDDCea799fF1699e98EDF118e0629A974Df7DF012;
         baseFeeOracle = 0xb5e1CAcB567d98faaDB60a1fD4820720141f064F;
-        lpStaker = ILPStaking(_lpStaker);
+        IERC20(address(_liquidityPool)).safeApprove(_lpStaker, max);
+        strategyName = _strategyName;
+        if (_wantIsWETH == false){
+            require(address(want) == _liquidityPool.token());
+        }
+        unstakeLPOnMigration = true;
+        maxSlippage = 100;
+        harvestProfitFactor = 10;
+    }
 
-        emissionTokenIsSTG = _emissionTokenIsSTG;
-        if (emissionTokenIsSTG == true){
-            reward = IERC20(lpStaker.stargate());
-        } else {
-            reward = IERC20(lpStaker.eToken());
+    // ----------------- POOL CONFIGURATION ---------------------
+
+    function lpStaker() public view returns (ILPStaking) {
+        if (address(this) == original) {
+            return originalLpStaker;
         }
+        return ILPStaking(address(uint160(_cloneArg(ARG_LP_STAKER, 20))));
+    }
 
-        liquidityPoolIDInLPStaking = _liquidityPoolIDInLPStaking;
-        lpToken = lpStaker.poolInfo(_liquidityPoolIDInLPStaking).lpToken;
-        liquidityPool = IPool(address(lpToken));
-        liquidityPoolID = liquidityPool.poolId();
-        stargateRouter = IStargateRouter(liquidityPool.router());
-        lpToken.safeApprove(address(lpStaker), max);
-        strategyName = _strategyName;
-        wantIsWETH = _wantIsWETH;
-        if (wantIsWETH == false){
-            require(address(want) == liquidityPool.token());
+    function liquidityPool() public view returns (IPool) {
+        if (address(this) == original) {
+            return originalLiquidityPool;
         }
-        unstakeLPOnMigration = true;
+        return IPool(address(uint160(_cloneArg(ARG_LIQUIDITY_POOL, 20))));
     }
 
-    event Cloned(address indexed clone);
+    function lpToken() public view returns (IERC20) {
+        return IERC20(address(liquidityPool()));
+    }
 
-    function clone(
-        address _vault,
-        address _strategist,
-        address _rewards,
-        address _keeper,
-        address _lpStaker,
-        uint16 _liquidityPoolIDInLPStaking,
-        bool _wantIsWETH,
-        bool _emissionTokenIsSTG,
-        string memory _strategyName
-    ) external returns (address payable newStrategy) {
-        require(isOriginal);
+    function stargateRouter() public view returns (IStargateRouter) {
+        if (address(this) == original) {
+            return originalStargateRouter;
+        }
+        return IStargateRouter(address(uint160(_cloneArg(ARG_STARGATE_ROUTER, 20))));
+    }
 
-        bytes20 addressBytes = bytes20(address(this));
+    function reward() public view returns (IERC20) {
+        if (address(this) == original) {
+            return originalReward;
+        }
+        return IERC20(address(uint160(_cloneArg(ARG_REWARD, 20))));
+    }
 
-        assembly {
-            // EIP-1167 bytecode
-            let clone_code := mload(0x40)
-            mstore(
-                clone_code,
-                0x3d602d80600a3d3981f3363d3d373d3d3d363d73000000000000000000000000
-            )
-            mstore(add(clone_code, 0x14), addressBytes)
-            mstore(
-                add(clone_code, 0x28),
-                0x5af43d82803e903d91602b57fd5bf30000000000000000000000000000000000
-            )
-            newStrategy := create(0, clone_code, 0x37)
-        }
-
-        Strategy(newStrategy).initialize(
-            _vault,
-            _strategist,
-            _rewards,
-            _keeper,
-            _lpStaker,
-            _liquidityPoolIDInLPStaking,
-            _wantIsWETH,
-            _emissionTokenIsSTG,
-            _strategyName
-        );
+    function liquidityPoolIDInLPStaking() public view returns (uint16) {
+        if (address(this) == original) {
+            return originalLiquidityPoolIDInLPStaking;
+        }
+        return uint16(_cloneArg(ARG_LIQUIDITY_POOL_ID_IN_LP_STAKING, 2));
+    }
 
-        emit Cloned(newStrategy);
+    function liquidityPoolID() public view returns (uint16) {
+        if (address(this) == original) {
+            return originalLiquidityPoolID;
+        }
+        return uint16(_cloneArg(ARG_LIQUIDITY_POOL_ID, 2));
+    }
+
+    function wantIsWETH() public view returns (bool) {
+        if (address(this) == original) {
+            return originalWantIsWETH;
+        }
+        return _cloneArg(ARG_WANT_IS_WETH, 1) != 0;
+    }
+
+    function emissionTokenIsSTG() public view returns (bool) {
+        if (address(this) == original) {
+            return originalEmissionTokenIsSTG;
+        }
+        return _cloneArg(ARG_EMISSION_TOKEN_IS_STG, 1) != 0;
+    }
+
+    // reads `_size` bytes at `_offset` of the args appended to this clone's bytecode
+    function _cloneArg(uint256 _offset, uint256 _size) internal view returns (uint256 arg) {
+        assembly {
+            extcodecopy(address(), 0x00, add(CLONE_CODE_SIZE, _offset), _size)
+            arg := shr(sub(256, mul(8, _size)), mload(0x00))
+        }
     }
 
     function name() external view override returns (string memory) {
@@ -173,14 +218,38 @@ contract Strategy is BaseStrategy {
     }
 
     function estimatedTotalAssets() public view override returns (uint256) {
-        return balanceOfWant() + valueOfLPTokens();
+        return balanceOfWant() + valueOfLPTokens() + _queuedRedeemOutstanding(queuedRedeemLD);
+    }
+
+    // What a withdrawal of _amountNeeded would get right now, following liquidatePosition: _withdrawable is
+    // loose want plus the LP that deltaCredit lets us redeem (_lpToRedeem), _blockedByDeltaCredit is the part of
+    // the request we hold as LP but cannot redeem until deltaCredit recovers.
+    function quoteWithdraw(uint256 _amountNeeded)
+        external
+        view
+        returns (
+            uint256 _withdrawable,
+            uint256 _blockedByDeltaCredit,
+            uint256 _lpToRedeem
+        )
+    {
+        uint256 _wantBalance = balanceOfWant();
+        if (_wantBalance >= _amountNeeded) {
+            return (_amountNeeded, 0, 0);
+        }
+        PoolState memory _pool = _poolState();
+        uint256 _totalLP = balanceOfAllLPToken();
+        _lpToRedeem = Math.min(_redeemableLP(_pool, _amountNeeded - _wantBalance), _totalLP);
+        _withdrawable = _wantBalance + _lpToLd(_pool, _lpToRedeem);
+        uint256 _held = Math.min(_amountNeeded, _wantBalance + _lpToLd(_pool, _totalLP));
+        _blockedByDeltaCredit = _held > _withdrawable ? _held - _withdrawable : 0;
     }
 
     function pendingRewards() public view returns (uint256) {
-        if (emissionTokenIsSTG == true){
-            return lpStaker.pendingStargate(liquidityPoolIDInLPStaking, address(this));
+        if (emissionTokenIsSTG() == true){
+            return lpStaker().pendingStargate(liquidityPoolIDInLPStaking(), address(this));
         } else {
-            return lpStaker.pendingEmissionToken(liquidityPoolIDInLPStaking, address(this));
+            return lpStaker().pendingEmissionToken(liquidityPoolIDInLPStaking(), address(this));
         }
     }
 
@@ -193,39 +262,49 @@ contract Strategy is BaseStrategy {
             uint256 _debtPayment
         )
     {
+        harvesting = true;
+        // before the reward sale adds want of its own
+        _settleQueuedRedeems();
         _claimRewards();
+        if (address(swapper) != address(0)) {
+            _sellRewards();
+        }
 
         //grab the estimate total debt from the vault
         uint256 _vaultDebt = vault.strategies(address(this)).totalDebt;
-        uint256 _totalAssets = estimatedTotalAssets();
+
+        // read every balance once and carry it through the rest of the harvest
+        uint256 _wantBalance = balanceOfWant();
+        uint256 _unstakedLP = balanceOfUnstakedLPToken();
+        uint256 _stakedLP = balanceOfStakedLPToken();
+        PoolState memory _pool = _poolState();
+        uint256 _queuedRedeemLD = queuedRedeemLD;
+        uint256 _totalAssets = _wantBalance + _lpToLd(_pool, _unstakedLP + _stakedLP) + _queuedRedeemLD;
 
         _profit = _totalAssets > _vaultDebt ? _totalAssets - _vaultDebt : 0;
 
         //free up _debtOutstanding + our profit, and make any necessary adjustments to the accounting.
-        uint256 _amountFreed;
-        uint256 _toLiquidate = _debtOutstanding + _profit;
-        uint256 _wantBalance = balanceOfWant();
-
-        if (_toLiquidate > _wantBalance) {
-            (_amountFreed, _loss) = withdrawSome(
-                _toLiquidate - _wantBalance
+        if (_debtOutstanding + _profit > _wantBalance) {
+            uint256 _remainingLPValue;
+            (, _loss, _remainingLPValue) = _withdrawSome(
+                _debtOutstanding + _profit - _wantBalance,
+                _unstakedLP,
+                _stakedLP,
+                _pool
             );
-            _totalAssets = estimatedTotalAssets();
-        } else {
-            _amountFreed = balanceOfWant();
+            _wantBalance = balanceOfWant();
+            _totalAssets = _wantBalance + _remainingLPValue + _queuedRedeemLD;
         }
 
-        uint256 _liquidWant = balanceOfWant();
-
         // calculate final p&l and _debtPayment
 
         // enough to pay profit (partial or full) only
-        if (_liquidWant <= _profit) {
-            _profit = _liquidWant;
+        if (_wantBalance <= _profit) {
+            _profit = _wantBalance;
             _debtPayment = 0;
         // enough to pay for all profit and _debtOutstanding (partial or full)
         } else {
-            _debtPayment = Math.min(_liquidWant - _profit, _debtOutstanding);
+            _debtPayment = Math.min(_wantBalance - _profit, _debtOutstanding);
         }
         
         _loss = _loss + (
@@ -244,11 +323,18 @@ contract Strategy is BaseStrategy {
     }
 
     function adjustPosition(uint256 _debtOutstanding) internal override {
+        // tend() only runs adjustPosition: compound here what a harvest claims and sells in prepareReturn. Nothing
+        // is reported to the vault, the next harvest reports it as profit.
+        if (harvesting) {
+            harvesting = false;
+        } else {
+            _tend();
+        }
         uint256 _looseWant = balanceOfWant();
 
         if (_looseWant > _debtOutstanding) {
-            uint256 _amountToDeposit = _looseWant - _debtOutstanding;
-            _addToLP(_amountToDeposit);
+            // _looseWant was just read, so this never adds more than we have
+            _addToLP(_looseWant - _debtOutstanding);
         }
         // we will need to do this no matter the want situation. If there is any unstaked LP Token, let's stake it.
         uint256 unstakedBalance = balanceOfUnstakedLPToken();
@@ -256,32 +342,76 @@ contract Strategy is BaseStrategy {
             //redeposit to farm
             _stakeLP(unstakedBalance);
         }
+        _markQueuedRedeems(0);
+    }
+
+    function _tend() internal {
+        // before the reward sale adds want of its own
+        _settleQueuedRedeems();
+        // without a swapper the rewards wait for yswaps, claiming them early would not put them to work
+        if (address(swapper) != address(0)) {
+            _claimRewards();
+            _sellRewards();
+        }
     }
 
     function withdrawSome(uint256 _amountNeeded)
         internal
         returns (uint256 _liquidatedAmount, uint256 _loss)
+    {
+        (_liquidatedAmount, _loss, ) = _withdrawSome(
+            _amountNeeded,
+            balanceOfUnstakedLPToken(),
+            balanceOfStakedLPToken(),
+            _poolState()
+        );
+    }
+
+    // _unstakedLP, _stakedLP and _pool are the caller's current LP balances and pool snapshot, so we don't have to
+    // read them again. _pool is kept in step with the redeem.
+    function _withdrawSome(
+        uint256 _amountNeeded,
+        uint256 _unstakedLP,
+        uint256 _stakedLP,
+        PoolState memory _pool
+    )
+        internal
+        returns (
+            uint256 _liquidatedAmount,
+            uint256 _loss,
+            uint256 _remainingLPValue
+        )
     {
         uint256 _preWithdrawWant = balanceOfWant();
         if (_amountNeeded > 0) {
-            uint256 unstakedBalance = balanceOfUnstakedLPToken();
-            uint256 lpAmountNeeded = _ldToLp(_amountNeeded);
-            if(unstakedBalance < lpAmountNeeded && balanceOfStakedLPToken() > 0) {
-                _unstakeLP(lpAmountNeeded - unstakedBalance);
-                unstakedBalance = balanceOfUnstakedLPToken();
+            // only redeem what the pool's deltaCredit lets out right now; the rest stays staked and earning
+            uint256 _lpToRedeem = Math.min(_redeemableLP(_pool, _amountNeeded), _unstakedLP + _stakedLP);
+            if (_unstakedLP < _lpToRedeem) {
+                uint256 _amountToUnstake = _lpToRedeem - _unstakedLP;
+                lpStaker().withdraw(liquidityPoolIDInLPStaking(), _amountToUnstake);
+                _unstakedLP = _unstakedLP + _amountToUnstake;
+                _stakedLP = _stakedLP - _amountToUnstake;
             }
-            if (unstakedBalance > 0) {
+            if (_lpToRedeem > 0) {
                 //withdraw from pool
-                _withdrawFromLP(lpAmountNeeded);
+                uint256 _amountSD = _redeemLP(_lpToRedeem);
+                // _lpToRedeem is within the pool's own deltaCredit cap, so all of it was burned
+                _unstakedLP = _unstakedLP - _lpToRedeem;
+                // the pool's own bookkeeping for the burn, so _pool still matches it without reading it again
+                _pool.totalLiquidity = _pool.totalLiquidity - _amountSD;
+                _pool.totalSupply = _pool.totalSupply - _lpToRedeem;
+                _pool.deltaCredit = _pool.deltaCredit - _amountSD;
             }
         }
 
+        _remainingLPValue = _lpToLd(_pool, _unstakedLP + _stakedLP);
         uint256 _liquidAssets = balanceOfWant() - _preWithdrawWant;
         if (_amountNeeded > _liquidAssets) {
             _liquidatedAmount = _liquidAssets;
-            uint256 balanceOfLPTokens = _lpToLd(balanceOfAllLPToken());
             uint256 _potentialLoss = _amountNeeded - _liquidAssets;
-            _loss = _potentialLoss > balanceOfLPTokens ? _potentialLoss - balanceOfLPTokens:0;
+            // want still on its way from queued redeems is not lost either
+            uint256 _heldValue = _remainingLPValue + queuedRedeemLD;
+            _loss = _potentialLoss > _heldValue ? _potentialLoss - _heldValue : 0;
         } else {
             _liquidatedAmount = _amountNeeded;
         }
@@ -292,6 +422,7 @@ contract Strategy is BaseStrategy {
         override
         returns (uint256 _liquidatedAmount, uint256 _loss)
     {
+        _settleQueuedRedeems();
         uint256 _liquidAssets = balanceOfWant();
 
         if (_liquidAssets < _amountNeeded) {
@@ -301,9 +432,13 @@ contract Strategy is BaseStrategy {
 
         _liquidatedAmount = Math.min(_amountNeeded, _liquidAssets);
         require(_amountNeeded >= _liquidatedAmount + _loss, "!check");
+        // BaseStrategy.withdraw sends _liquidatedAmount to the vault right after this
+        _markQueuedRedeems(_liquidatedAmount);
     }
 
     function liquidateAllPositions() internal override returns (uint256) {
+        harvesting = true;
+        _settleQueuedRedeems();
         _emergencyUnstakeLP();
 
         uint256 _lpTokenBalance = balanceOfUnstakedLPToken();
@@ -318,7 +453,7 @@ contract Strategy is BaseStrategy {
         if(unstakeLPOnMigration) {
             _emergencyUnstakeLP();
         }
-        lpToken.safeTransfer(_newStrategy, balanceOfUnstakedLPToken());
+        lpToken().safeTransfer(_newStrategy, balanceOfUnstakedLPToken());
     }
 
     /* ========== KEEP3RS ========== */
@@ -355,6 +490,28 @@ contract Strategy is BaseStrategy {
             return true;
         }
 
+        // between the delays, a harvest that could not move any funds is not worth its gas: nothing loose, no ETH
+        // from queued redeems to wrap, no rewards to sell or leave for yswaps, no unstaked LP to stake, no
+        // deltaCredit to redeem against and no credit to deploy
+        if (
+            balanceOfWant() == 0 &&
+            address(this).balance == 0 &&
+            pendingRewards() + balanceOfReward() == 0 &&
+            balanceOfUnstakedLPToken() == 0 &&
+            liquidityPool().deltaCredit() == 0 &&
+            vault.creditAvailable() == 0
+        ) {
+            return false;
+        }
+
+        // harvest as soon as it pays for itself several times over
+        if (address(priceOracle) != address(0)) {
+            uint256 _callCost = ethToWant(callCostinEth);
+            if (_callCost > 0 && _harvestableProfit(params.totalDebt) > harvestProfitFactor * _callCost) {
+                return true;
+            }
+        }
+
         // harvest our credit if it's above our threshold
         if (vault.creditAvailable() > creditThreshold) {
             return true;
@@ -364,6 +521,53 @@ contract Strategy is BaseStrategy {
         return false;
     }
 
+    // tend to put idle funds to work between harvests: it stakes them without a report to the vault
+    function tendTrigger(uint256 callCostInWei)
+        public
+        view
+        override
+        returns (bool)
+    {
+        // in an emergency exit everything is on its way back to the vault
+        if (!isActive() || emergencyExit) {
+            return false;
+        }
+
+        if (!isBaseFeeAcceptable()) {
+            return false;
+        }
+
+        if (tendThreshold > 0) {
+            // want kept for the debt outstanding is not deployed by a tend
+            uint256 _looseWant = balanceOfWant();
+            if (wantIsWETH() == true) {
+                _looseWant = _looseWant + address(this).balance;
+            }
+            if (_looseWant > vault.debtOutstanding() + tendThreshold) {
+                return true;
+            }
+            uint256 _unstakedLP = balanceOfUnstakedLPToken();
+            if (_unstakedLP > 0 && liquidityPool().amountLPtoLD(_unstakedLP) > tendThreshold) {
+                return true;
+            }
+        }
+
+        // a tend only compounds rewards it can sell, see _tend
+        if (address(swapper) != address(0) && address(priceOracle) != address(0)) {
+            uint256 _pendingRewards = pendingRewards();
+            uint256 _callCost = ethToWant(callCostInWei);
+            if (
+                _pendingRewards >= minRewardToClaim &&
+                _callCost > 0 &&
+                _valueInWant(address(reward()), _pendingRewards + balanceOfReward()) > harvestProfitFactor * _callCost
+            ) {
+                return true;
+            }
+        }
+
+        return false;
+    }
+
     function protectedTokens()
         internal
         view
@@ -371,48 +575,100 @@ contract Strategy is BaseStrategy {
         returns (address[] memory)
     {}
 
-    // convert our keeper's eth cost into want, we don't need this anymore since we override the baseStrategy harvestTrigger
+    // convert our keeper's eth cost into want, 0 without a (fresh) price
     function ethToWant(uint256 _ethAmount)
         public
         view
         override
         returns (uint256)
-    {}
+    {
+        return _valueInWant(ETH, _ethAmount);
+    }
+
+    // Rewards not sold for want yet, claimed or not, valued in want. 0 without a (fresh) price.
+    function pendingRewardsInWant() public view returns (uint256) {
+        return _valueInWant(address(reward()), pendingRewards() + balanceOfReward());
+    }
+
+    // What a harvest would report as profit now, in want: LP fee growth over our debt plus our rewards
+    function _harvestableProfit(uint256 _totalDebt) internal view returns (uint256 _profit) {
+        uint256 _totalAssets = estimatedTotalAssets();
+        if (_totalAssets > _totalDebt) {
+            _profit = _totalAssets - _totalDebt;
+        }
+        _profit += pendingRewardsInWant();
+    }
+
+    // A missing or stale price reads as 0, so triggers fall back to the delays instead of reverting
+    function _valueInWant(address _token, uint256 _amount) internal view returns (uint256) {
+        if (address(priceOracle) == address(0) || _amount == 0) {
+            return 0;
+        }
+        try priceOracle.quote(_token, address(want), _amount) returns (uint256 _value) {
+            return _value;
+        } catch {
+            return 0;
+        }
+    }
 
     // --------- UTILITY & HELPER FUNCTIONS ------------
-    function _lpToLd(uint _amountLP) internal returns (uint) {
-        return liquidityPool.amountLPtoLD(_amountLP);
+    // Everything our LP <-> want conversions and deltaCredit caps need from the pool, read once and passed along
+    // where several of them happen. A single conversion is cheaper through the pool's own amountLPtoLD.
+    struct PoolState {
+        uint256 totalLiquidity;
+        uint256 totalSupply;
+        uint256 convertRate;
+        uint256 deltaCredit;
     }
 
-    function _ldToLp(uint _amountLD) internal returns (uint) {
-        require(liquidityPool.totalLiquidity() > 0);//dev: "Stargate: cant convert SDtoLP when totalLiq == 0";
-        uint256 _amountSD = _amountLD / liquidityPool.convertRate();
-        return _amountSD * liquidityPool.totalSupply() / liquidityPool.totalLiquidity();
+    function _poolState() internal view returns (PoolState memory _pool) {
+        IPool _liquidityPool = liquidityPool();
+        _pool.totalLiquidity = _liquidityPool.totalLiquidity();
+        _pool.totalSupply = _liquidityPool.totalSupply();
+        _pool.convertRate = _liquidityPool.convertRate();
+        _pool.deltaCredit = _liquidityPool.deltaCredit();
+    }
+
+    // same rounding as Pool.amountLPtoLD
+    function _lpToLd(PoolState memory _pool, uint256 _amountLP) internal pure returns (uint256) {
+        require(_pool.totalSupply > 0);//dev: "Stargate: cant convert LPtoSD when totalSupply == 0";
+        return _amountLP * _pool.totalLiquidity / _pool.totalSupply * _pool.convertRate;
+    }
+
+    // same rounding as the pool's deposit side (amountLD -> SD -> LP)
+    function _ldToLp(PoolState memory _pool, uint256 _amountLD) internal pure returns (uint256) {
+        require(_pool.totalLiquidity > 0);//dev: "Stargate: cant convert SDtoLP when totalLiq == 0";
+        return _amountLD / _pool.convertRate * _pool.totalSupply / _pool.totalLiquidity;
+    }
+
+    // LP to redeem for _amountLD, capped at what instantRedeemLocal burns at the pool's current deltaCredit
+    function _redeemableLP(PoolState memory _pool, uint256 _amountLD) internal pure returns (uint256) {
+        return _ldToLp(_pool, Math.min(_amountLD / _pool.convertRate, _pool.deltaCredit) * _pool.convertRate);
     }
 
     function _addToLP(uint256 _amount) internal {
-        // Nice! DRY principle
-        _amount = Math.min(balanceOfWant(), _amount); // we don't want to add to LP more than we have
+        // callers make sure we never add to LP more than we have
         // Check if want token is WETH to unwrap from WETH to ETH to wrap to SGETH:
-        if (wantIsWETH == true){
+        IStargateRouter _stargateRouter = stargateRouter();
+        if (wantIsWETH() == true){
             _convertWETHtoSGETH(_amount);
         } else { // want is not WETH:
-        _checkAllowance(address(stargateRouter), address(want), _amount);
+        _checkAllowance(address(_stargateRouter), address(want), _amount);
         }
-        stargateRouter.addLiquidity(liquidityPoolID, _amount, address(this));
+        _stargateRouter.addLiquidity(liquidityPoolID(), _amount, address(this));
     }
 
     // Strategy needs to have a payable fallback to receive the ETH from WETH contract in case the want of the Strategy is WETH, otherwise revert
     receive() external payable {
-        require(wantIsWETH == true);
+        require(wantIsWETH() == true);
     }
 
     // conversion function needs to be payable to send ETH and thus needs to be public
     function _convertWETHtoSGETH(uint256 _amount) internal {
         IWETH(address(want)).withdraw(_amount);
-        address SGETH = IPool(address(lpToken)).token();
+        address SGETH = liquidityPool().token();
         ISGETH(SGETH).deposit{value: _amount}();
-        _checkAllowance(address(stargateRouter), SGETH, _amount);
+        _checkAllowance(address(stargateRouter()), SGETH, _amount);
     }
 
     function _wrapETHtoWETH() internal {
@@ -426,32 +682,121 @@ contract Strategy is BaseStrategy {
         _convertWETHtoSGETH(_amount);
     }
 
+    // ETH only stays here when a redeem queued with queueRedeemLocal pays out, everything else wraps or
+    // deposits it in the same transaction
+    function _wrapQueuedRedeemETH() internal {
+        uint256 _delivered = address(this).balance;
+        if (_delivered > 0) {
+            _wrapETHtoWETH();
+            uint256 _queuedRedeemLD = queuedRedeemLD;
+            queuedRedeemLD = _delivered < _queuedRedeemLD ? _queuedRedeemLD - _delivered : 0;
+        }
+    }
+
     function wrapETHtoWETH() external onlyVaultManagers {
-        _wrapETHtoWETH();
+        _wrapQueuedRedeemETH();
     }
 
     function withdrawFromLP(uint256 lpAmount) external onlyVaultManagers {
         if (lpAmount > 0 && balanceOfUnstakedLPToken() > 0) {
+            _settleQueuedRedeems();
             _withdrawFromLP(lpAmount);
+            _markQueuedRedeems(0);
+        }
+    }
+
+    // Queue a redeem of LP that deltaCredit doesn't cover: the LP is burned now and the want is sent here
+    // once the message from _dstChainId is delivered. msg.value pays the LayerZero fee, any excess is refunded.
+    function queueRedeemLocal(uint16 _dstChainId, uint256 _dstPoolId, uint256 _amountLP) external payable onlyVaultManagers {
+        _settleQueuedRedeems();
+        uint256 _unstakedLP = balanceOfUnstakedLPToken();
+        if (_unstakedLP < _amountLP) {
+            _unstakeLP(_amountLP - _unstakedLP);
+        }
+        // the pool burns the LP at this rate
+        queuedRedeemLD = queuedRedeemLD + liquidityPool().amountLPtoLD(_amountLP);
+        stargateRouter().redeemLocal{value: msg.value}(
+            _dstChainId,
+            liquidityPoolID(),
+            _dstPoolId,
+            payable(msg.sender),
+            _amountLP,
+            abi.encodePacked(address(this)),
+            IStargateRouter.lzTxObj(0, 0, "")
+        );
+        _markQueuedRedeems(0);
+    }
+
+    // Queued redeems settle by themselves (see _settleQueuedRedeems), this corrects queuedRedeemLD by hand,
+    // e.g. to book want a donation was taken for
+    function settleQueuedRedeem(uint256 _amountLD) external onlyVaultManagers {
+        queuedRedeemLD = queuedRedeemLD - Math.min(_amountLD, queuedRedeemLD);
+    }
+
+    // What of _queuedRedeemLD has not arrived since _markQueuedRedeems: redeems pay out in want, or in ETH when
+    // want is WETH (see _wrapQueuedRedeemETH), or re-mint their LP when the remote chain cannot pay. Want sent
+    // here for any other reason while redeems are queued, a yswaps trade or a donation, is taken for a payout
+    // too: that only defers it to the harvest after the redeem arrives, nothing is counted twice.
+    function _queuedRedeemOutstanding(uint256 _queuedRedeemLD) internal view returns (uint256) {
+        if (_queuedRedeemLD == 0) {
+            return 0;
+        }
+        uint256 _delivered;
+        if (wantIsWETH() == false) {
+            uint256 _wantBalance = balanceOfWant();
+            uint256 _wantMark = queuedRedeemWantMark;
+            if (_wantBalance > _wantMark) {
+                _delivered = _wantBalance - _wantMark;
+            }
+        }
+        uint256 _lp = balanceOfAllLPToken();
+        uint256 _lpMark = queuedRedeemLPMark;
+        if (_lp > _lpMark) {
+            _delivered = _delivered + liquidityPool().amountLPtoLD(_lp - _lpMark);
+        }
+        return _delivered < _queuedRedeemLD ? _queuedRedeemLD - _delivered : 0;
+    }
+
+    // Call before our own moves of want or LP, so none of them is taken for a payout
+    function _settleQueuedRedeems() internal {
+        // redeems queued with queueRedeemLocal pay out in ETH when want is WETH
+        if (wantIsWETH() == true){
+            _wrapQueuedRedeemETH();
+        }
+        uint256 _queuedRedeemLD = queuedRedeemLD;
+        if (_queuedRedeemLD > 0) {
+            queuedRedeemLD = _queuedRedeemOutstanding(_queuedRedeemLD);
+        }
+    }
+
+    // Call after our own moves of want or LP, _wantLeaving is want the caller is about to send away
+    function _markQueuedRedeems(uint256 _wantLeaving) internal {
+        if (queuedRedeemLD > 0) {
+            queuedRedeemWantMark = balanceOfWant() - _wantLeaving;
+            queuedRedeemLPMark = balanceOfAllLPToken();
         }
     }
 
     function _withdrawFromLP(uint256 _lpAmount) internal {
-        _lpAmount = Math.min(balanceOfUnstakedLPToken(), _lpAmount); // we don't want to withdraw more than we have
+        _redeemLP(Math.min(balanceOfUnstakedLPToken(), _lpAmount)); // we don't want to withdraw more than we have
+    }
+
+    // _lpAmount must not exceed our unstaked LP balance. Returns what the pool paid out, in shared decimals.
+    function _redeemLP(uint256 _lpAmount) internal returns (uint256 _amountSD) {
         // This will convert all lp tokens to ETH directly (skipping SGETH)
-        stargateRouter.instantRedeemLocal(
-            uint16(liquidityPoolID),
+        _amountSD = stargateRouter().instantRedeemLocal(
+            liquidityPoolID(),
             _lpAmount,
             address(this)
         );
         // Check if want token is WETH to unwrap from SGETH to ETH to wrap to want WETH:
-        if (wantIsWETH == true){ // We have now all ETH! --> Wrap to WETH:
+        if (wantIsWETH() == true){ // We have now all ETH! --> Wrap to WETH:
             _wrapETHtoWETH();
         }
     }
 
     function _stakeLP(uint256 _amountToStake) internal {
-        lpStaker.deposit(liquidityPoolIDInLPStaking, _amountToStake);
+        lpStaker().deposit(liquidityPoolIDInLPStaking(), _amountToStake);
     }
 
     function unstakeLP(uint256 amountToUnstake) external onlyVaultManagers {
@@ -462,11 +807,11 @@ contract Strategy is BaseStrategy {
 
     function _unstakeLP(uint256 _amountToUnstake) internal {
         _amountToUnstake = Math.min(_amountToUnstake, balanceOfStakedLPToken());
-        lpStaker.withdraw(liquidityPoolIDInLPStaking, _amountToUnstake);
+        lpStaker().withdraw(liquidityPoolIDInLPStaking(), _amountToUnstake);
     }
 
     function _emergencyUnstakeLP() internal {
-        lpStaker.emergencyWithdraw(liquidityPoolIDInLPStaking);
+        lpStaker().emergencyWithdraw(liquidityPoolIDInLPStaking());
     }
 
     function emergencyUnstakeLP() public onlyAuthorized {
@@ -480,7 +825,7 @@ contract Strategy is BaseStrategy {
     function valueOfLPTokens() public view returns (uint256) {
         uint256 _totalLPTokenBalance = balanceOfAllLPToken();
 
-        return liquidityPool.amountLPtoLD(_totalLPTokenBalance);
+        return liquidityPool().amountLPtoLD(_totalLPTokenBalance);
     }
 
     function balanceOfAllLPToken() public view returns (uint256) {
@@ -488,16 +833,16 @@ contract Strategy is BaseStrategy {
     }
 
     function balanceOfUnstakedLPToken() public view returns (uint256) {
-        return lpToken.balanceOf(address(this));
+        return lpToken().balanceOf(address(this));
     }
 
     function balanceOfStakedLPToken() public view returns (uint256) {
         return
-            lpStaker.userInfo(liquidityPoolIDInLPStaking, address(this)).amount;
+            lpStaker().userInfo(liquidityPoolIDInLPStaking(), address(this)).amount;
     }
 
     function balanceOfReward() public view returns (uint256) {
-        return reward.balanceOf(address(this));
+        return reward().balanceOf(address(this));
     }
 
     // _checkAllowance adapted from https://github.com/therealmonoloco/liquity-stability-pool-strategy/blob/1fb0b00d24e0f5621f1e57def98c26900d551089/contracts/Strategy.sol#L316
@@ -513,14 +858,28 @@ contract Strategy is BaseStrategy {
         }
     }
 
+    // A claim is an LPStaking deposit, so harvests don't pay for it until the rewards are worth it
     function _claimRewards() internal {
-        if (pendingRewards() > 0) {
+        uint256 _pendingRewards = pendingRewards();
+        if (_pendingRewards == 0) {
+            return;
+        }
+        if (_pendingRewards < minRewardToClaim) {
+            emit RewardClaimSkipped(_pendingRewards, minRewardToClaim);
+        } else {
             _stakeLP(0);
         }
     }
 
+    // claims whatever is pending, regardless of minRewardToClaim
     function claimRewards() external onlyVaultManagers {
-        _claimRewards();
+        if (pendingRewards() > 0) {
+            _stakeLP(0);
+        }
+    }
+
+    function setMinRewardToClaim(uint256 _minRewardToClaim) external onlyVaultManagers {
+        minRewardToClaim = _minRewardToClaim;
     }
 
     // This allows us to unstake or not before migration
@@ -528,6 +887,56 @@ contract Strategy is BaseStrategy {
         unstakeLPOnMigration = _unstakeLPOnMigration;
     }
 
+    // ----------------- IN-HARVEST SWAPS ---------------------
+
+    // address(0) turns in-harvest swaps off and leaves the rewards to yswaps again. Swaps are bounded by
+    // priceOracle, so a swapper needs one.
+    function setSwapper(address _swapper) external onlyGovernance {
+        require(_swapper == address(0) || address(priceOracle) != address(0)); // dev: !priceOracle
+        IERC20 _reward = reward();
+        if (address(swapper) != address(0)) {
+            _reward.safeApprove(address(swapper), 0);
+        }
+        if (_swapper != address(0)) {
+            _reward.safeApprove(_swapper, max);
+        }
+        swapper = ISwapper(_swapper);
+    }
+
+    function setMaxSlippage(uint256 _maxSlippage) external onlyVaultManagers {
+        require(_maxSlippage <= BPS);
+        maxSlippage = _maxSlippage;
+    }
+
+    // ----------------- HARVEST TRIGGER PRICING ---------------------
+
+    function setPriceOracle(address _priceOracle) external onlyGovernance {
+        require(_priceOracle != address(0) || address(swapper) == address(0)); // dev: swapper needs priceOracle
+        priceOracle = IPriceOracle(_priceOracle);
+    }
+
+    function setHarvestProfitFactor(uint256 _harvestProfitFactor) external onlyVaultManagers {
+        harvestProfitFactor = _harvestProfitFactor;
+    }
+
+    function setTendThreshold(uint256 _tendThreshold) external onlyVaultManagers {
+        tendThreshold = _tendThreshold;
+    }
+
+    function _sellRewards() internal {
+        uint256 _rewardBalance = balanceOfReward();
+        if (_rewardBalance == 0) {
+            return;
+        }
+        address _reward = address(reward());
+        // priced by the oracle, not by the pool we swap through, so moving that pool before a harvest does not move the minimum
+        uint256 _value = _valueInWant(_reward, _rewardBalance);
+        if (_value == 0) {
+            return; // dust, or no fresh price to bound the swap with: keep it for the next harvest
+        }
+        swapper.swap(_reward, address(want), _rewardBalance, _value * (BPS - maxSlippage) / BPS);
+    }
+
     // ----------------- YSWAPS FUNCTIONS ---------------------
 
     function setTradeFactory(address _tradeFactory) external onlyGovernance {
@@ -536,9 +945,10 @@ contract Strategy is BaseStrategy {
         }
 
         // approve and set up trade factory
-        reward.safeApprove(_tradeFactory, max);
+        IERC20 _reward = reward();
+        _reward.safeApprove(_tradeFactory, max);
         ITradeFactory tf = ITradeFactory(_tradeFactory);
-        tf.enable(address(reward), address(want));
+        tf.enable(address(_reward), address(want));
         tradeFactory = _tradeFactory;
     }
 
@@ -547,7 +957,7 @@ contract Strategy is BaseStrategy {
     }
 
     function _removeTradeFactoryPermissions() internal {
-        reward.safeApprove(tradeFactory, 0);
+        reward().safeApprove(tradeFactory, 0);
         tradeFactory = address(0);
     }
 }
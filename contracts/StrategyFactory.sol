@@ -0,0 +1,143 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+pragma experimental ABIEncoderV2;
+
+import "./Strategy.sol";
+
+// Deploys Strategy clones at deterministic CREATE2 addresses. Each clone is an EIP-1167 proxy to `original`
+// with the pool configuration appended to its bytecode, so `initialize` only has to set up BaseStrategy.
+contract StrategyFactory {
+    address public immutable original;
+
+    event Cloned(address indexed clone);
+
+    constructor(address _original) {
+        original = _original;
+    }
+
+    // Pool configuration in the layout Strategy reads from its clone args
+    function cloneArgs(
+        address _lpStaker,
+        uint16 _liquidityPoolIDInLPStaking,
+        bool _wantIsWETH,
+        bool _emissionTokenIsSTG
+    ) public view returns (bytes memory) {
+        ILPStaking lpStaker = ILPStaking(_lpStaker);
+        IPool liquidityPool = IPool(address(lpStaker.poolInfo(_liquidityPoolIDInLPStaking).lpToken));
+        address reward = _emissionTokenIsSTG ? lpStaker.stargate() : lpStaker.eToken();
+        return abi.encodePacked(
+            _lpStaker,
+            address(liquidityPool),
+            liquidityPool.router(),
+            reward,
+            _liquidityPoolIDInLPStaking,
+            uint16(liquidityPool.poolId()), // the router only takes uint16 pool ids
+            _wantIsWETH,
+            _emissionTokenIsSTG
+        );
+    }
+
+    struct CloneParams {
+        address vault;
+        address strategist;
+        address rewards;
+        address keeper;
+        address lpStaker;
+        uint16 liquidityPoolIDInLPStaking;
+        bool wantIsWETH;
+        bool emissionTokenIsSTG;
+        string strategyName;
+        bytes32 salt;
+    }
+
+    function clone(
+        address _vault,
+        address _strategist,
+        address _rewards,
+        address _keeper,
+        address _lpStaker,
+        uint16 _liquidityPoolIDInLPStaking,
+        bool _wantIsWETH,
+        bool _emissionTokenIsSTG,
+        string memory _strategyName,
+        bytes32 _salt
+    ) external returns (address payable newStrategy) {
+        // filled field by field, a ten-argument struct literal does not fit on the stack next to the arguments
+        CloneParams memory params;
+        params.vault = _vault;
+        params.strategist = _strategist;
+        params.rewards = _rewards;
+        params.keeper = _keeper;
+        params.lpStaker = _lpStaker;
+        params.liquidityPoolIDInLPStaking = _liquidityPoolIDInLPStaking;
+        params.wantIsWETH = _wantIsWETH;
+        params.emissionTokenIsSTG = _emissionTokenIsSTG;
+        params.strategyName = _strategyName;
+        params.salt = _salt;
+        newStrategy = _clone(params);
+    }
+
+    // Deploys and initializes one strategy per entry, e.g. one for every LPStaking pool of a new chain
+    function cloneMany(CloneParams[] calldata _params) external returns (address payable[] memory newStrategies) {
+        newStrategies = new address payable[](_params.length);
+        for (uint256 i = 0; i < _params.length; i++) {
+            newStrategies[i] = _clone(_params[i]);
+        }
+    }
+
+    function _clone(CloneParams memory _params) internal returns (address payable newStrategy) {
+        newStrategy = _deploy(
+            cloneArgs(_params.lpStaker, _params.liquidityPoolIDInLPStaking, _params.wantIsWETH, _params.emissionTokenIsSTG),
+            _params.salt
+        );
+
+        Strategy(newStrategy).initialize(
+            _params.vault,
+            _params.strategist,
+            _params.rewards,
+            _params.keeper,
+            _params.strategyName
+        );
+
+        emit Cloned(newStrategy);
+    }
+
+    // The deployer is part of the salt, so nobody else can take an address we predicted for them
+    function predictCloneAddress(
+        address _deployer,
+        bytes memory _args,
+        bytes32 _salt
+    ) public view returns (address) {
+        bytes32 hash = keccak256(
+            abi.encodePacked(bytes1(0xff), address(this), _deployerSalt(_deployer, _salt), keccak256(_cloneCode(_args)))
+        );
+        return address(uint160(uint256(hash)));
+    }
+
+    function _deploy(bytes memory _args, bytes32 _salt) internal returns (address payable newStrategy) {
+        bytes memory cloneCode = _cloneCode(_args);
+        bytes32 salt = _deployerSalt(msg.sender, _salt);
+        assembly {
+            newStrategy := create2(0, add(cloneCode, 0x20), mload(cloneCode), salt)
+        }
+        require(newStrategy != address(0), "!create2");
+    }
+
+    function _deployerSalt(address _deployer, bytes32 _salt) internal pure returns (bytes32) {
+        return keccak256(abi.encodePacked(_deployer, _salt));
+    }
+
+    // EIP-1167 creation code whose runtime (0x2d bytes) is followed by `_args`
+    function _cloneCode(bytes memory _args) internal view returns (bytes memory) {
+        return abi.encodePacked(
+            hex"61",
+            uint16(_args.length + 0x2d),
+            hex"3d81600a3d39f3",
+            hex"363d3d373d3d3d363d73",
+            original,
+            hex"5af43d82803e903d91602b57fd5bf3",
+            _args
+        );
+    }
+}
@@ -0,0 +1,30 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+import {ERC20} from "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+
+// Test-only ERC20 used as a stand-in for USDC/USDT and the STG/OP emission tokens on a dev chain.
+contract MockERC20 is ERC20 {
+    uint8 private immutable tokenDecimals;
+
+    constructor(
+        string memory name_,
+        string memory symbol_,
+        uint8 _tokenDecimals
+    ) ERC20(name_, symbol_) {
+        tokenDecimals = _tokenDecimals;
+    }
+
+    function decimals() public view override returns (uint8) {
+        return tokenDecimals;
+    }
+
+    function mint(address _to, uint256 _amount) external {
+        _mint(_to, _amount);
+    }
+
+    function burn(address _from, uint256 _amount) external {
+        _burn(_from, _amount);
+    }
+}
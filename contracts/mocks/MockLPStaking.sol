@@ -0,0 +1,139 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+pragma experimental ABIEncoderV2;
+
+import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import {SafeERC20} from "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+import "../../interfaces/Stargate/ILPStaking.sol";
+
+// Test-only MasterChef-style stand-in for Stargate's LPStaking (STG emissions) and LPStakingTime (eToken emissions).
+// Rewards are paid out of the contract's own balance of `rewardToken`, so fund it before use.
+contract MockLPStaking {
+    using SafeERC20 for IERC20;
+
+    IERC20 public immutable rewardToken;
+    uint256 public rewardPerBlock;
+    uint256 public totalAllocPoint;
+
+    ILPStaking.PoolInfo[] internal pools;
+    mapping(uint256 => mapping(address => ILPStaking.UserInfo)) internal users;
+
+    event Deposit(address indexed user, uint256 indexed pid, uint256 amount);
+    event Withdraw(address indexed user, uint256 indexed pid, uint256 amount);
+    event EmergencyWithdraw(address indexed user, uint256 indexed pid, uint256 amount);
+
+    constructor(IERC20 _rewardToken, uint256 _rewardPerBlock) {
+        rewardToken = _rewardToken;
+        rewardPerBlock = _rewardPerBlock;
+    }
+
+    function stargate() external view returns (address) {
+        return address(rewardToken);
+    }
+
+    function eToken() external view returns (address) {
+        return address(rewardToken);
+    }
+
+    function poolLength() external view returns (uint256) {
+        return pools.length;
+    }
+
+    function poolInfo(uint256 _pid) external view returns (ILPStaking.PoolInfo memory) {
+        return pools[_pid];
+    }
+
+    function userInfo(uint256 _pid, address _user) external view returns (ILPStaking.UserInfo memory) {
+        return users[_pid][_user];
+    }
+
+    function add(uint256 _allocPoint, IERC20 _lpToken) external {
+        for (uint256 i = 0; i < pools.length; i++) {
+            require(address(pools[i].lpToken) != address(_lpToken), "StarGate: _lpToken already exists");
+        }
+        totalAllocPoint += _allocPoint;
+        pools.push(ILPStaking.PoolInfo({lpToken: _lpToken, allocPoint: _allocPoint, lastRewardBlock: block.number, accStargatePerShare: 0}));
+    }
+
+    function setRewardPerBlock(uint256 _rewardPerBlock) external {
+        for (uint256 pid = 0; pid < pools.length; pid++) {
+            updatePool(pid);
+        }
+        rewardPerBlock = _rewardPerBlock;
+    }
+
+    function pendingStargate(uint256 _pid, address _user) public view returns (uint256) {
+        ILPStaking.PoolInfo memory pool = pools[_pid];
+        ILPStaking.UserInfo memory user = users[_pid][_user];
+        uint256 accStargatePerShare = pool.accStargatePerShare;
+        uint256 lpSupply = pool.lpToken.balanceOf(address(this));
+        if (block.number > pool.lastRewardBlock && lpSupply != 0) {
+            accStargatePerShare += _poolReward(pool) * 1e12 / lpSupply;
+        }
+        return user.amount * accStargatePerShare / 1e12 - user.rewardDebt;
+    }
+
+    function pendingEmissionToken(uint256 _pid, address _user) external view returns (uint256) {
+        return pendingStargate(_pid, _user);
+    }
+
+    function updatePool(uint256 _pid) public {
+        ILPStaking.PoolInfo storage pool = pools[_pid];
+        if (block.number <= pool.lastRewardBlock) {
+            return;
+        }
+        uint256 lpSupply = pool.lpToken.balanceOf(address(this));
+        if (lpSupply == 0) {
+            pool.lastRewardBlock = block.number;
+            return;
+        }
+        pool.accStargatePerShare += _poolReward(pool) * 1e12 / lpSupply;
+        pool.lastRewardBlock = block.number;
+    }
+
+    function deposit(uint256 _pid, uint256 _amount) external {
+        ILPStaking.PoolInfo storage pool = pools[_pid];
+        ILPStaking.UserInfo storage user = users[_pid][msg.sender];
+        updatePool(_pid);
+        if (user.amount > 0) {
+            _safeRewardTransfer(msg.sender, user.amount * pool.accStargatePerShare / 1e12 - user.rewardDebt);
+        }
+        pool.lpToken.safeTransferFrom(msg.sender, address(this), _amount);
+        user.amount += _amount;
+        user.rewardDebt = user.amount * pool.accStargatePerShare / 1e12;
+        emit Deposit(msg.sender, _pid, _amount);
+    }
+
+    function withdraw(uint256 _pid, uint256 _amount) external {
+        ILPStaking.PoolInfo storage pool = pools[_pid];
+        ILPStaking.UserInfo storage user = users[_pid][msg.sender];
+        require(user.amount >= _amount, "withdraw: _amount is too large");
+        updatePool(_pid);
+        _safeRewardTransfer(msg.sender, user.amount * pool.accStargatePerShare / 1e12 - user.rewardDebt);
+        user.amount -= _amount;
+        user.rewardDebt = user.amount * pool.accStargatePerShare / 1e12;
+        pool.lpToken.safeTransfer(msg.sender, _amount);
+        emit Withdraw(msg.sender, _pid, _amount);
+    }
+
+    function emergencyWithdraw(uint256 _pid) external {
+        ILPStaking.PoolInfo storage pool = pools[_pid];
+        ILPStaking.UserInfo storage user = users[_pid][msg.sender];
+        uint256 amount = user.amount;
+        user.amount = 0;
+        user.rewardDebt = 0;
+        pool.lpToken.safeTransfer(msg.sender, amount);
+        emit EmergencyWithdraw(msg.sender, _pid, amount);
+    }
+
+    function _poolReward(ILPStaking.PoolInfo memory _pool) internal view returns (uint256) {
+        return (block.number - _pool.lastRewardBlock) * rewardPerBlock * _pool.allocPoint / totalAllocPoint;
+    }
+
+    function _safeRewardTransfer(address _to, uint256 _amount) internal {
+        uint256 rewardBalance = rewardToken.balanceOf(address(this));
+        rewardToken.safeTransfer(_to, _amount > rewardBalance ? rewardBalance : _amount);
+    }
+}
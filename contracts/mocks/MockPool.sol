@@ -0,0 +1,117 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+import {ERC20} from "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import {SafeERC20} from "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+// Test-only stand-in for a Stargate Pool. The pool is its own LP token and keeps `totalLiquidity`
+// and `deltaCredit` in shared decimals, following the LP math of the deployed contract.
+contract MockPool is ERC20 {
+    using SafeERC20 for IERC20;
+
+    uint256 public immutable poolId;
+    address public immutable token;
+    address public immutable router;
+    uint256 public immutable sharedDecimals;
+    uint256 public immutable localDecimals;
+    uint256 public immutable convertRate;
+
+    uint256 public totalLiquidity; // the total amount of tokens added on this side of the chain (fees + deposits - withdrawals)
+    uint256 public deltaCredit; // credits available for instant local redeems
+
+    modifier onlyRouter() {
+        require(msg.sender == router, "Stargate: only the router can call this method");
+        _;
+    }
+
+    constructor(
+        uint256 _poolId,
+        address _token,
+        uint256 _sharedDecimals,
+        uint256 _localDecimals,
+        address _router,
+        string memory name_,
+        string memory symbol_
+    ) ERC20(name_, symbol_) {
+        poolId = _poolId;
+        token = _token;
+        sharedDecimals = _sharedDecimals;
+        localDecimals = _localDecimals;
+        convertRate = 10**(_localDecimals - _sharedDecimals);
+        router = _router;
+    }
+
+    function decimals() public view override returns (uint8) {
+        return uint8(sharedDecimals);
+    }
+
+    function amountLPtoLD(uint256 _amountLP) external view returns (uint256) {
+        return _amountLPtoSD(_amountLP) * convertRate;
+    }
+
+    function mint(address _to, uint256 _amountLD) external onlyRouter returns (uint256 amountSD) {
+        amountSD = _amountLD / convertRate;
+        uint256 amountLPTokens = amountSD;
+        if (totalSupply() != 0) {
+            amountLPTokens = amountSD * totalSupply() / totalLiquidity;
+        }
+        deltaCredit += amountSD;
+        totalLiquidity += amountSD;
+        _mint(_to, amountLPTokens);
+    }
+
+    function instantRedeemLocal(
+        address _from,
+        uint256 _amountLP,
+        address _to
+    ) external onlyRouter returns (uint256 amountSD) {
+        uint256 _deltaCredit = deltaCredit;
+        uint256 _capAmountLP = _amountSDtoLP(_deltaCredit);
+        if (_amountLP > _capAmountLP) _amountLP = _capAmountLP;
+
+        amountSD = _burnLocal(_from, _amountLP);
+        deltaCredit = _deltaCredit - amountSD;
+        IERC20(token).safeTransfer(_to, amountSD * convertRate);
+    }
+
+    // burns the LP now; the underlying is paid out by `sendLocal` once the (simulated) remote chain answers
+    function redeemLocal(address _from, uint256 _amountLP) external onlyRouter returns (uint256 amountSD) {
+        amountSD = _burnLocal(_from, _amountLP);
+    }
+
+    function sendLocal(address _to, uint256 _amountSD) external onlyRouter {
+        IERC20(token).safeTransfer(_to, _amountSD * convertRate);
+    }
+
+    // ----------------- TEST HELPERS ---------------------
+
+    // simulate other chains draining (or refilling) the credit available for instant redeems
+    function setDeltaCredit(uint256 _deltaCredit) external {
+        deltaCredit = _deltaCredit;
+    }
+
+    // simulate swap fees accruing to LPs: grows totalLiquidity without minting LP
+    function accrueFees(uint256 _amountLD) external {
+        IERC20(token).safeTransferFrom(msg.sender, address(this), _amountLD);
+        totalLiquidity += _amountLD / convertRate;
+    }
+
+    function _burnLocal(address _from, uint256 _amountLP) internal returns (uint256 amountSD) {
+        require(totalSupply() > 0, "Stargate: cant burn when totalSupply == 0");
+        amountSD = _amountLPtoSD(_amountLP);
+        totalLiquidity -= amountSD;
+        _burn(_from, _amountLP);
+    }
+
+    function _amountLPtoSD(uint256 _amountLP) internal view returns (uint256) {
+        require(totalSupply() > 0, "Stargate: cant convert LPtoSD when totalSupply == 0");
+        return _amountLP * totalLiquidity / totalSupply();
+    }
+
+    function _amountSDtoLP(uint256 _amountSD) internal view returns (uint256) {
+        require(totalLiquidity > 0, "Stargate: cant convert SDtoLP when totalLiq == 0");
+        return _amountSD * totalSupply() / totalLiquidity;
+    }
+}
@@ -0,0 +1,40 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+// Test-only Chainlink feed whose answer and update time are set by hand.
+contract MockPriceFeed {
+    uint8 public immutable decimals;
+    int256 public latestAnswer;
+    uint256 public latestTimestamp;
+    uint80 public latestRound;
+
+    constructor(uint8 _decimals, int256 _answer) {
+        decimals = _decimals;
+        setAnswer(_answer);
+    }
+
+    function setAnswer(int256 _answer) public {
+        setAnswerAt(_answer, block.timestamp);
+    }
+
+    function setAnswerAt(int256 _answer, uint256 _timestamp) public {
+        latestAnswer = _answer;
+        latestTimestamp = _timestamp;
+        latestRound += 1;
+    }
+
+    function latestRoundData()
+        external
+        view
+        returns (
+            uint80 roundId,
+            int256 answer,
+            uint256 startedAt,
+            uint256 updatedAt,
+            uint80 answeredInRound
+        )
+    {
+        return (latestRound, latestAnswer, latestTimestamp, latestTimestamp, latestRound);
+    }
+}
@@ -0,0 +1,27 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+import "../../interfaces/IPriceOracle.sol";
+
+// Test-only IPriceOracle with fixed rates set per pair.
+contract MockPriceOracle is IPriceOracle {
+    // rates[tokenIn][tokenOut] is the amount of tokenOut one 1e18 of tokenIn is worth
+    mapping(address => mapping(address => uint256)) public rates;
+
+    function setRate(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _rate
+    ) external {
+        rates[_tokenIn][_tokenOut] = _rate;
+    }
+
+    function quote(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _amountIn
+    ) external view override returns (uint256) {
+        return (_amountIn * rates[_tokenIn][_tokenOut]) / 1e18;
+    }
+}
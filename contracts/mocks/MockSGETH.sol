@@ -0,0 +1,44 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+import {ERC20} from "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+
+// Test-only stand-in for Stargate's SGETH. Like the real token, transfers to any address that is
+// not whitelisted in `noUnwrapTo` (i.e. anything but the pool) are paid out in native ETH.
+contract MockSGETH is ERC20 {
+    mapping(address => bool) public noUnwrapTo;
+
+    constructor() ERC20("Stargate Ether Vault", "SGETH") {}
+
+    function deposit() external payable {
+        _mint(msg.sender, msg.value);
+    }
+
+    function withdraw(uint256 _amount) external {
+        _burn(msg.sender, _amount);
+        _sendETH(msg.sender, _amount);
+    }
+
+    function setNoUnwrapTo(address _address, bool _noUnwrap) external {
+        noUnwrapTo[_address] = _noUnwrap;
+    }
+
+    function _transfer(
+        address _from,
+        address _to,
+        uint256 _amount
+    ) internal override {
+        if (noUnwrapTo[_to]) {
+            super._transfer(_from, _to, _amount);
+        } else {
+            _burn(_from, _amount);
+            _sendETH(_to, _amount);
+        }
+    }
+
+    function _sendETH(address _to, uint256 _amount) internal {
+        (bool success, ) = _to.call{value: _amount}("");
+        require(success, "SGETH: failed to send ETH");
+    }
+}
@@ -0,0 +1,89 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import {SafeERC20} from "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+import "./MockPool.sol";
+import "../../interfaces/Stargate/IStargateRouter.sol";
+
+// Test-only stand-in for the Stargate Router: local liquidity add and instant redeem only.
+contract MockStargateRouter {
+    using SafeERC20 for IERC20;
+
+    struct QueuedRedeem {
+        MockPool pool;
+        address to;
+        uint256 amountSD;
+    }
+
+    mapping(uint256 => MockPool) public getPool;
+    QueuedRedeem[] public queuedRedeems;
+
+    event RedeemLocalQueued(uint256 id, uint256 amountLP, uint256 amountSD);
+
+    function registerPool(MockPool _pool) external {
+        require(_pool.router() == address(this), "Stargate: pool router mismatch");
+        getPool[_pool.poolId()] = _pool;
+    }
+
+    function addLiquidity(
+        uint256 _poolId,
+        uint256 _amountLD,
+        address _to
+    ) external {
+        MockPool pool = _getPool(_poolId);
+        uint256 convertRate = pool.convertRate();
+        _amountLD = _amountLD / convertRate * convertRate;
+        IERC20(pool.token()).safeTransferFrom(msg.sender, address(pool), _amountLD);
+        pool.mint(_to, _amountLD);
+    }
+
+    function instantRedeemLocal(
+        uint16 _srcPoolId,
+        uint256 _amountLP,
+        address _to
+    ) external returns (uint256 amountSD) {
+        require(_amountLP > 0, "Stargate: not enough lp to redeem");
+        MockPool pool = _getPool(_srcPoolId);
+        amountSD = pool.instantRedeemLocal(msg.sender, _amountLP, _to);
+    }
+
+    // redeemLocal is answered by the remote chain, so the mock queues it until `deliverRedeemLocal`
+    function redeemLocal(
+        uint16,
+        uint256 _srcPoolId,
+        uint256,
+        address payable _refundAddress,
+        uint256 _amountLP,
+        bytes calldata _to,
+        IStargateRouter.lzTxObj memory
+    ) external payable {
+        require(_amountLP > 0, "Stargate: not enough lp to redeem");
+        MockPool pool = _getPool(_srcPoolId);
+        uint256 amountSD = pool.redeemLocal(msg.sender, _amountLP);
+        queuedRedeems.push(QueuedRedeem(pool, address(bytes20(_to)), amountSD));
+        if (msg.value > 0) {
+            (bool success, ) = _refundAddress.call{value: msg.value}("");
+            require(success, "Stargate: failed to refund");
+        }
+        emit RedeemLocalQueued(queuedRedeems.length - 1, _amountLP, amountSD);
+    }
+
+    function deliverRedeemLocal(uint256 _id) external {
+        QueuedRedeem memory redeem = queuedRedeems[_id];
+        require(redeem.amountSD > 0, "Stargate: nothing to deliver");
+        delete queuedRedeems[_id];
+        redeem.pool.sendLocal(redeem.to, redeem.amountSD);
+    }
+
+    function queuedRedeemsLength() external view returns (uint256) {
+        return queuedRedeems.length;
+    }
+
+    function _getPool(uint256 _poolId) internal view returns (MockPool pool) {
+        pool = getPool[_poolId];
+        require(address(pool) != address(0), "Stargate: Pool does not exist");
+    }
+}
@@ -0,0 +1,68 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import {SafeERC20} from "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+// Test-only Uniswap V2 router that is also its own set of constant-product pairs (0.3% fee), so the in-harvest
+// reward swaps can run on a dev chain. `skim` makes swaps pay out less than getAmountsOut quoted, as if the
+// swap had been sandwiched.
+contract MockUniswapV2Router {
+    using SafeERC20 for IERC20;
+
+    // reserves[tokenA][tokenB] is the amount of tokenA in the tokenA/tokenB pair
+    mapping(address => mapping(address => uint256)) public reserves;
+    uint256 public skim; // in basis points
+
+    function addLiquidity(
+        address _tokenA,
+        address _tokenB,
+        uint256 _amountA,
+        uint256 _amountB
+    ) external {
+        IERC20(_tokenA).safeTransferFrom(msg.sender, address(this), _amountA);
+        IERC20(_tokenB).safeTransferFrom(msg.sender, address(this), _amountB);
+        reserves[_tokenA][_tokenB] += _amountA;
+        reserves[_tokenB][_tokenA] += _amountB;
+    }
+
+    function setSkim(uint256 _skim) external {
+        require(_skim <= 10_000);
+        skim = _skim;
+    }
+
+    function getAmountsOut(uint256 _amountIn, address[] memory _path) public view returns (uint256[] memory amounts) {
+        require(_path.length >= 2, "UniswapV2Library: INVALID_PATH");
+        amounts = new uint256[](_path.length);
+        amounts[0] = _amountIn;
+        for (uint256 i = 0; i < _path.length - 1; i++) {
+            uint256 _reserveIn = reserves[_path[i]][_path[i + 1]];
+            uint256 _reserveOut = reserves[_path[i + 1]][_path[i]];
+            require(_reserveIn > 0 && _reserveOut > 0, "UniswapV2Library: INSUFFICIENT_LIQUIDITY");
+            uint256 _amountInWithFee = amounts[i] * 997;
+            amounts[i + 1] = (_amountInWithFee * _reserveOut) / (_reserveIn * 1000 + _amountInWithFee);
+        }
+    }
+
+    function swapExactTokensForTokens(
+        uint256 _amountIn,
+        uint256 _amountOutMin,
+        address[] calldata _path,
+        address _to,
+        uint256 _deadline
+    ) external returns (uint256[] memory amounts) {
+        require(_deadline >= block.timestamp, "UniswapV2Router: EXPIRED");
+        amounts = getAmountsOut(_amountIn, _path);
+        uint256 _last = _path.length - 1;
+        amounts[_last] = (amounts[_last] * (10_000 - skim)) / 10_000;
+        require(amounts[_last] >= _amountOutMin, "UniswapV2Router: INSUFFICIENT_OUTPUT_AMOUNT");
+
+        IERC20(_path[0]).safeTransferFrom(msg.sender, address(this), _amountIn);
+        for (uint256 i = 0; i < _last; i++) {
+            reserves[_path[i]][_path[i + 1]] += amounts[i];
+            reserves[_path[i + 1]][_path[i]] -= amounts[i + 1];
+        }
+        IERC20(_path[_last]).safeTransfer(_to, amounts[_last]);
+    }
+}
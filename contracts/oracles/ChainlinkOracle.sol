@@ -0,0 +1,67 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+import "@openzeppelin/contracts/access/Ownable.sol";
+
+import "../../interfaces/IERC20Metadata.sol";
+import "../../interfaces/IPriceOracle.sol";
+import "../../interfaces/Chainlink/IPriceFeed.sol";
+
+// IPriceOracle over Chainlink feeds. Every feed set here must quote the same currency (e.g. all */USD), so any
+// two tokens with a feed can be priced against each other. Answers older than the feed's maxAge revert.
+contract ChainlinkOracle is IPriceOracle, Ownable {
+    address private constant ETH = 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE;
+
+    struct Feed {
+        IPriceFeed feed;
+        uint8 feedDecimals;
+        uint8 tokenDecimals;
+        uint32 maxAge; // seconds, the feed's heartbeat plus some slack
+    }
+
+    mapping(address => Feed) public feeds;
+
+    event FeedSet(address indexed token, address feed, uint32 maxAge);
+
+    function setFeed(
+        address _token,
+        address _feed,
+        uint32 _maxAge
+    ) external onlyOwner {
+        feeds[_token] = Feed(
+            IPriceFeed(_feed),
+            IPriceFeed(_feed).decimals(),
+            _token == ETH ? 18 : IERC20Metadata(_token).decimals(),
+            _maxAge
+        );
+        emit FeedSet(_token, _feed, _maxAge);
+    }
+
+    // price of one whole `_token` with 18 decimals, in the feeds' currency
+    function price(address _token) public view returns (uint256) {
+        return _price(feeds[_token]);
+    }
+
+    function quote(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _amountIn
+    ) external view override returns (uint256) {
+        if (_amountIn == 0) {
+            return 0;
+        }
+        Feed memory _in = feeds[_tokenIn];
+        Feed memory _out = feeds[_tokenOut];
+        return
+            (_amountIn * _price(_in) * 10**_out.tokenDecimals) / (_price(_out) * 10**_in.tokenDecimals);
+    }
+
+    function _price(Feed memory _feed) internal view returns (uint256) {
+        require(address(_feed.feed) != address(0), "!feed");
+        (uint80 _roundId, int256 _answer, , uint256 _updatedAt, uint80 _answeredInRound) = _feed.feed.latestRoundData();
+        require(_answer > 0, "!price");
+        require(_answeredInRound >= _roundId && _updatedAt + _feed.maxAge >= block.timestamp, "stale");
+        return uint256(_answer) * 10**(18 - _feed.feedDecimals);
+    }
+}
@@ -0,0 +1,69 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+import "@openzeppelin/contracts/access/Ownable.sol";
+import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import {SafeERC20} from "@openzeppelin/contracts/token/ERC20/utils/SafeERC20.sol";
+
+import "../../interfaces/ISwapper.sol";
+import "../../interfaces/Uniswap/IUniswapV2Router02.sol";
+
+// ISwapper over a Uniswap V2 style router (Uniswap, Sushiswap, Velodrome-like forks with the V2 interface).
+// Pairs without a route set by the owner are swapped directly, e.g. STG -> USDC -> WETH needs setPath.
+contract UniswapV2Swapper is ISwapper, Ownable {
+    using SafeERC20 for IERC20;
+
+    IUniswapV2Router02 public immutable router;
+
+    mapping(address => mapping(address => address[])) internal paths;
+
+    constructor(address _router) {
+        router = IUniswapV2Router02(_router);
+    }
+
+    // _path runs from the token sold to the token bought, any intermediate hops in between
+    function setPath(address[] calldata _path) external onlyOwner {
+        require(_path.length >= 2, "!path");
+        paths[_path[0]][_path[_path.length - 1]] = _path;
+    }
+
+    function path(address _tokenIn, address _tokenOut) public view returns (address[] memory _path) {
+        _path = paths[_tokenIn][_tokenOut];
+        if (_path.length == 0) {
+            _path = new address[](2);
+            _path[0] = _tokenIn;
+            _path[1] = _tokenOut;
+        }
+    }
+
+    function quote(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _amountIn
+    ) external view override returns (uint256) {
+        uint256[] memory _amounts = router.getAmountsOut(_amountIn, path(_tokenIn, _tokenOut));
+        return _amounts[_amounts.length - 1];
+    }
+
+    function swap(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _amountIn,
+        uint256 _minAmountOut
+    ) external override returns (uint256 amountOut) {
+        IERC20(_tokenIn).safeTransferFrom(msg.sender, address(this), _amountIn);
+        if (IERC20(_tokenIn).allowance(address(this), address(router)) < _amountIn) {
+            IERC20(_tokenIn).safeApprove(address(router), 0);
+            IERC20(_tokenIn).safeApprove(address(router), type(uint256).max);
+        }
+        uint256[] memory _amounts = router.swapExactTokensForTokens(
+            _amountIn,
+            _minAmountOut,
+            path(_tokenIn, _tokenOut),
+            msg.sender,
+            block.timestamp
+        );
+        amountOut = _amounts[_amounts.length - 1];
+    }
+}
@@ -8,4 +8,15 @@ interface IPriceFeed {
     function latestRound() external view returns (uint256);
     function getAnswer(uint256 roundId) external view returns (int256);
     function getTimestamp(uint256 roundId) external view returns (uint256);
+    function decimals() external view returns (uint8);
+    function latestRoundData()
+        external
+        view
+        returns (
+            uint80 roundId,
+            int256 answer,
+            uint256 startedAt,
+            uint256 updatedAt,
+            uint80 answeredInRound
+        );
 }
@@ -0,0 +1,13 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+// Prices tokens for the strategy's keeper logic. Native ETH is 0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE.
+interface IPriceOracle {
+    // value of `_amountIn` of `_tokenIn`, in `_tokenOut`
+    function quote(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _amountIn
+    ) external view returns (uint256);
+}
@@ -0,0 +1,23 @@
+// SPDX-License-Identifier: AGPL-3.0
+
+pragma solidity 0.8.15;
+
+// Sells one token for another on some venue (Uniswap V2/V3 routes, Curve, ...) on behalf of the caller.
+interface ISwapper {
+    // Expected output for `_amountIn` at the venue's current state. It moves with the venue, so it must not bound
+    // the slippage of a swap through the same venue; Strategy prices its swaps with its priceOracle instead.
+    function quote(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _amountIn
+    ) external view returns (uint256);
+
+    // Pulls `_amountIn` of `_tokenIn` from msg.sender and sends the `_tokenOut` bought back to it.
+    // Reverts if that is less than `_minAmountOut`.
+    function swap(
+        address _tokenIn,
+        address _tokenOut,
+        uint256 _amountIn,
+        uint256 _minAmountOut
+    ) external returns (uint256 amountOut);
+}
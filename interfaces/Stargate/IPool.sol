@@ -9,6 +9,7 @@ interface IPool {
     function totalLiquidity() external view returns (uint256); // the total amount of tokens added on this side of the chain (fees + deposits - withdrawals)
     function totalSupply() external view returns (uint256);
     function convertRate() external view returns (uint256); // the decimals for the token
+    function deltaCredit() external view returns (uint256); // credits available for instant local redeems, in shared decimals
 
     function amountLPtoLD(uint256 _amountLP) external view returns (uint256);
 
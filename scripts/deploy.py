@@ -1,13 +1,37 @@
+import json
+import os
+import time
 from pathlib import Path
 
-from brownie import Strategy, accounts, config, network, project, web3
+from brownie import (
+    Contract,
+    Strategy,
+    accounts,
+    chain,
+    config,
+    interface,
+    multicall,
+    network,
+    project,
+    web3,
+)
 from eth_utils import is_checksum_address
 import click
+import yaml
+
+from scripts.deploy_all import VAULT_ABI, clone_salt, deploy_params
+from scripts.mock_stargate import deploy_stargate_stack
 
 API_VERSION = config["dependencies"][0].split("@")[-1]
-Vault = project.load(
-    Path.home() / ".brownie" / "packages" / config["dependencies"][0]
-).Vault
+DEPLOYMENTS_DIR = Path(__file__).parent.parent / "deployments"
+
+
+def vault_container():
+    # loaded on demand, so importing this module does not require the Vault package up front
+    return project.load(
+        Path.home() / ".brownie" / "packages" / config["dependencies"][0],
+        raise_if_loaded=False,
+    ).Vault
 
 
 def get_address(msg: str, default: str = None) -> str:
@@ -35,7 +59,7 @@ def main():
     print(f"You are using: 'dev' [{dev.address}]")
 
     if input("Is there a Vault for this strategy already? y/[N]: ").lower() == "y":
-        vault = Vault.at(get_address("Deployed Vault: "))
+        vault = vault_container().at(get_address("Deployed Vault: "))
         assert vault.apiVersion() == API_VERSION
     else:
         print("You should deploy one vault using scripts from Vault project")
@@ -56,3 +80,322 @@ def main():
         return
 
     strategy = Strategy.deploy(vault, {"from": dev}, publish_source=publish_source)
+
+
+# Manifest mode: a declarative, prompt-free deployment.
+#
+#   brownie run deploy deploy_from_manifest manifests/development.yml --network development
+#
+# The manifest (YAML or JSON) lists the network, the LPStaking contract and one entry per
+# strategy. Every address is resolved and checked before the first transaction is sent, and
+# the result is written to deployments/<network>.json. See manifests/development.yml.
+
+CONTRACT_FIELDS = ("lp_staker", "factory", "trade_factory", "health_check")
+ACCOUNT_FIELDS = ("strategist", "keeper", "rewards")
+
+
+def load_manifest(path):
+    # JSON is valid YAML, so one loader reads both manifest formats
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def resolve_address(value):
+    """Return the checksummed address for an address or ENS name, None if it does not resolve."""
+    if not isinstance(value, str):
+        return None
+    if is_checksum_address(value):
+        return value
+    try:
+        return web3.ens.address(value)
+    except Exception:
+        return None
+
+
+def batched(calls):
+    """Evaluate zero-argument contract calls in one multicall. Calls that revert return None."""
+    with multicall:
+        results = [call() for call in calls]
+    return [getattr(result, "__wrapped__", result) for result in results]
+
+
+def manifest_deployer(manifest):
+    deployer = manifest.get("deployer", 0)
+    if network.show_active() == "development":
+        return accounts[int(deployer)]
+    return accounts.load(deployer, password=os.environ.get("DEPLOYER_PASSWORD"))
+
+
+def check_manifest_errors(errors):
+    if errors:
+        raise ValueError("Invalid deploy manifest:\n  - " + "\n  - ".join(errors))
+
+
+def plan_manifest(manifest, deployer, stack=None):
+    """
+    Resolve and validate everything `manifest` refers to in one batched pass. Returns the
+    deployment plan, or raises ValueError listing every problem found.
+    """
+    errors = []
+    active = network.show_active()
+    if manifest.get("network", active) != active:
+        errors.append(
+            f"network: manifest is for '{manifest['network']}', active network is '{active}'"
+        )
+
+    def resolve(name, value, contract=True):
+        # on a mock stack, wants can be given by symbol
+        if stack is not None and value in stack.tokens:
+            return stack.tokens[value].address
+        address = resolve_address(value)
+        if address is None:
+            errors.append(f"{name}: '{value}' is not a checksummed address or ENS name")
+        elif contract and len(web3.eth.get_code(address)) == 0:
+            errors.append(f"{name}: no contract at {address}")
+            return None
+        return address
+
+    plan = {
+        "emission_token_is_stg": bool(manifest.get("emission_token_is_stg", True)),
+        "strategies": [],
+    }
+    for name in CONTRACT_FIELDS + ACCOUNT_FIELDS:
+        value = manifest.get(name)
+        if name == "lp_staker" and value is None and stack is not None:
+            value = stack.lp_staker.address
+        plan[name] = (
+            None if value is None else resolve(name, value, name in CONTRACT_FIELDS)
+        )
+    for name in ACCOUNT_FIELDS:
+        plan[name] = plan[name] or deployer.address
+    if manifest.get("lp_staker") is None and stack is None:
+        errors.append("lp_staker: missing")
+
+    entries = manifest.get("strategies") or []
+    if not entries:
+        errors.append("strategies: nothing to deploy")
+    for i, entry in enumerate(entries):
+        if entry.get("vault") is None and entry.get("want") is None:
+            errors.append(f"strategies[{i}]: needs a vault or a want")
+        plan["strategies"].append(
+            {
+                "vault": None
+                if entry.get("vault") is None
+                else resolve(f"strategies[{i}].vault", entry["vault"]),
+                "want": None
+                if entry.get("want") is None
+                else resolve(f"strategies[{i}].want", entry["want"]),
+                "pool_id": entry.get("pool_id"),
+                "name": entry.get("name"),
+                "debt_ratio": entry.get("debt_ratio"),
+            }
+        )
+    check_manifest_errors(errors)
+
+    lp_staker = interface.ILPStaking(plan["lp_staker"])
+    strategies = plan["strategies"]
+    vaults = [
+        Contract.from_abi("Vault", entry["vault"], VAULT_ABI)
+        for entry in strategies
+        if entry["vault"] is not None
+    ]
+
+    # round 1: vault config and the number of LPStaking pools
+    results = batched(
+        [lp_staker.poolLength]
+        + [
+            call
+            for vault in vaults
+            for call in (vault.token, vault.apiVersion, vault.governance)
+        ]
+    )
+    pool_length, vault_info = results[0], iter(zip(*[iter(results[1:])] * 3))
+    for i, entry in enumerate(strategies):
+        if entry["vault"] is None:
+            if active != "development":
+                errors.append(
+                    f"strategies[{i}]: vaults are only created on development, "
+                    "deploy it through the registry first"
+                )
+            entry["governance"] = deployer.address
+            continue
+        token, api_version, governance = next(vault_info)
+        if api_version != API_VERSION:
+            errors.append(
+                f"strategies[{i}].vault: api {api_version}, strategy targets {API_VERSION}"
+            )
+        if entry["want"] is not None and entry["want"] != token:
+            errors.append(
+                f"strategies[{i}]: want {entry['want']} but vault holds {token}"
+            )
+        entry["want"] = token
+        entry["governance"] = governance
+    if pool_length is None:
+        errors.append(f"lp_staker: {lp_staker.address} is not an LPStaking contract")
+        pool_length = 0
+    check_manifest_errors(errors)
+
+    # round 2: LP token of every LPStaking pool
+    pools = batched(
+        [lambda pid=pid: lp_staker.poolInfo(pid) for pid in range(pool_length)]
+    )
+    pools = [interface.IPool(info[0]) for info in pools]
+
+    # round 3: underlying of every pool and the symbol of every want
+    wants = [interface.IERC20Metadata(entry["want"]) for entry in strategies]
+    results = batched([pool.token for pool in pools] + [want.symbol for want in wants])
+    pool_tokens, want_symbols = results[: len(pools)], results[len(pools) :]
+
+    # round 4: pool underlying symbols, to pair WETH wants with the SGETH pool
+    pool_symbols = batched(
+        [interface.IERC20Metadata(token).symbol for token in pool_tokens]
+    )
+
+    def matches(pid, want, symbol):
+        if pool_tokens[pid] == want:
+            return True
+        return symbol == "WETH" and pool_symbols[pid] == "SGETH"
+
+    for i, (entry, symbol) in enumerate(zip(strategies, want_symbols)):
+        candidates = [
+            pid for pid in range(pool_length) if matches(pid, entry["want"], symbol)
+        ]
+        if entry["pool_id"] is None:
+            if not candidates:
+                errors.append(f"strategies[{i}]: no LPStaking pool for {symbol}")
+                continue
+            entry["pool_id"] = candidates[0]
+        elif entry["pool_id"] not in candidates:
+            errors.append(
+                f"strategies[{i}].pool_id: LPStaking pool {entry['pool_id']} is not a {symbol} pool"
+            )
+            continue
+        entry["want_is_weth"] = pool_tokens[entry["pool_id"]] != entry["want"]
+        entry["name"] = entry["name"] or f"StrategyStargate{symbol}"
+
+    check_manifest_errors(errors)
+    return plan
+
+
+def governance_action(deployer, governance, contract, method, args):
+    """Execute `method` if the deployer governs `contract`, otherwise record it for governance."""
+    action = {
+        "target": contract.address,
+        "method": method,
+        "args": [str(arg) for arg in args],
+        "tx": None,
+    }
+    if governance == deployer.address:
+        action["tx"] = getattr(contract, method)(*args, {"from": deployer}).txid
+    return action
+
+
+def deploy_from_manifest(manifest_path, record_path=None):
+    manifest = load_manifest(manifest_path)
+    deployer = manifest_deployer(manifest)
+    print(f"You are using the '{network.show_active()}' network as {deployer.address}")
+
+    stack = None
+    if manifest.get("mock_stack"):
+        if network.show_active() != "development":
+            raise ValueError("mock_stack is only available on the development network")
+        stack = deploy_stargate_stack(deployer)
+
+    plan = plan_manifest(manifest, deployer, stack)
+
+    Vault = vault_container()
+    for entry in plan["strategies"]:
+        if entry["vault"] is None:
+            vault = Vault.deploy({"from": deployer})
+            vault.initialize(
+                entry["want"],
+                deployer,
+                plan["rewards"],
+                "",
+                "",
+                deployer,
+                deployer,
+                {"from": deployer},
+            )
+            vault.setDepositLimit(2 ** 256 - 1, {"from": deployer})
+            entry["vault"] = vault.address
+
+    strategies, factory = deploy_params(
+        deployer,
+        [
+            (
+                entry["vault"],
+                plan["strategist"],
+                plan["rewards"],
+                plan["keeper"],
+                plan["lp_staker"],
+                entry["pool_id"],
+                entry["want_is_weth"],
+                plan["emission_token_is_stg"],
+                entry["name"],
+                clone_salt(entry["vault"]),
+            )
+            for entry in plan["strategies"]
+        ],
+        plan["factory"],
+    )
+
+    actions = []
+    for entry, strategy in zip(plan["strategies"], strategies):
+        entry["strategy"] = strategy.address
+        governance = entry.pop("governance")
+        if plan["health_check"] is not None:
+            actions.append(
+                governance_action(
+                    deployer,
+                    governance,
+                    strategy,
+                    "setHealthCheck",
+                    [plan["health_check"]],
+                )
+            )
+        if plan["trade_factory"] is not None:
+            actions.append(
+                governance_action(
+                    deployer,
+                    governance,
+                    strategy,
+                    "setTradeFactory",
+                    [plan["trade_factory"]],
+                )
+            )
+        if entry["debt_ratio"] is not None:
+            actions.append(
+                governance_action(
+                    deployer,
+                    governance,
+                    Vault.at(entry["vault"]),
+                    "addStrategy",
+                    [strategy, entry["debt_ratio"], 0, 2 ** 256 - 1, 1_000],
+                )
+            )
+
+    record = {
+        "network": network.show_active(),
+        "chain_id": chain.id,
+        "block": chain.height,
+        "timestamp": int(time.time()),
+        "manifest": str(manifest_path),
+        "deployer": deployer.address,
+        "lp_staker": plan["lp_staker"],
+        "factory": factory.address,
+        "original": factory.original(),
+        "strategies": plan["strategies"],
+        "governance_actions": actions,
+    }
+    record_path = Path(record_path or DEPLOYMENTS_DIR / f"{network.show_active()}.json")
+    record_path.parent.mkdir(parents=True, exist_ok=True)
+    record_path.write_text(json.dumps(record, indent=2) + "\n")
+
+    for entry in plan["strategies"]:
+        print(f"{entry['name']}: {entry['strategy']} (vault {entry['vault']})")
+    pending = [action for action in actions if action["tx"] is None]
+    if pending:
+        print(f"{len(pending)} governance actions left to queue, see {record_path}")
+    print(f"Deployment record written to {record_path}")
+    return record
@@ -0,0 +1,186 @@
+import os
+
+from brownie import Contract, Strategy, StrategyFactory, accounts, interface, network
+
+# Non-interactive bring-up of a chain: walks LPStaking, matches every vault to its pool and
+# deploys one strategy per vault. The first vault gets the original Strategy (and a factory
+# is deployed on top of it), all the others are cloned in a single cloneMany transaction.
+#
+#   DEPLOYER=<brownie account id> LP_STAKER=0x... VAULTS=0x...,0x... \
+#       brownie run deploy_all --network mainnet
+#
+# Optional: FACTORY (reuse a deployed StrategyFactory), STRATEGIST, KEEPER, REWARDS
+# (default to the deployer), EMISSION_TOKEN_IS_STG=0 for the OP-emitting LPStaking on Optimism.
+
+VAULT_ABI = [
+    {
+        "inputs": [],
+        "name": name,
+        "outputs": [{"name": "", "type": output}],
+        "stateMutability": "view",
+        "type": "function",
+    }
+    for name, output in (
+        ("token", "address"),
+        ("apiVersion", "string"),
+        ("governance", "address"),
+    )
+]
+
+
+def lp_staking_pools(lp_staker):
+    """Return {LPStaking pool id: Stargate pool} for every pool registered in `lp_staker`."""
+    lp_staker = interface.ILPStaking(lp_staker)
+    return {
+        pid: interface.IPool(lp_staker.poolInfo(pid)[0])
+        for pid in range(lp_staker.poolLength())
+    }
+
+
+def match_pool(pools, want):
+    """
+    Find the LPStaking pool id for `want`. WETH vaults deposit into the SGETH pool, so a pool
+    whose token is SGETH matches a WETH want and the strategy is flagged `wantIsWETH`.
+    """
+    want = interface.IERC20Metadata(want)
+    for pid, pool in pools.items():
+        if pool.token() == want.address:
+            return pid, False
+    if want.symbol() == "WETH":
+        for pid, pool in pools.items():
+            if interface.IERC20Metadata(pool.token()).symbol() == "SGETH":
+                return pid, True
+    raise ValueError(f"No LPStaking pool for {want.symbol()} ({want.address})")
+
+
+def clone_salt(vault):
+    # one strategy per vault, so the vault address is a natural salt
+    return "0x" + vault[2:].lower().rjust(64, "0")
+
+
+def clone_params(
+    vault,
+    pools,
+    lp_staker,
+    strategist,
+    rewards,
+    keeper,
+    emission_token_is_stg=True,
+):
+    vault = Contract.from_abi("Vault", vault, VAULT_ABI)
+    want = interface.IERC20Metadata(vault.token())
+    pid, want_is_weth = match_pool(pools, want)
+    return (
+        vault.address,
+        strategist,
+        rewards,
+        keeper,
+        lp_staker,
+        pid,
+        want_is_weth,
+        emission_token_is_stg,
+        f"StrategyStargate{want.symbol()}",
+        clone_salt(vault.address),
+    )
+
+
+def deploy_all(
+    deployer,
+    vaults,
+    lp_staker,
+    emission_token_is_stg=True,
+    factory=None,
+    strategist=None,
+    rewards=None,
+    keeper=None,
+):
+    """
+    Deploy and initialize a Strategy for every vault in `vaults`. Returns the strategies in
+    the order of `vaults` and the factory that cloned them.
+    """
+    strategist = strategist or deployer
+    rewards = rewards or deployer
+    keeper = keeper or deployer
+
+    pools = lp_staking_pools(lp_staker)
+    params = [
+        clone_params(
+            vault,
+            pools,
+            lp_staker,
+            strategist,
+            rewards,
+            keeper,
+            emission_token_is_stg,
+        )
+        for vault in vaults
+    ]
+    return deploy_params(deployer, params, factory)
+
+
+def deploy_params(deployer, params, factory=None):
+    """
+    Deploy a strategy for every `StrategyFactory.CloneParams` tuple in `params`. Without a
+    `factory` the first entry becomes the original Strategy and a factory is deployed for it.
+    """
+    params = list(params)
+    tx_params = {"from": deployer}
+    strategies = []
+    if factory is None:
+        (
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            lp_staker,
+            pid,
+            want_is_weth,
+            emission_token_is_stg,
+            name,
+            _,
+        ) = params.pop(0)
+        original = Strategy.deploy(
+            vault, lp_staker, pid, want_is_weth, emission_token_is_stg, name, tx_params
+        )
+        # setRewards is strategist-only and setKeeper needs the strategist or governance, so
+        # the deployer hands over the strategist role last
+        if keeper != deployer:
+            original.setKeeper(keeper, tx_params)
+        if rewards != deployer:
+            original.setRewards(rewards, tx_params)
+        if strategist != deployer:
+            original.setStrategist(strategist, tx_params)
+        factory = StrategyFactory.deploy(original, tx_params)
+        strategies.append(original)
+    else:
+        factory = StrategyFactory.at(factory)
+
+    if params:
+        tx = factory.cloneMany(params, tx_params)
+        strategies += [Strategy.at(event["clone"]) for event in tx.events["Cloned"]]
+
+    return strategies, factory
+
+
+def main():
+    print(f"You are using the '{network.show_active()}' network")
+    if network.show_active() == "development":
+        deployer = accounts[0]
+    else:
+        deployer = accounts.load(
+            os.environ["DEPLOYER"], password=os.environ.get("DEPLOYER_PASSWORD")
+        )
+
+    strategies, factory = deploy_all(
+        deployer,
+        os.environ["VAULTS"].split(","),
+        os.environ["LP_STAKER"],
+        emission_token_is_stg=os.environ.get("EMISSION_TOKEN_IS_STG", "1") != "0",
+        factory=os.environ.get("FACTORY"),
+        strategist=os.environ.get("STRATEGIST"),
+        rewards=os.environ.get("REWARDS"),
+        keeper=os.environ.get("KEEPER"),
+    )
+    print(f"StrategyFactory: {factory.address}")
+    for strategy in strategies:
+        print(f"{strategy.name()}: {strategy.address} (vault {strategy.vault()})")
@@ -0,0 +1,427 @@
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import eth_event
+from brownie import chain, network, web3
+from eth_utils import to_checksum_address, to_hex
+from web3.exceptions import Web3Exception
+
+# Incremental log indexer for the strategies of a deployment. Block range by block range it
+# fetches the factories' Cloned, the strategies' Harvested, their vaults' StrategyReported and
+# their LPStaking Deposit/Withdraw/EmergencyWithdraw events into
+# .event_index/<network>.sqlite. The last indexed block is checkpointed with every batch, so a
+# run resumes where the previous one stopped and dashboards query the local tables.
+#
+#   brownie run event_indexer --network mainnet
+#
+# Factories and strategies come from deployments/<network>.json (see scripts/deploy.py) unless
+# FACTORIES / STRATEGIES list them; clones of a factory are picked up from its Cloned events.
+# FROM_BLOCK (default: the deployment's block) only applies to a new index. BATCH_SIZE blocks
+# per getLogs, CONFIRMATIONS blocks are left behind the head, POLL_INTERVAL (seconds) keeps
+# following the chain when set. With HARVEST_STATE=1 every harvest also records the strategy's
+# LP balance and the pool's LP price at its block (for scripts/harvest_analytics.py), which
+# needs an archive node to backfill old blocks.
+
+INDEX_DIR = Path(__file__).parent.parent / ".event_index"
+DEPLOYMENTS_DIR = Path(__file__).parent.parent / "deployments"
+
+
+def _event(name, *inputs):
+    return {
+        "anonymous": False,
+        "name": name,
+        "type": "event",
+        "inputs": [
+            {"name": arg, "type": kind, "indexed": indexed}
+            for arg, kind, indexed in inputs
+        ],
+    }
+
+
+EVENT_ABI = [
+    _event("Cloned", ("clone", "address", True)),
+    _event(
+        "Harvested",
+        ("profit", "uint256", False),
+        ("loss", "uint256", False),
+        ("debtPayment", "uint256", False),
+        ("debtOutstanding", "uint256", False),
+    ),
+    _event(
+        "StrategyReported",
+        ("strategy", "address", True),
+        ("gain", "uint256", False),
+        ("loss", "uint256", False),
+        ("debtPaid", "uint256", False),
+        ("totalGain", "uint256", False),
+        ("totalLoss", "uint256", False),
+        ("totalDebt", "uint256", False),
+        ("debtAdded", "uint256", False),
+        ("debtRatio", "uint256", False),
+    ),
+    *[
+        _event(
+            name,
+            ("user", "address", True),
+            ("pid", "uint256", True),
+            ("amount", "uint256", False),
+        )
+        for name in ("Deposit", "Withdraw", "EmergencyWithdraw")
+    ],
+]
+TOPIC_MAP = eth_event.get_topic_map(EVENT_ABI)
+TOPICS = {event["name"]: topic for topic, event in TOPIC_MAP.items()}
+LP_STAKING_EVENTS = ("Deposit", "Withdraw", "EmergencyWithdraw")
+
+# event -> (table, column of the emitting contract, event argument -> column)
+TABLES = {
+    "Cloned": ("clones", "factory", {"clone": "clone"}),
+    "Harvested": (
+        "harvests",
+        "strategy",
+        {
+            "profit": "profit",
+            "loss": "loss",
+            "debtPayment": "debt_payment",
+            "debtOutstanding": "debt_outstanding",
+        },
+    ),
+    "StrategyReported": (
+        "reports",
+        "vault",
+        {
+            "strategy": "strategy",
+            "gain": "gain",
+            "loss": "loss",
+            "debtPaid": "debt_paid",
+            "totalGain": "total_gain",
+            "totalLoss": "total_loss",
+            "totalDebt": "total_debt",
+            "debtAdded": "debt_added",
+            "debtRatio": "debt_ratio",
+        },
+    ),
+    **{
+        name: (
+            "lp_staking",
+            "lp_staker",
+            {"event": "event", "user": "strategy", "pid": "pid", "amount": "amount"},
+        )
+        for name in LP_STAKING_EVENTS
+    },
+}
+
+# uint256 values don't fit sqlite's 64-bit INTEGER, they are stored as decimal strings.
+# harvest_state.lp_rate is the want value of LP_RATE_UNIT LP tokens.
+LP_RATE_UNIT = 10 ** 18
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoint (id INTEGER PRIMARY KEY CHECK (id = 0), block INTEGER);
+CREATE TABLE IF NOT EXISTS strategies (
+    address TEXT PRIMARY KEY, vault TEXT, lp_staker TEXT, factory TEXT, block INTEGER
+);
+CREATE TABLE IF NOT EXISTS blocks (number INTEGER PRIMARY KEY, timestamp INTEGER);
+CREATE TABLE IF NOT EXISTS clones (
+    block INTEGER, tx_hash TEXT, log_index INTEGER, factory TEXT, clone TEXT,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE TABLE IF NOT EXISTS harvests (
+    block INTEGER, tx_hash TEXT, log_index INTEGER, strategy TEXT,
+    profit TEXT, loss TEXT, debt_payment TEXT, debt_outstanding TEXT,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE TABLE IF NOT EXISTS reports (
+    block INTEGER, tx_hash TEXT, log_index INTEGER, vault TEXT, strategy TEXT,
+    gain TEXT, loss TEXT, debt_paid TEXT, total_gain TEXT, total_loss TEXT,
+    total_debt TEXT, debt_added TEXT, debt_ratio TEXT,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE TABLE IF NOT EXISTS lp_staking (
+    block INTEGER, tx_hash TEXT, log_index INTEGER, lp_staker TEXT, event TEXT,
+    strategy TEXT, pid INTEGER, amount TEXT,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE TABLE IF NOT EXISTS harvest_state (
+    block INTEGER, tx_hash TEXT, log_index INTEGER, strategy TEXT, lp_balance TEXT, lp_rate TEXT,
+    PRIMARY KEY (tx_hash, log_index)
+);
+CREATE INDEX IF NOT EXISTS harvests_strategy ON harvests (strategy, block);
+CREATE INDEX IF NOT EXISTS reports_strategy ON reports (strategy, block);
+CREATE INDEX IF NOT EXISTS lp_staking_strategy ON lp_staking (strategy, block);
+"""
+
+
+def _topic(address):
+    # an indexed address as it appears in a log's topics
+    return "0x" + address[2:].lower().rjust(64, "0")
+
+
+class EventStore:
+    """The sqlite side of the indexer: indexed rows, tracked strategies and the checkpoint."""
+
+    def __init__(self, path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.row_factory = sqlite3.Row
+        self.db.executescript(SCHEMA)
+
+    @property
+    def checkpoint(self):
+        """The last block whose events are all in the store, None for a new store."""
+        row = self.db.execute("SELECT block FROM checkpoint WHERE id = 0").fetchone()
+        return None if row is None else row["block"]
+
+    def strategies(self):
+        return {
+            row["address"]: row
+            for row in self.db.execute("SELECT * FROM strategies ORDER BY address")
+        }
+
+    def add_strategy(self, address, vault, lp_staker, factory=None, block=None):
+        self.db.execute(
+            "INSERT OR IGNORE INTO strategies VALUES (?, ?, ?, ?, ?)",
+            (address, vault, lp_staker, factory, block),
+        )
+
+    def add_rows(self, table, rows):
+        if not rows:
+            return
+        columns = list(rows[0])
+        self.db.executemany(
+            f"INSERT OR IGNORE INTO {table} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})",
+            [tuple(row[column] for column in columns) for row in rows],
+        )
+
+    def add_timestamps(self, timestamps):
+        self.db.executemany(
+            "INSERT OR IGNORE INTO blocks VALUES (?, ?)", timestamps.items()
+        )
+
+    def set_checkpoint(self, block):
+        self.db.execute("INSERT OR REPLACE INTO checkpoint VALUES (0, ?)", (block,))
+
+    def rows(self, table, strategy=None):
+        """Rows of `table` in chain order, optionally only those of `strategy`."""
+        where, params = ("WHERE strategy = ?", (strategy,)) if strategy else ("", ())
+        return [
+            dict(row)
+            for row in self.db.execute(
+                f"SELECT * FROM {table} {where} ORDER BY block, log_index", params
+            )
+        ]
+
+    def close(self):
+        self.db.close()
+
+
+class EventIndexer:
+    def __init__(
+        self,
+        store,
+        factories=(),
+        strategies=(),
+        from_block=0,
+        batch_size=2_000,
+        confirmations=0,
+        harvest_state=False,
+    ):
+        self.store = store if isinstance(store, EventStore) else EventStore(store)
+        self.factories = [to_checksum_address(str(factory)) for factory in factories]
+        self.from_block = from_block
+        self.batch_size = batch_size
+        self.confirmations = confirmations
+        self.harvest_state = harvest_state
+        self._pools = {}
+        with self.store.db:
+            for strategy in strategies:
+                self._track(to_checksum_address(str(strategy)))
+
+    def _track(self, strategy, factory=None, block=None):
+        # project contracts and interfaces only exist once brownie has loaded the project,
+        # importing them here keeps SCHEMA and the store importable without one
+        from brownie import Strategy
+
+        if strategy not in self.store.strategies():
+            contract = Strategy.at(strategy)
+            self.store.add_strategy(
+                strategy,
+                contract.vault(),
+                contract.lpStaker(),
+                factory,
+                block,
+            )
+
+    def _get_logs(self, addresses, topics, start, end):
+        if not addresses:
+            return []
+        return web3.eth.get_logs(
+            {
+                "address": sorted(set(addresses)),
+                "topics": topics,
+                "fromBlock": start,
+                "toBlock": end,
+            }
+        )
+
+    def _rows(self, logs):
+        rows = {}
+        for log in logs:
+            event = eth_event.decode_log(log, TOPIC_MAP)
+            table, source, columns = TABLES[event["name"]]
+            args = {"event": event["name"]}
+            for arg in event["data"]:
+                value = arg["value"]
+                if arg["type"] == "address":
+                    value = to_checksum_address(value)
+                elif isinstance(value, int):
+                    value = str(value)
+                args[arg["name"]] = value
+            row = {
+                "block": log["blockNumber"],
+                "tx_hash": to_hex(log["transactionHash"]),
+                "log_index": log["logIndex"],
+                source: to_checksum_address(log["address"]),
+            }
+            for arg, column in columns.items():
+                row[column] = args[arg]
+            rows.setdefault(table, []).append(row)
+        return rows
+
+    def _harvest_state(self, harvests):
+        # LP held by the strategy and the pool's LP price right after each harvest
+        from brownie import Strategy, interface
+
+        rows = []
+        for harvest in harvests:
+            strategy = Strategy.at(harvest["strategy"])
+            if strategy.address not in self._pools:
+                self._pools[strategy.address] = interface.IPool(
+                    strategy.liquidityPool()
+                )
+            block = harvest["block"]
+            rows.append(
+                {
+                    "block": block,
+                    "tx_hash": harvest["tx_hash"],
+                    "log_index": harvest["log_index"],
+                    "strategy": strategy.address,
+                    "lp_balance": str(
+                        strategy.balanceOfAllLPToken(block_identifier=block)
+                    ),
+                    "lp_rate": str(
+                        self._pools[strategy.address].amountLPtoLD(
+                            LP_RATE_UNIT, block_identifier=block
+                        )
+                    ),
+                }
+            )
+        return rows
+
+    def _index_range(self, start, end):
+        # clones first, their events of the same range are fetched with the others
+        cloned = self._get_logs(self.factories, [TOPICS["Cloned"]], start, end)
+        for log in cloned:
+            clone = eth_event.decode_log(log, TOPIC_MAP)["data"][0]["value"]
+            self._track(
+                to_checksum_address(clone),
+                to_checksum_address(log["address"]),
+                log["blockNumber"],
+            )
+
+        strategies = self.store.strategies()
+        strategy_topics = [_topic(address) for address in strategies]
+        logs = cloned
+        if strategies:
+            logs = logs + self._get_logs(
+                list(strategies), [TOPICS["Harvested"]], start, end
+            )
+            logs = logs + self._get_logs(
+                [row["vault"] for row in strategies.values()],
+                [TOPICS["StrategyReported"], strategy_topics],
+                start,
+                end,
+            )
+            logs = logs + self._get_logs(
+                [row["lp_staker"] for row in strategies.values()],
+                [[TOPICS[name] for name in LP_STAKING_EVENTS], strategy_topics],
+                start,
+                end,
+            )
+
+        tables = self._rows(logs)
+        if self.harvest_state:
+            tables["harvest_state"] = self._harvest_state(tables.get("harvests", []))
+        for table, rows in tables.items():
+            self.store.add_rows(table, rows)
+        self.store.add_timestamps(
+            {
+                block: web3.eth.get_block(block)["timestamp"]
+                for block in {log["blockNumber"] for log in logs}
+            }
+        )
+        return len(logs)
+
+    def sync(self, to_block=None):
+        """
+        Index every block after the checkpoint up to `to_block` (default: the head minus
+        `confirmations`), one `batch_size` range per transaction. Returns the number of events.
+        """
+        to_block = chain.height - self.confirmations if to_block is None else to_block
+        checkpoint = self.store.checkpoint
+        start = self.from_block if checkpoint is None else checkpoint + 1
+        batch_size = self.batch_size
+        indexed = 0
+        while start <= to_block:
+            end = min(start + batch_size - 1, to_block)
+            try:
+                # events and checkpoint of a range are committed together, or not at all
+                with self.store.db:
+                    indexed += self._index_range(start, end)
+                    self.store.set_checkpoint(end)
+            except (ValueError, Web3Exception):
+                # nodes cap the logs per request, retry with smaller ranges
+                if end == start:
+                    raise
+                batch_size = max(1, (end - start + 1) // 2)
+                continue
+            start = end + 1
+        return indexed
+
+    def follow(self, poll_interval=5):
+        while True:
+            indexed = self.sync()
+            if indexed:
+                print(f"{indexed} events indexed up to block {self.store.checkpoint}")
+            time.sleep(poll_interval)
+
+
+def main():
+    print(f"You are using the '{network.show_active()}' network")
+    record_path = DEPLOYMENTS_DIR / f"{network.show_active()}.json"
+    record = json.loads(record_path.read_text()) if record_path.exists() else {}
+
+    if os.environ.get("FACTORIES"):
+        factories = os.environ["FACTORIES"].split(",")
+    else:
+        factories = [record["factory"]] if "factory" in record else []
+    if os.environ.get("STRATEGIES"):
+        strategies = os.environ["STRATEGIES"].split(",")
+    else:
+        strategies = [entry["strategy"] for entry in record.get("strategies", [])]
+
+    indexer = EventIndexer(
+        INDEX_DIR / f"{network.show_active()}.sqlite",
+        factories,
+        strategies,
+        from_block=int(os.environ.get("FROM_BLOCK", record.get("block", 0))),
+        batch_size=int(os.environ.get("BATCH_SIZE", 2_000)),
+        confirmations=int(os.environ.get("CONFIRMATIONS", 0)),
+        harvest_state=os.environ.get("HARVEST_STATE") == "1",
+    )
+    print(f"{indexer.sync()} events indexed up to block {indexer.store.checkpoint}")
+    if os.environ.get("POLL_INTERVAL"):
+        indexer.follow(float(os.environ["POLL_INTERVAL"]))
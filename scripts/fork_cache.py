@@ -0,0 +1,258 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# Caching JSON-RPC proxy for forked test runs pinned to one block. The fork node (ganache or
+# anvil) talks to this proxy instead of the archive node; every answer about the pinned block
+# is immutable, so it is kept in .fork_cache/<chain id>-<block>.sqlite and a second session
+# (and the three want-token runs within one) is served from disk, offline if need be.
+#
+#   FORK_UPSTREAM_URL=https://... python -m scripts.fork_cache --block 15500000
+#   brownie test tests/Fork --network eth-main-fork-pinned
+#
+# See the README for the one-time `brownie networks add` of eth-main-fork-pinned.
+
+CACHE_DIR = Path(__file__).parent.parent / ".fork_cache"
+
+# methods whose answer only depends on their params once the block is pinned
+CACHEABLE = {
+    "eth_chainId",
+    "net_version",
+    "eth_getBalance",
+    "eth_getCode",
+    "eth_getTransactionCount",
+    "eth_getStorageAt",
+    "eth_getProof",
+    "eth_call",
+    "eth_getBlockByNumber",
+    "eth_getBlockByHash",
+    "eth_getTransactionByHash",
+    "eth_getTransactionReceipt",
+}
+BLOCK_TAGS = ("latest", "pending", "safe", "finalized")
+
+
+class ForkCacheMiss(Exception):
+    pass
+
+
+class ForkCache:
+    """Persistent JSON-RPC answers for one pinned block, keyed by method and params."""
+
+    def __init__(self, path):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, result TEXT)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def key(method, params):
+        return json.dumps([method, params], sort_keys=True, separators=(",", ":"))
+
+    def get(self, method, params):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT result FROM responses WHERE key = ?",
+                (self.key(method, params),),
+            ).fetchone()
+        if row is None:
+            raise ForkCacheMiss(method)
+        return json.loads(row[0])
+
+    def put(self, method, params, result):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?)",
+                (self.key(method, params), json.dumps(result)),
+            )
+            self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class ForkCacheProxy:
+    """
+    Serve JSON-RPC on `host:port`, answering from the cache for `block` and forwarding misses to
+    `upstream` (unless `offline`). Block tags are pinned to `block` before anything is looked up.
+    """
+
+    def __init__(
+        self,
+        upstream,
+        block,
+        chain_id,
+        cache_dir=CACHE_DIR,
+        offline=False,
+        host="127.0.0.1",
+        port=8546,
+    ):
+        self.upstream = upstream
+        self.block = block
+        self.offline = offline
+        self.cache = ForkCache(Path(cache_dir) / f"{chain_id}-{block}.sqlite")
+        self.hits = 0
+        self.misses = 0
+        self._server = ThreadingHTTPServer((host, port), _handler(self))
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _pin(self, params):
+        return [
+            hex(self.block) if isinstance(param, str) and param in BLOCK_TAGS else param
+            for param in params
+        ]
+
+    def _forward(self, request):
+        if self.offline or self.upstream is None:
+            raise ForkCacheMiss(request["method"])
+        body = json.dumps(request).encode()
+        http_request = urllib.request.Request(
+            self.upstream, body, {"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(http_request, timeout=60) as response:
+            return json.loads(response.read())
+
+    def call(self, request):
+        """Answer one JSON-RPC request object."""
+        method = request.get("method")
+        params = self._pin(request.get("params") or [])
+        reply = {"jsonrpc": "2.0", "id": request.get("id")}
+        if method == "eth_blockNumber":
+            return {**reply, "result": hex(self.block)}
+
+        try:
+            if method in CACHEABLE:
+                try:
+                    result = self.cache.get(method, params)
+                    self.hits += 1
+                    return {**reply, "result": result}
+                except ForkCacheMiss:
+                    self.misses += 1
+            response = self._forward({**request, "params": params})
+        except ForkCacheMiss:
+            return {
+                **reply,
+                "error": {"code": -32000, "message": f"{method} not in fork cache"},
+            }
+
+        # errors and unknown blocks/transactions (null) might be answered later, don't keep them
+        if method in CACHEABLE and response.get("result") is not None:
+            self.cache.put(method, params, response["result"])
+        return {
+            **reply,
+            **{k: v for k, v in response.items() if k in ("result", "error")},
+        }
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self.cache.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+def _handler(proxy):
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            if isinstance(request, list):
+                reply = [proxy.call(item) for item in request]
+            else:
+                reply = proxy.call(request)
+            body = json.dumps(reply).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+def upstream_chain_id(upstream):
+    request = urllib.request.Request(
+        upstream,
+        json.dumps(
+            {"jsonrpc": "2.0", "id": 1, "method": "eth_chainId", "params": []}
+        ).encode(),
+        {"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request, timeout=60) as response:
+        return int(json.loads(response.read())["result"], 16)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--block", type=int, default=os.environ.get("FORK_BLOCK"))
+    parser.add_argument("--upstream", default=os.environ.get("FORK_UPSTREAM_URL"))
+    # offline runs can't ask the upstream for its chain id
+    parser.add_argument("--chain-id", type=int, default=None)
+    parser.add_argument("--offline", action="store_true")
+    parser.add_argument("--port", type=int, default=8546)
+    parser.add_argument("--cache-dir", default=CACHE_DIR)
+    args = parser.parse_args()
+    if args.block is None:
+        parser.error(
+            "--block (or FORK_BLOCK) is required, the cache is only valid for a pinned block"
+        )
+    if args.chain_id is None and (args.offline or args.upstream is None):
+        parser.error("--chain-id is required without an upstream")
+    chain_id = args.chain_id or upstream_chain_id(args.upstream)
+
+    proxy = ForkCacheProxy(
+        None if args.offline else args.upstream,
+        int(args.block),
+        chain_id,
+        cache_dir=args.cache_dir,
+        offline=args.offline,
+        port=args.port,
+    )
+    print(
+        f"Serving chain {chain_id} at block {args.block} on {proxy.url} "
+        f"({len(proxy.cache)} cached answers{', offline' if args.offline else ''})"
+    )
+    try:
+        proxy.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"{proxy.hits} answers from cache, {proxy.misses} fetched")
+        proxy.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import json
+import os
+from pathlib import Path
+
+# Baseline consumed by tests/Local/test_gas.py. Regenerate it on a dev chain with:
+#   UPDATE_GAS_BASELINE=1 brownie test tests/Local/test_gas.py --network development
+BASELINE_PATH = Path(__file__).parent.parent / "tests" / "Local" / "gas_baseline.json"
+# scripts/run_shards.py points every shard at its own directory
+REPORT_DIR = Path(
+    os.environ.get("GAS_REPORT_DIR", Path(__file__).parent.parent / "reports")
+)
+
+# Gas on a dev chain is deterministic for a fixed scenario, so the tolerance only needs to
+# absorb calldata noise. A cold SLOAD (2100) or a cold external call (2600) is well above it.
+GAS_TOLERANCE = int(os.environ.get("GAS_TOLERANCE", 500))
+
+
+class GasReport:
+    def __init__(self, baseline_path=BASELINE_PATH, tolerance=GAS_TOLERANCE):
+        self.baseline_path = Path(baseline_path)
+        self.tolerance = tolerance
+        self.baseline = {}
+        if self.baseline_path.exists():
+            self.baseline = json.loads(self.baseline_path.read_text())
+        self.results = {}
+
+    def record(self, scenario, gas_used):
+        self.results[scenario] = int(gas_used)
+        return self.delta(scenario)
+
+    def delta(self, scenario):
+        if scenario not in self.baseline:
+            return None
+        return self.results[scenario] - self.baseline[scenario]
+
+    def check(self, scenario):
+        delta = self.delta(scenario)
+        if delta is None:
+            raise AssertionError(
+                f"{scenario} has no baseline in {self.baseline_path}, record it with "
+                "UPDATE_GAS_BASELINE=1"
+            )
+        if delta > self.tolerance:
+            raise AssertionError(
+                f"{scenario} used {self.results[scenario]} gas, baseline is "
+                f"{self.baseline[scenario]} (+{delta} > {self.tolerance} tolerance)"
+            )
+
+    def regressions(self):
+        return {
+            scenario: self.delta(scenario)
+            for scenario in self.results
+            if self.delta(scenario) is not None
+            and self.delta(scenario) > self.tolerance
+        }
+
+    def to_markdown(self):
+        lines = [
+            "| Scenario | Gas used | Baseline | Delta |",
+            "| --- | ---: | ---: | ---: |",
+        ]
+        for scenario in sorted(self.results):
+            delta = self.delta(scenario)
+            baseline = self.baseline.get(scenario, "-")
+            delta = "new" if delta is None else f"{delta:+d}"
+            lines.append(
+                f"| {scenario} | {self.results[scenario]} | {baseline} | {delta} |"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write(self, report_dir=REPORT_DIR):
+        report_dir = Path(report_dir)
+        report_dir.mkdir(parents=True, exist_ok=True)
+        report = {
+            scenario: {
+                "gas": gas,
+                "baseline": self.baseline.get(scenario),
+                "delta": self.delta(scenario),
+            }
+            for scenario, gas in sorted(self.results.items())
+        }
+        (report_dir / "gas_benchmark.json").write_text(json.dumps(report, indent=2))
+        (report_dir / "gas_benchmark.md").write_text(self.to_markdown())
+
+    def save_baseline(self):
+        baseline = {**self.baseline, **self.results}
+        self.baseline_path.write_text(
+            json.dumps(dict(sorted(baseline.items())), indent=2) + "\n"
+        )
+
+
+def main():
+    report = GasReport()
+    if not report.baseline:
+        print(f"No gas baseline at {report.baseline_path}")
+        return
+    report_path = REPORT_DIR / "gas_benchmark.json"
+    if not report_path.exists():
+        print(f"No gas report at {report_path}, run tests/Local/test_gas.py first")
+        return
+    for scenario, row in json.loads(report_path.read_text()).items():
+        report.record(scenario, row["gas"])
+    print(report.to_markdown())
+    for scenario, delta in report.regressions().items():
+        print(f"REGRESSION {scenario}: +{delta} gas")
@@ -0,0 +1,106 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from scripts.gas_benchmark import GasReport
+
+# Gas of the tests/Local/test_gas.py scenarios at two revisions of the contracts, side by
+# side. Each revision is checked out into a temporary git worktree and benchmarked there on
+# its own dev chain, so the working tree and its baseline are left alone:
+#
+#   python -m scripts.gas_compare 4ff1a27^ 4ff1a27     # a commit against its parent
+#   python -m scripts.gas_compare main                 # main against HEAD
+#
+# Each revision runs its own gas suite, scenarios only the new one has show up as "new".
+# `--suite REV` runs the gas suite of REV at both revisions instead, to measure the scenarios
+# a commit added on its parent as well (the suite has to work with both revisions' fixtures):
+#
+#   python -m scripts.gas_compare 0443563^ 0443563 --suite 0443563
+#
+# Arguments after `--` are passed on to `brownie test`. The table is printed and written to
+# tests/Local/gas_compare/<base>..<new>.md, next to the gas baseline: commit it with the change
+# it measures so the saving can be checked.
+
+ROOT = Path(__file__).parent.parent
+REPORT_DIR = ROOT / "tests" / "Local" / "gas_compare"
+GAS_SUITE = "tests/Local/test_gas.py"
+
+
+def _git(*args):
+    return subprocess.run(
+        ["git", *args], cwd=ROOT, check=True, capture_output=True
+    ).stdout
+
+
+def short_rev(rev):
+    return _git("rev-parse", "--short", rev).decode().strip()
+
+
+def benchmark(rev, suite=None, extra_args=()):
+    """{scenario: gas used} of the gas suite run against the contracts at `rev`."""
+    with tempfile.TemporaryDirectory() as tmp:
+        worktree = Path(tmp) / "worktree"
+        _git("worktree", "add", "--detach", str(worktree), rev)
+        try:
+            if suite is not None:
+                (worktree / GAS_SUITE).write_bytes(_git("show", f"{suite}:{GAS_SUITE}"))
+            report_dir = worktree / "reports"
+            returncode = subprocess.run(
+                ["brownie", "test", GAS_SUITE, "--network", "development", *extra_args],
+                cwd=worktree,
+                # a fresh checkout has no baseline to check against, record one instead
+                env={
+                    **os.environ,
+                    "GAS_REPORT_DIR": str(report_dir),
+                    "UPDATE_GAS_BASELINE": "1",
+                },
+            ).returncode
+            report_path = report_dir / "gas_benchmark.json"
+            if not report_path.exists():
+                raise RuntimeError(f"the gas suite at {rev} wrote no report")
+            if returncode != 0:
+                print(f"Some gas scenarios failed at {rev}, see the output above")
+            report = json.loads(report_path.read_text())
+        finally:
+            _git("worktree", "remove", "--force", str(worktree))
+    return {scenario: row["gas"] for scenario, row in report.items()}
+
+
+def compare(base, new):
+    """GasReport of the `new` results with the `base` results as its baseline."""
+    report = GasReport()
+    report.baseline = dict(base)
+    for scenario, gas in new.items():
+        report.record(scenario, gas)
+    return report
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    extra_args = []
+    if "--" in argv:
+        extra_args = argv[argv.index("--") + 1 :]
+        argv = argv[: argv.index("--")]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("base")
+    parser.add_argument("new", nargs="?", default="HEAD")
+    parser.add_argument("--suite")
+    args = parser.parse_args(argv)
+
+    base, new = short_rev(args.base), short_rev(args.new)
+    report = compare(
+        benchmark(base, args.suite, extra_args),
+        benchmark(new, args.suite, extra_args),
+    )
+    table = f"Gas at {new} against {base}\n\n{report.to_markdown()}"
+    REPORT_DIR.mkdir(parents=True, exist_ok=True)
+    (REPORT_DIR / f"{base}..{new}.md").write_text(table)
+    print(table)
+
+
+if __name__ == "__main__":
+    main()
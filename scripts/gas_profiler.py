@@ -0,0 +1,210 @@
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+from scripts.gas_benchmark import REPORT_DIR
+
+# Gas of a transaction per call path, contract and function, from the call trace brownie
+# expands for it (`tx.trace`). tests/Local/test_gas.py writes one profile per scenario to
+# reports/gas_profile/ when run with GAS_PROFILE=1:
+#
+#   GAS_PROFILE=1 brownie test tests/Local/test_gas.py --network development
+#   python -m scripts.gas_profiler "reports/gas_profile/harvest_staked_rewards[USDC].json"
+#
+# Every profile also gets a .folded file, one `Strategy.harvest;Vault.report;... gas` line per
+# call path, that flamegraph.pl, inferno or speedscope render as a flamegraph. To compare two
+# builds of the strategy, profile the parent commit into another report directory and diff
+# the profiles call path by call path:
+#
+#   GAS_PROFILE=1 GAS_REPORT_DIR=reports/base brownie test tests/Local/test_gas.py --network development
+#   python -m scripts.gas_profiler reports/base/gas_profile/<scenario>.json reports/gas_profile/<scenario>.json
+#
+# The diff is also written as `path base new` lines, the input of `flamegraph.pl` for a
+# differential flamegraph.
+
+PROFILE_DIR = REPORT_DIR / "gas_profile"
+
+
+def _step_gas(trace):
+    """
+    Yields (index, gas) for every step of an expanded trace. The gas of a step is what it
+    took from the gas left in its frame; for a call that is the call's own cost (access,
+    value transfer, memory) without the gas used by the callee, which goes to the callee's
+    steps. The steps' gas sums to the execution gas of the transaction.
+    """
+    calls = []
+    for i, step in enumerate(trace):
+        following = trace[i + 1] if i + 1 < len(trace) else None
+        if following is None or following["depth"] < step["depth"]:
+            # last step of a frame, nothing follows it in the frame
+            yield i, step["gasCost"]
+        elif following["depth"] > step["depth"]:
+            # the call is settled once the callee returns, see below
+            calls.append(i)
+        else:
+            yield i, step["gas"] - following["gas"]
+
+        while (
+            calls
+            and following is not None
+            and following["depth"] <= trace[calls[-1]]["depth"]
+        ):
+            call = calls.pop()
+            callee_used = trace[call + 1]["gas"] - (step["gas"] - step["gasCost"])
+            yield call, trace[call]["gas"] - following["gas"] - callee_used
+
+
+def _call_paths(trace):
+    """
+    The call path of every step of an expanded trace, as a tuple of `Contract.function`
+    names from the transaction's entry point: external calls by depth, internal functions
+    by jump depth. Also returns how often each path was entered.
+    """
+    paths, entries = [], defaultdict(int)
+    frames = []
+    for step in trace:
+        key = (step["depth"], step["jumpDepth"])
+        while frames and frames[-1][0] > key:
+            frames.pop()
+        if not frames or frames[-1][0] != key:
+            frames.append((key, step["fn"]))
+            entries[tuple(fn for _, fn in frames)] += 1
+        paths.append(tuple(fn for _, fn in frames))
+    return paths, entries
+
+
+class GasProfile:
+    def __init__(self, stacks, calls=None, gas_used=None):
+        # ("Strategy.harvest", "Vault.report", ...) -> gas spent in the last function of the path
+        self.stacks = {tuple(path): int(gas) for path, gas in stacks.items()}
+        self.calls = {tuple(path): int(count) for path, count in (calls or {}).items()}
+        self.gas_used = gas_used
+
+    @classmethod
+    def from_tx(cls, tx):
+        trace = tx.trace
+        paths, entries = _call_paths(trace)
+        stacks = defaultdict(int)
+        for i, gas in _step_gas(trace):
+            stacks[paths[i]] += gas
+        return cls(stacks, entries, tx.gas_used)
+
+    @classmethod
+    def load(cls, path):
+        data = json.loads(Path(path).read_text())
+        return cls(
+            {tuple(row["path"].split(";")): row["gas"] for row in data["stacks"]},
+            {tuple(row["path"].split(";")): row["calls"] for row in data["stacks"]},
+            data["gas_used"],
+        )
+
+    @property
+    def execution_gas(self):
+        """Gas used by the calls, i.e. without the intrinsic gas and refunds of the tx."""
+        return sum(self.stacks.values())
+
+    def functions(self):
+        """Per `Contract.function`: gas spent in it, gas including what it called, calls."""
+        functions = defaultdict(lambda: {"self": 0, "total": 0, "calls": 0})
+        for path, gas in self.stacks.items():
+            functions[path[-1]]["self"] += gas
+            # a recursive function counts a path once
+            for fn in set(path):
+                functions[fn]["total"] += gas
+        for path, count in self.calls.items():
+            functions[path[-1]]["calls"] += count
+        return dict(functions)
+
+    def contracts(self):
+        """Gas spent in the code of each contract."""
+        contracts = defaultdict(int)
+        for path, gas in self.stacks.items():
+            contracts[path[-1].split(".")[0]] += gas
+        return dict(contracts)
+
+    def folded(self):
+        return "".join(
+            f"{';'.join(path)} {gas}\n"
+            for path, gas in sorted(self.stacks.items())
+            if gas
+        )
+
+    def diff(self, other):
+        """(path, gas here, gas in `other`) for every call path whose gas differs."""
+        return [
+            (path, self.stacks.get(path, 0), other.stacks.get(path, 0))
+            for path in sorted(set(self.stacks) | set(other.stacks))
+            if self.stacks.get(path, 0) != other.stacks.get(path, 0)
+        ]
+
+    def to_markdown(self):
+        lines = [
+            f"Gas used {self.gas_used}, execution {self.execution_gas}",
+            "",
+            "| Function | Calls | Self | Total |",
+            "| --- | ---: | ---: | ---: |",
+        ]
+        functions = self.functions()
+        for fn in sorted(functions, key=lambda fn: -functions[fn]["total"]):
+            row = functions[fn]
+            lines.append(f"| {fn} | {row['calls']} | {row['self']} | {row['total']} |")
+        lines += ["", "| Contract | Gas |", "| --- | ---: |"]
+        contracts = self.contracts()
+        for contract in sorted(contracts, key=lambda contract: -contracts[contract]):
+            lines.append(f"| {contract} | {contracts[contract]} |")
+        return "\n".join(lines) + "\n"
+
+    def write(self, name, profile_dir=PROFILE_DIR):
+        profile_dir = Path(profile_dir)
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            "gas_used": self.gas_used,
+            "stacks": [
+                {
+                    "path": ";".join(path),
+                    "gas": gas,
+                    "calls": self.calls.get(path, 0),
+                }
+                for path, gas in sorted(self.stacks.items())
+            ],
+        }
+        (profile_dir / f"{name}.json").write_text(json.dumps(data, indent=2))
+        (profile_dir / f"{name}.folded").write_text(self.folded())
+
+
+def diff_to_markdown(base, new):
+    lines = [
+        f"Gas used {base.gas_used} -> {new.gas_used} "
+        f"({new.gas_used - base.gas_used:+d})",
+        "",
+        "| Call path | Base | New | Delta |",
+        "| --- | ---: | ---: | ---: |",
+    ]
+    rows = base.diff(new)
+    for path, before, after in sorted(rows, key=lambda row: -abs(row[2] - row[1])):
+        lines.append(
+            f"| {' > '.join(path)} | {before} | {after} | {after - before:+d} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    paths = sys.argv[1:] if argv is None else argv
+    if len(paths) == 1:
+        print(GasProfile.load(paths[0]).to_markdown())
+        return
+    base, new = (GasProfile.load(path) for path in paths)
+    print(diff_to_markdown(base, new))
+    folded = Path(paths[1]).with_suffix(".diff.folded")
+    folded.write_text(
+        "".join(
+            f"{';'.join(path)} {before} {after}\n"
+            for path, before, after in base.diff(new)
+        )
+    )
+    print(f"Differential folded stacks written to {folded}")
+
+
+if __name__ == "__main__":
+    main()
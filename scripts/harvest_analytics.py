@@ -0,0 +1,141 @@
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Realized APR, fee vs emission split and drawdowns per strategy, from the event index of
+# scripts/event_indexer.py (run it with HARVEST_STATE=1 for the split). Every step is a
+# column operation over all harvests of all strategies and chains at once, grouped by
+# (chain, strategy); there is no loop over rows.
+#
+#   python -m scripts.harvest_analytics .event_index/mainnet.sqlite .event_index/optimism-main.sqlite
+#
+# A period runs from one report of a strategy to the next. Its P&L is the gain minus the loss
+# of the closing report, earned on the debt left by the opening one. The fee yield is the
+# growth of the LP price (amountLPtoLD) on the LP held at the opening report; the rest of the
+# P&L is the emission yield, i.e. what the rewards were sold for.
+
+YEAR = 365 * 24 * 60 * 60
+# harvest_state.lp_rate is the want value of this many LP tokens, see scripts/event_indexer.py
+LP_RATE_UNIT = 10 ** 18
+AMOUNTS = ["gain", "loss", "total_debt", "lp_balance", "lp_rate"]
+KEYS = ["chain", "strategy"]
+
+HISTORY_QUERY = """
+SELECT reports.strategy, blocks.timestamp, reports.block, reports.gain, reports.loss,
+    reports.total_debt, harvest_state.lp_balance, harvest_state.lp_rate
+FROM reports
+JOIN blocks ON blocks.number = reports.block
+LEFT JOIN harvest_state
+    ON harvest_state.tx_hash = reports.tx_hash AND harvest_state.strategy = reports.strategy
+ORDER BY reports.block, reports.log_index
+"""
+
+
+def load_history(path, chain=None):
+    """One row per report of an event index, `chain` defaults to the index's file name."""
+    with sqlite3.connect(path) as db:
+        history = pd.read_sql_query(HISTORY_QUERY, db)
+    # amounts are decimal strings in the index, floats are precise enough for rates
+    history[AMOUNTS] = history[AMOUNTS].astype(float)
+    history.insert(0, "chain", chain or Path(path).stem)
+    return history
+
+
+def harvest_periods(history):
+    """
+    One row per period between two consecutive reports of a strategy, with its P&L, fee and
+    emission yield, annualized return and the strategy's drawdown at its end. Fee and emission
+    yield are NaN for periods without harvest state.
+    """
+    # one integer id per (chain, strategy), every later groupby runs on it instead of the strings
+    group = history.groupby(KEYS, sort=False).ngroup()
+    order = np.lexsort((history["timestamp"].to_numpy(), group.to_numpy()))
+    history = history.iloc[order]
+    group = group.iloc[order]
+    opening = (
+        history[["timestamp", "total_debt", "lp_balance", "lp_rate"]]
+        .groupby(group, sort=False)
+        .shift()
+    )
+    periods = history.assign(
+        years=(history["timestamp"] - opening["timestamp"]) / YEAR,
+        debt=opening["total_debt"],
+        pnl=history["gain"] - history["loss"],
+        fee_yield=opening["lp_balance"]
+        * (history["lp_rate"] - opening["lp_rate"])
+        / LP_RATE_UNIT,
+    )
+    started = opening["timestamp"].notna()
+    periods, group = periods[started].copy(), group[started]
+    periods["emission_yield"] = periods["pnl"] - periods["fee_yield"]
+    periods["period_return"] = (periods["pnl"] / periods["debt"]).replace(
+        [np.inf, -np.inf], np.nan
+    )
+    periods["apr"] = (periods["period_return"] / periods["years"]).replace(
+        [np.inf, -np.inf], np.nan
+    )
+
+    # drawdown of the compounded returns from their running peak, per strategy; the peak starts
+    # at the initial 1 so that a loss in the first period counts too
+    equity = (
+        (1 + periods["period_return"].fillna(0)).groupby(group, sort=False).cumprod()
+    )
+    peak = equity.groupby(group, sort=False).cummax().clip(lower=1)
+    periods["drawdown"] = 1 - equity / peak
+    return periods.reset_index(drop=True)
+
+
+def strategy_summary(periods):
+    """
+    Per strategy: harvests, time span, total P&L and its fee/emission split, debt-time weighted
+    APRs and the largest drawdown.
+    """
+    weighted = periods.assign(
+        debt_years=periods["debt"] * periods["years"],
+        # only periods with harvest state count towards the split's APRs
+        split_debt_years=(periods["debt"] * periods["years"]).where(
+            periods["fee_yield"].notna(), 0.0
+        ),
+    )
+    summary = weighted.groupby(KEYS).agg(
+        periods=("pnl", "size"),
+        start=("timestamp", "min"),
+        end=("timestamp", "max"),
+        pnl=("pnl", "sum"),
+        loss=("loss", "sum"),
+        fee_yield=("fee_yield", "sum"),
+        emission_yield=("emission_yield", "sum"),
+        debt_years=("debt_years", "sum"),
+        split_debt_years=("split_debt_years", "sum"),
+        max_drawdown=("drawdown", "max"),
+    )
+    debt_years = summary["debt_years"].where(summary["debt_years"] > 0)
+    split_debt_years = summary["split_debt_years"].where(
+        summary["split_debt_years"] > 0
+    )
+    summary["apr"] = summary["pnl"] / debt_years
+    summary["fee_apr"] = summary["fee_yield"] / split_debt_years
+    summary["emission_apr"] = summary["emission_yield"] / split_debt_years
+    return summary.drop(columns=["debt_years", "split_debt_years"])
+
+
+def main(argv=None):
+    paths = sys.argv[1:] if argv is None else argv
+    start = time.time()
+    history = pd.concat([load_history(path) for path in paths], ignore_index=True)
+    summary = strategy_summary(harvest_periods(history))
+    print(
+        summary[
+            ["periods", "apr", "fee_apr", "emission_apr", "max_drawdown"]
+        ].to_string(float_format=lambda value: f"{value:.2%}")
+    )
+    print(f"{len(history)} reports analyzed in {time.time() - start:.2f}s")
+    return summary
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,388 @@
+import itertools
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+# Monte Carlo harvest simulator: which minReportDelay / maxReportDelay / creditThreshold give
+# the best yield net of gas? Market paths (reward emissions, reward token price, deltaCredit
+# shocks, debt ratio changes, base fee) are drawn once for all paths as (steps, paths) arrays,
+# then every parameter set is run against the same paths, vectorized over paths. The harvest
+# itself is the accounting of Strategy.prepareReturn / _withdrawSome / adjustPosition
+# (scripts/stargate_model.py is the exact, scalar version) with LP valued 1:1 in want.
+#
+#   python -m scripts.harvest_simulator
+#
+# Amounts are in want units, times in days.
+
+DAY = 1.0
+YEAR = 365.0
+
+
+@dataclass
+class MarketParams:
+    days: int = 365
+    steps_per_day: int = 1
+    tvl: float = 10_000_000.0  # initial strategy debt
+    fee_apr: float = 0.01  # LP fee growth of the pool
+    reward_apr: float = 0.04  # emissions value at the initial reward price
+    reward_price_vol: float = 0.9  # annualized, reward token price in want
+    reward_price_drift: float = 0.0
+    emission_vol: float = 0.2  # day to day noise on emissions per staked want
+    delta_credit: float = 0.5  # share of the strategy's LP value redeemable instantly
+    delta_credit_shocks_per_year: float = 6.0
+    delta_credit_recovery: float = 0.1  # per day, back towards `delta_credit`
+    debt_ratio_changes_per_year: float = 2.0
+    debt_ratio_range: tuple = (0.5, 1.0)
+    base_fee_gwei: float = 30.0
+    base_fee_vol: float = 0.5  # per day, lognormal
+    max_acceptable_base_fee_gwei: float = 50.0  # what the BaseFeeOracle lets through
+    harvest_gas: int = 600_000
+    eth_price: float = 2_000.0  # in want
+
+    @property
+    def steps(self):
+        return self.days * self.steps_per_day
+
+    @property
+    def dt(self):
+        return DAY / self.steps_per_day
+
+
+@dataclass
+class HarvestParams:
+    min_report_delay: float = 21.0
+    max_report_delay: float = 100.0
+    credit_threshold: float = 1e6
+
+
+@dataclass
+class MarketPaths:
+    reward_price: np.ndarray  # want per reward token
+    emissions: np.ndarray  # reward tokens per want staked per step
+    delta_credit: np.ndarray  # share of LP value redeemable instantly
+    debt_ratio: np.ndarray
+    base_fee: np.ndarray  # gwei
+
+    @property
+    def shape(self):
+        return self.reward_price.shape
+
+
+def generate_paths(market, n_paths, seed=0):
+    rng = np.random.default_rng(seed)
+    steps, dt = market.steps, market.dt
+    shape = (steps, n_paths)
+
+    # reward token price: geometric brownian motion starting at 1
+    shocks = rng.standard_normal(shape) * market.reward_price_vol * np.sqrt(dt / YEAR)
+    drift = (market.reward_price_drift - market.reward_price_vol ** 2 / 2) * dt / YEAR
+    reward_price = np.exp(np.cumsum(drift + shocks, axis=0))
+
+    emissions = (
+        market.reward_apr
+        * dt
+        / YEAR
+        * np.exp(
+            market.emission_vol * rng.standard_normal(shape)
+            - market.emission_vol ** 2 / 2
+        )
+    )
+
+    # deltaCredit: drained to a fraction by other chains, then recovering
+    delta_credit = np.empty(shape)
+    level = np.full(n_paths, market.delta_credit)
+    shock_probability = market.delta_credit_shocks_per_year * dt / YEAR
+    recovery = 1 - (1 - market.delta_credit_recovery) ** dt
+    for step in range(steps):
+        shocked = rng.random(n_paths) < shock_probability
+        level = np.where(shocked, level * rng.random(n_paths) * 0.2, level)
+        level = level + (market.delta_credit - level) * recovery
+        delta_credit[step] = level
+
+    # debt ratio: piecewise constant, redrawn at random times
+    change_probability = market.debt_ratio_changes_per_year * dt / YEAR
+    changes = rng.random(shape) < change_probability
+    low, high = market.debt_ratio_range
+    draws = rng.uniform(low, high, shape)
+    debt_ratio = np.empty(shape)
+    ratio = np.ones(n_paths)
+    for step in range(steps):
+        ratio = np.where(changes[step], draws[step], ratio)
+        debt_ratio[step] = ratio
+
+    base_fee = market.base_fee_gwei * np.exp(
+        market.base_fee_vol * rng.standard_normal(shape) - market.base_fee_vol ** 2 / 2
+    )
+    return MarketPaths(reward_price, emissions, delta_credit, debt_ratio, base_fee)
+
+
+def prepare_return(loose, lp_value, total_debt, debt_outstanding, redeemable):
+    """
+    Vectorized Strategy.prepareReturn with LP valued 1:1 in want. `redeemable` is what
+    instantRedeemLocal lets out (deltaCredit). Returns (profit, loss, debt payment, loose,
+    lp value) after the withdrawal.
+    """
+    total_assets = loose + lp_value
+    profit = np.maximum(total_assets - total_debt, 0)
+    needed = np.maximum(debt_outstanding + profit - loose, 0)
+    # _withdrawSome: redeem what is needed, capped by our LP and by deltaCredit
+    freed = np.minimum(np.minimum(needed, lp_value), redeemable)
+    loose = loose + freed
+    lp_value = lp_value - freed
+    total_assets = loose + lp_value
+
+    short = loose <= profit
+    debt_payment = np.where(short, 0, np.minimum(loose - profit, debt_outstanding))
+    profit = np.where(short, loose, profit)
+    loss = np.maximum(total_debt - total_assets, 0)
+    net = profit - loss
+    return (
+        np.maximum(net, 0),
+        np.maximum(-net, 0),
+        debt_payment,
+        loose,
+        lp_value,
+    )
+
+
+@dataclass
+class SimulationResult:
+    params: HarvestParams
+    realized_profit: np.ndarray
+    realized_loss: np.ndarray
+    unrealized_profit: np.ndarray  # rewards and LP gains not reported by the end
+    gas_spent: np.ndarray
+    harvests: np.ndarray
+    unliquidated_debt: np.ndarray  # debt outstanding the last harvest could not free
+    average_unliquidated_debt: np.ndarray
+    years: float
+    tvl: float
+
+    @property
+    def net(self):
+        return (
+            self.realized_profit
+            + self.unrealized_profit
+            - self.realized_loss
+            - self.gas_spent
+        )
+
+    @property
+    def net_apr(self):
+        return self.net / self.tvl / self.years
+
+    def summary(self):
+        def stats(values):
+            return {
+                "mean": float(np.mean(values)),
+                "p5": float(np.percentile(values, 5)),
+                "p50": float(np.percentile(values, 50)),
+                "p95": float(np.percentile(values, 95)),
+            }
+
+        return {
+            "net_apr": stats(self.net_apr),
+            "realized_profit": stats(self.realized_profit),
+            "realized_loss": stats(self.realized_loss),
+            "unrealized_profit": stats(self.unrealized_profit),
+            "gas_spent": stats(self.gas_spent),
+            "harvests": stats(self.harvests),
+            "unliquidated_debt": stats(self.unliquidated_debt),
+            "average_unliquidated_debt": stats(self.average_unliquidated_debt),
+        }
+
+
+# Parameter sets are stacked along the path axis until the arrays hold about this many
+# elements; beyond that the step loop is memory bound and gets slower, not faster.
+BLOCK_SIZE = 16_384
+
+
+def simulate(market, paths, grid):
+    """Run every HarvestParams in `grid` on `paths`. Returns one SimulationResult per set."""
+    per_block = max(1, BLOCK_SIZE // paths.shape[1])
+    return [
+        result
+        for start in range(0, len(grid), per_block)
+        for result in _simulate_block(market, paths, grid[start : start + per_block])
+    ]
+
+
+def _simulate_block(market, paths, grid):
+    steps, n_paths = paths.shape
+    size = len(grid) * n_paths
+    dt = market.dt
+
+    def per_path(values):
+        return np.repeat(np.asarray(values, dtype=float), n_paths)
+
+    min_report_delay = per_path([params.min_report_delay for params in grid])
+    max_report_delay = per_path([params.max_report_delay for params in grid])
+    credit_threshold = per_path([params.credit_threshold for params in grid])
+
+    lp_value = np.full(size, market.tvl)
+    loose = np.zeros(size)
+    total_debt = np.full(size, market.tvl)
+    vault_idle = np.zeros(size)
+    pending_rewards = np.zeros(size)  # reward tokens
+    since_report = np.zeros(size)
+
+    realized_profit = np.zeros(size)
+    realized_loss = np.zeros(size)
+    gas_spent = np.zeros(size)
+    harvests = np.zeros(size)
+    unliquidated = np.zeros(size)
+    unliquidated_time = np.zeros(size)
+    gas_per_harvest = market.harvest_gas * 1e-9 * market.eth_price
+    fee_growth = 1 + market.fee_apr * dt / YEAR
+
+    for step in range(steps):
+        emissions = np.tile(paths.emissions[step], len(grid))
+        reward_price = np.tile(paths.reward_price[step], len(grid))
+        delta_credit = np.tile(paths.delta_credit[step], len(grid))
+        debt_ratio = np.tile(paths.debt_ratio[step], len(grid))
+        base_fee = np.tile(paths.base_fee[step], len(grid))
+
+        lp_value = lp_value * fee_growth
+        pending_rewards = pending_rewards + emissions * lp_value
+        since_report = since_report + dt
+
+        target_debt = debt_ratio * (total_debt + vault_idle)
+        credit = np.minimum(np.maximum(target_debt - total_debt, 0), vault_idle)
+        debt_outstanding = np.maximum(total_debt - target_debt, 0)
+
+        # Strategy.harvestTrigger
+        acceptable = base_fee <= market.max_acceptable_base_fee_gwei
+        harvest = (since_report > max_report_delay) | (
+            acceptable
+            & ((since_report > min_report_delay) | (credit > credit_threshold))
+        )
+
+        # rewards are claimed and sold for want in the same harvest
+        claimed = np.where(harvest, pending_rewards * reward_price, 0)
+        pending_rewards = np.where(harvest, 0, pending_rewards)
+        profit, loss, debt_payment, new_loose, new_lp_value = prepare_return(
+            loose + claimed,
+            lp_value,
+            total_debt,
+            debt_outstanding,
+            delta_credit * lp_value,
+        )
+        profit = np.where(harvest, profit, 0)
+        loss = np.where(harvest, loss, 0)
+        debt_payment = np.where(harvest, debt_payment, 0)
+        loose = np.where(harvest, new_loose, loose)
+        lp_value = np.where(harvest, new_lp_value, lp_value)
+
+        # vault.report: take profit and debt payment, book the loss, send the credit
+        loose = loose - profit - debt_payment
+        vault_idle = vault_idle + profit + debt_payment
+        total_debt = total_debt - loss - debt_payment
+        target_debt = debt_ratio * (total_debt + vault_idle)
+        credit = np.where(
+            harvest, np.minimum(np.maximum(target_debt - total_debt, 0), vault_idle), 0
+        )
+        vault_idle = vault_idle - credit
+        total_debt = total_debt + credit
+        loose = loose + credit
+
+        # adjustPosition: everything above the remaining debt outstanding goes back to LP
+        remaining_outstanding = np.maximum(total_debt - target_debt, 0)
+        deposit = np.where(harvest, np.maximum(loose - remaining_outstanding, 0), 0)
+        loose = loose - deposit
+        lp_value = lp_value + deposit
+
+        realized_profit += profit
+        realized_loss += loss
+        gas_spent += np.where(harvest, gas_per_harvest * base_fee, 0)
+        harvests += harvest
+        unliquidated = np.where(harvest, remaining_outstanding, unliquidated)
+        unliquidated_time += unliquidated * dt
+        since_report = np.where(harvest, 0, since_report)
+
+    unrealized_profit = np.maximum(
+        loose + lp_value - total_debt, 0
+    ) + pending_rewards * np.tile(paths.reward_price[-1], len(grid))
+    years = steps * dt / YEAR
+
+    def split(values):
+        return values.reshape(len(grid), n_paths)
+
+    return [
+        SimulationResult(
+            params=params,
+            realized_profit=profit,
+            realized_loss=loss,
+            unrealized_profit=unrealized,
+            gas_spent=gas,
+            harvests=count,
+            unliquidated_debt=debt,
+            average_unliquidated_debt=debt_time / (steps * dt),
+            years=years,
+            tvl=market.tvl,
+        )
+        for params, profit, loss, unrealized, gas, count, debt, debt_time in zip(
+            grid,
+            split(realized_profit),
+            split(realized_loss),
+            split(unrealized_profit),
+            split(gas_spent),
+            split(harvests),
+            split(unliquidated),
+            split(unliquidated_time),
+        )
+    ]
+
+
+def sweep(market, grid, n_paths=10_000, seed=0):
+    """
+    Run every HarvestParams in `grid` on the same market paths. Returns the results sorted by
+    mean net APR, best first.
+    """
+    paths = generate_paths(market, n_paths, seed)
+    results = simulate(market, paths, grid)
+    return sorted(results, key=lambda result: -np.mean(result.net_apr))
+
+
+def default_grid(
+    min_report_delays=(1, 3, 7, 14, 21),
+    max_report_delays=(30, 60, 100),
+    credit_thresholds=(1e4, 1e5, 1e6),
+):
+    return [
+        HarvestParams(min_delay, max_delay, threshold)
+        for min_delay, max_delay, threshold in itertools.product(
+            min_report_delays, max_report_delays, credit_thresholds
+        )
+        if min_delay < max_delay
+    ]
+
+
+def main(n_paths=5_000):
+    market = MarketParams()
+    grid = default_grid()
+    start = time.time()
+    results = sweep(market, grid, int(n_paths))
+    print(
+        f"{len(grid)} parameter sets x {int(n_paths)} paths x {market.steps} steps "
+        f"in {time.time() - start:.1f}s"
+    )
+    print(
+        "| minReportDelay | maxReportDelay | creditThreshold | net APR (mean) | net APR (p5) "
+        "| harvests | gas | unliquidated debt |"
+    )
+    print("| ---: | ---: | ---: | ---: | ---: | ---: | ---: | ---: |")
+    for result in results:
+        summary = result.summary()
+        params = result.params
+        print(
+            f"| {params.min_report_delay:g}d | {params.max_report_delay:g}d "
+            f"| {params.credit_threshold:g} | {summary['net_apr']['mean']:.4%} "
+            f"| {summary['net_apr']['p5']:.4%} | {summary['harvests']['mean']:.1f} "
+            f"| {summary['gas_spent']['mean']:,.0f} "
+            f"| {summary['average_unliquidated_debt']['mean']:,.0f} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from brownie import accounts, chain, multicall, network
+
+# Keeper for every strategy of a deployment. Each block, harvestTrigger, tendTrigger,
+# pendingRewards (also in want, priced by the strategy's oracle) and estimatedTotalAssets
+# of all strategies are read in one Multicall2 request (the network's `multicall2`
+# address, auto-deployed on development), and a harvest or tend is only sent for
+# strategies whose trigger flipped to true. A send that fails is retried the next block, and a
+# strategy whose calls revert (a paused pool, a stale oracle) is skipped for that block.
+#
+#   KEEPER=<brownie account id> brownie run keeper --network mainnet
+#
+# Strategies come from deployments/<network>.json (see scripts/deploy.py) unless STRATEGIES
+# lists them. CALL_COST_IN_ETH is passed to the triggers, POLL_INTERVAL is in seconds.
+
+DEPLOYMENTS_DIR = Path(__file__).parent.parent / "deployments"
+
+
+@dataclass
+class StrategyConfig:
+    # read once, these never change for a deployed strategy
+    name: str
+    vault: str
+    want: str
+
+
+@dataclass
+class StrategyState:
+    block: int
+    harvest_trigger: bool
+    tend_trigger: bool
+    pending_rewards: int
+    pending_rewards_in_want: int  # 0 without a price oracle on the strategy
+    estimated_total_assets: int
+
+
+def _strategy_at(address):
+    # project contracts only exist once brownie has loaded the project
+    from brownie import Strategy
+
+    return Strategy.at(address)
+
+
+class Keeper:
+    def __init__(self, strategies, keeper, call_cost_in_eth=0):
+        self.strategies = [
+            strategy if hasattr(strategy, "harvestTrigger") else _strategy_at(strategy)
+            for strategy in strategies
+        ]
+        self.keeper = keeper
+        self.call_cost_in_eth = call_cost_in_eth
+        self.config = {}
+        self.state = {}
+        self._load_config()
+
+    def _load_config(self):
+        with multicall:
+            rows = [
+                (strategy.name(), strategy.vault(), strategy.want())
+                for strategy in self.strategies
+            ]
+        for strategy, row in zip(self.strategies, rows):
+            self.config[strategy.address] = StrategyConfig(
+                *[str(value) for value in row]
+            )
+
+    def poll(self, block=None):
+        """
+        Read the triggers and balances of every strategy in one multicall at `block`. Strategies
+        with a call that reverted are left out.
+        """
+        block = chain.height if block is None else block
+        with multicall(block_identifier=block):
+            rows = [
+                (
+                    strategy.harvestTrigger(self.call_cost_in_eth),
+                    strategy.tendTrigger(self.call_cost_in_eth),
+                    strategy.pendingRewards(),
+                    strategy.pendingRewardsInWant(),
+                    strategy.estimatedTotalAssets(),
+                )
+                for strategy in self.strategies
+            ]
+        states = {}
+        for strategy, row in zip(self.strategies, rows):
+            # multicall returns None for a call that reverted
+            if None in row:
+                name = self.config[strategy.address].name
+                print(f"{name}: skipped at block {block}, a call reverted")
+                continue
+            (
+                harvest_trigger,
+                tend_trigger,
+                pending_rewards,
+                pending_rewards_in_want,
+                estimated_total_assets,
+            ) = row
+            states[strategy.address] = StrategyState(
+                block,
+                bool(harvest_trigger),
+                bool(tend_trigger),
+                int(pending_rewards),
+                int(pending_rewards_in_want),
+                int(estimated_total_assets),
+            )
+        return states
+
+    def _flipped(self, strategy, state, trigger):
+        previous = self.state.get(strategy.address)
+        return getattr(state, trigger) and (
+            previous is None or not getattr(previous, trigger)
+        )
+
+    def tick(self, block=None):
+        """Poll once and harvest or tend the strategies whose trigger flipped. Returns the txs."""
+        states = self.poll(block)
+        txs = []
+        for strategy in self.strategies:
+            state = states.get(strategy.address)
+            if state is None:
+                # skipped this block, compare the next one with what was read before
+                if strategy.address in self.state:
+                    states[strategy.address] = self.state[strategy.address]
+                continue
+            if self._flipped(strategy, state, "harvest_trigger"):
+                tx = self._send(strategy, "harvest")
+            elif self._flipped(strategy, state, "tend_trigger"):
+                tx = self._send(strategy, "tend")
+            else:
+                continue
+            if tx is not None:
+                txs.append(tx)
+            elif strategy.address in self.state:
+                # keep the state from before the trigger flipped, so the send is retried
+                states[strategy.address] = self.state[strategy.address]
+            else:
+                del states[strategy.address]
+        self.state = states
+        return txs
+
+    def _send(self, strategy, method):
+        name = self.config[strategy.address].name
+        try:
+            tx = getattr(strategy, method)({"from": self.keeper})
+        except Exception as error:
+            # leave the other strategies of this block unaffected
+            print(f"{name}: {method} failed: {error}")
+            return None
+        print(f"{name}: {method} {tx.txid}")
+        if "RewardClaimSkipped" in tx.events:
+            skipped = tx.events["RewardClaimSkipped"]
+            print(
+                f"{name}: reward claim skipped, {skipped['pendingRewards']} pending "
+                f"< {skipped['minRewardToClaim']} minimum"
+            )
+        return tx
+
+    def run(self, poll_interval=5, blocks=None):
+        """Tick once per new block, for `blocks` blocks or forever."""
+        last_block = None
+        while blocks is None or blocks > 0:
+            block = chain.height
+            if block != last_block:
+                self.tick(block)
+                last_block = block
+                if blocks is not None:
+                    blocks -= 1
+            time.sleep(poll_interval)
+
+
+def deployed_strategies(record_path=None):
+    record_path = Path(record_path or DEPLOYMENTS_DIR / f"{network.show_active()}.json")
+    record = json.loads(record_path.read_text())
+    return [entry["strategy"] for entry in record["strategies"]]
+
+
+def main():
+    print(f"You are using the '{network.show_active()}' network")
+    if network.show_active() == "development":
+        keeper = accounts[0]
+    else:
+        keeper = accounts.load(
+            os.environ["KEEPER"], password=os.environ.get("KEEPER_PASSWORD")
+        )
+
+    if os.environ.get("STRATEGIES"):
+        strategies = os.environ["STRATEGIES"].split(",")
+    else:
+        strategies = deployed_strategies()
+
+    Keeper(strategies, keeper, int(os.environ.get("CALL_COST_IN_ETH", 0))).run(
+        float(os.environ.get("POLL_INTERVAL", 5))
+    )
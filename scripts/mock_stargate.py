@@ -0,0 +1,140 @@
+from dataclasses import dataclass, field
+
+from brownie import (
+    MockERC20,
+    MockLPStaking,
+    MockPool,
+    MockSGETH,
+    MockStargateRouter,
+    MockUniswapV2Router,
+    MockWETH,
+)
+
+# Same Stargate pool ids and LPStaking ids as mainnet, so fixtures and scripts can treat
+# the mock stack and the forked one alike.
+POOLS = {
+    "USDC": {"pool_id": 1, "lp_staking_id": 0, "decimals": 6, "shared_decimals": 6},
+    "USDT": {"pool_id": 2, "lp_staking_id": 1, "decimals": 6, "shared_decimals": 6},
+    "WETH": {"pool_id": 13, "lp_staking_id": 2, "decimals": 18, "shared_decimals": 18},
+}
+
+TOKEN_NAMES = {
+    "USDC": "USD Coin",
+    "USDT": "Tether USD",
+}
+
+REWARD_PER_BLOCK = 10 * 10 ** 18
+REWARD_FUNDING = 10_000_000 * 10 ** 18
+
+
+@dataclass
+class StargateStack:
+    reward: object
+    lp_staker: object
+    router: object
+    sgeth: object = None
+    tokens: dict = field(default_factory=dict)
+    pools: dict = field(default_factory=dict)
+    lp_staking_ids: dict = field(default_factory=dict)
+
+
+def deploy_stargate_stack(
+    deployer,
+    symbols=("USDC", "USDT", "WETH"),
+    reward_symbol="STG",
+    reward_per_block=REWARD_PER_BLOCK,
+):
+    """
+    Deploy the mock Stargate contracts (router, pools, LPStaking, SGETH and the emission token)
+    on the active network. `symbols` are added to LPStaking in order, so their LPStaking ids are
+    their position in the tuple.
+    """
+    tx_params = {"from": deployer}
+    reward_name = "StargateToken" if reward_symbol == "STG" else "Optimism"
+    reward = MockERC20.deploy(reward_name, reward_symbol, 18, tx_params)
+    lp_staker = MockLPStaking.deploy(reward, reward_per_block, tx_params)
+    reward.mint(lp_staker, REWARD_FUNDING, tx_params)
+    router = MockStargateRouter.deploy(tx_params)
+    stack = StargateStack(reward=reward, lp_staker=lp_staker, router=router)
+
+    for symbol in symbols:
+        params = POOLS[symbol]
+        if symbol == "WETH":
+            token = MockWETH.deploy(tx_params)
+            stack.sgeth = MockSGETH.deploy(tx_params)
+            pool_token = stack.sgeth
+        else:
+            token = MockERC20.deploy(
+                TOKEN_NAMES[symbol], symbol, params["decimals"], tx_params
+            )
+            pool_token = token
+
+        pool = MockPool.deploy(
+            params["pool_id"],
+            pool_token,
+            params["shared_decimals"],
+            params["decimals"],
+            router,
+            f"{symbol}-LP",
+            f"S*{symbol}",
+            tx_params,
+        )
+        router.registerPool(pool, tx_params)
+        if symbol == "WETH":
+            stack.sgeth.setNoUnwrapTo(pool, True, tx_params)
+
+        stack.lp_staking_ids[symbol] = lp_staker.poolLength()
+        lp_staker.add(1_000, pool, tx_params)
+        stack.tokens[symbol] = token
+        stack.pools[symbol] = pool
+
+    return stack
+
+
+def fund_account(stack, symbol, account, amount):
+    """Give `account` `amount` of the want token, wrapping ETH when want is WETH."""
+    token = stack.tokens[symbol]
+    if symbol == "WETH":
+        token.deposit({"from": account, "value": amount})
+    else:
+        token.mint(account, amount, {"from": account})
+
+
+def add_liquidity(stack, symbol, provider, amount):
+    """Deposit `amount` of underlying into the pool from `provider`, who keeps the LP."""
+    pool = stack.pools[symbol]
+    if symbol == "WETH":
+        stack.sgeth.deposit({"from": provider, "value": amount})
+        stack.sgeth.approve(stack.router, amount, {"from": provider})
+    else:
+        fund_account(stack, symbol, provider, amount)
+        stack.tokens[symbol].approve(stack.router, amount, {"from": provider})
+    stack.router.addLiquidity(pool.poolId(), amount, provider, {"from": provider})
+
+
+def accrue_fees(stack, symbol, provider, amount):
+    """Pay `amount` of underlying from `provider` into the pool as LP fees."""
+    pool = stack.pools[symbol]
+    if symbol == "WETH":
+        stack.sgeth.deposit({"from": provider, "value": amount})
+        stack.sgeth.approve(pool, amount, {"from": provider})
+    else:
+        fund_account(stack, symbol, provider, amount)
+        stack.tokens[symbol].approve(pool, amount, {"from": provider})
+    pool.accrueFees(amount, {"from": provider})
+
+
+def deploy_reward_market(stack, symbol, deployer, reward_amount, want_amount):
+    """
+    Deploy a MockUniswapV2Router with a reward/want pair of `reward_amount` and `want_amount`,
+    the venue Strategy.setSwapper sells rewards on in the local tests.
+    """
+    tx_params = {"from": deployer}
+    router = MockUniswapV2Router.deploy(tx_params)
+    token = stack.tokens[symbol]
+    stack.reward.mint(deployer, reward_amount, tx_params)
+    fund_account(stack, symbol, deployer, want_amount)
+    stack.reward.approve(router, reward_amount, tx_params)
+    token.approve(router, want_amount, tx_params)
+    router.addLiquidity(stack.reward, token, reward_amount, want_amount, tx_params)
+    return router
@@ -0,0 +1,194 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.gas_benchmark import GasReport
+
+# Runs the test matrix in parallel: one shard per (suite, want token), each `brownie test`
+# process with its own local chain on its own port (see tests/conftest.py) and so its own
+# accounts. Results and gas reports of all shards are merged into reports/ at the end.
+#
+#   python -m scripts.run_shards                      # every suite and token
+#   python -m scripts.run_shards --suites Local --jobs 3 -- -x
+#
+# Arguments after `--` are passed on to every `brownie test`.
+
+ROOT = Path(__file__).parent.parent
+REPORT_DIR = ROOT / "reports"
+BASE_PORT = 8600
+
+# suite: (directory under tests/, brownie network, want tokens its `token` fixture runs)
+SUITES = {
+    "Local": ("Local", "development", ("USDC", "USDT", "WETH")),
+    "Mainnet": ("Fork", "eth-main-fork", ("USDC", "USDT", "WETH")),
+    "Optimism": ("Fork", "optimism-main-fork", ("USDC", "WETH")),
+}
+
+
+@dataclass(frozen=True)
+class Shard:
+    suite: str
+    directory: str
+    network: str
+    token: str
+    port: int
+
+    @property
+    def name(self):
+        return f"{self.suite}-{self.token}"
+
+    @property
+    def report_dir(self):
+        return REPORT_DIR / "shards" / self.name
+
+    def command(self, extra_args=()):
+        # every test id carries the `token` fixture's param, e.g. test_profitable_harvest[USDC]
+        return [
+            "brownie",
+            "test",
+            f"tests/{self.directory}",
+            "--network",
+            self.network,
+            "-k",
+            self.token,
+            "--junitxml",
+            str(self.report_dir / "junit.xml"),
+            *extra_args,
+        ]
+
+    def env(self):
+        return {
+            **os.environ,
+            "BROWNIE_PORT": str(self.port),
+            "GAS_REPORT_DIR": str(self.report_dir),
+        }
+
+
+@dataclass
+class ShardResult:
+    shard: Shard
+    returncode: int
+    seconds: float
+    tests: int = 0
+    failures: int = 0
+    errors: int = 0
+    skipped: int = 0
+
+    @property
+    def passed(self):
+        # pytest exits with 5 when -k deselected everything, e.g. a token a suite doesn't run
+        return self.returncode in (0, 5)
+
+
+def shards(suites=None, tokens=None, base_port=BASE_PORT):
+    matrix = []
+    for suite in suites or SUITES:
+        directory, network, suite_tokens = SUITES[suite]
+        for token in suite_tokens:
+            if tokens is None or token in tokens:
+                matrix.append(
+                    Shard(suite, directory, network, token, base_port + len(matrix))
+                )
+    return matrix
+
+
+def junit_summary(path):
+    """(tests, failures, errors, skipped) of a pytest junit xml report."""
+    root = ElementTree.parse(path).getroot()
+    suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+    return tuple(
+        sum(int(suite.get(field, 0)) for suite in suites)
+        for field in ("tests", "failures", "errors", "skipped")
+    )
+
+
+def run_shard(shard, extra_args=()):
+    shard.report_dir.mkdir(parents=True, exist_ok=True)
+    start = time.time()
+    with open(shard.report_dir / "output.txt", "w") as output:
+        returncode = subprocess.run(
+            shard.command(extra_args),
+            cwd=ROOT,
+            env=shard.env(),
+            stdout=output,
+            stderr=subprocess.STDOUT,
+        ).returncode
+    result = ShardResult(shard, returncode, time.time() - start)
+    junit = shard.report_dir / "junit.xml"
+    if junit.exists():
+        (
+            result.tests,
+            result.failures,
+            result.errors,
+            result.skipped,
+        ) = junit_summary(junit)
+    return result
+
+
+def merge_gas_reports(results, report_dir=REPORT_DIR):
+    """Merge the gas reports of all shards into `report_dir`. Returns the merged report."""
+    report = GasReport()
+    for result in results:
+        path = result.shard.report_dir / "gas_benchmark.json"
+        if path.exists():
+            for scenario, row in json.loads(path.read_text()).items():
+                report.record(scenario, row["gas"])
+    if report.results:
+        report.write(report_dir)
+    return report
+
+
+def summary(results):
+    lines = [
+        "| Shard | Network | Tests | Failed | Errors | Skipped | Time (s) |",
+        "| --- | --- | ---: | ---: | ---: | ---: | ---: |",
+    ]
+    for result in results:
+        lines.append(
+            f"| {result.shard.name} | {result.shard.network} | {result.tests} | "
+            f"{result.failures} | {result.errors} | {result.skipped} | "
+            f"{result.seconds:.0f} |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    extra_args = []
+    if "--" in argv:
+        extra_args = argv[argv.index("--") + 1 :]
+        argv = argv[: argv.index("--")]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--suites", nargs="+", choices=SUITES)
+    parser.add_argument("--tokens", nargs="+")
+    parser.add_argument("--jobs", type=int, default=None)
+    parser.add_argument("--base-port", type=int, default=BASE_PORT)
+    args = parser.parse_args(argv)
+
+    matrix = shards(args.suites, args.tokens, args.base_port)
+    # compile once up front, concurrent compiles would race on build/
+    subprocess.run(["brownie", "compile"], cwd=ROOT, check=True)
+    with ThreadPoolExecutor(args.jobs or len(matrix)) as pool:
+        results = list(pool.map(lambda shard: run_shard(shard, extra_args), matrix))
+
+    merge_gas_reports(results)
+    table = summary(results)
+    (REPORT_DIR / "test_matrix.md").write_text(table)
+    print(table)
+    failed = [result.shard.name for result in results if not result.passed]
+    if failed:
+        print(
+            f"Failed shards: {', '.join(failed)} (logs in reports/shards/<shard>/output.txt)"
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,545 @@
+from dataclasses import dataclass, field, replace
+
+# Pure-Python model of the Stargate contracts the strategy touches (Pool, Router, LPStaking)
+# and of Strategy's harvest, tend and withdraw accounting, including the reward sale through a
+# swapper (modelled as one Uniswap V2 pair, see ConstantProductSwapper). All math is integer
+# math in the same order as the contracts, so results match the chain to the wei;
+# tests/Local/test_stargate_model.py checks that against the mock stack. A model is cheap to
+# copy, which makes it suitable for running thousands of what-if scenarios (see
+# StargateModel.copy).
+#
+# WETH wants are modelled 1:1 against the pool token: the ETH/WETH/SGETH wrapping the strategy
+# never changes an amount. Redeems queued with queueRedeemLocal count at their queued value
+# until they are delivered, which happens on another chain and is not modelled.
+
+ACC_PRECISION = 10 ** 12
+BPS = 10_000
+
+# holders in the model's LP ledger
+STRATEGY = "strategy"
+LP_STAKING = "lp_staking"
+
+
+class StargateError(Exception):
+    pass
+
+
+def _require(condition, message):
+    if not condition:
+        raise StargateError(message)
+
+
+@dataclass
+class Pool:
+    convert_rate: int
+    total_liquidity: int = 0  # shared decimals
+    total_supply: int = 0
+    delta_credit: int = 0  # shared decimals
+    balances: dict = field(default_factory=dict)  # LP balances
+
+    def balance_of(self, account):
+        return self.balances.get(account, 0)
+
+    def transfer(self, sender, recipient, amount):
+        _require(
+            self.balance_of(sender) >= amount, "ERC20: transfer amount exceeds balance"
+        )
+        self.balances[sender] = self.balance_of(sender) - amount
+        self.balances[recipient] = self.balance_of(recipient) + amount
+
+    def amount_lp_to_sd(self, amount_lp):
+        _require(
+            self.total_supply > 0, "Stargate: cant convert LPtoSD when totalSupply == 0"
+        )
+        return amount_lp * self.total_liquidity // self.total_supply
+
+    def amount_sd_to_lp(self, amount_sd):
+        _require(
+            self.total_liquidity > 0, "Stargate: cant convert SDtoLP when totalLiq == 0"
+        )
+        return amount_sd * self.total_supply // self.total_liquidity
+
+    def amount_lp_to_ld(self, amount_lp):
+        return self.amount_lp_to_sd(amount_lp) * self.convert_rate
+
+    def mint(self, to, amount_ld):
+        """Mint LP for `amount_ld` of underlying. Returns the LP minted."""
+        amount_sd = amount_ld // self.convert_rate
+        amount_lp = amount_sd
+        if self.total_supply != 0:
+            amount_lp = amount_sd * self.total_supply // self.total_liquidity
+        self.delta_credit += amount_sd
+        self.total_liquidity += amount_sd
+        self.total_supply += amount_lp
+        self.balances[to] = self.balance_of(to) + amount_lp
+        return amount_lp
+
+    def instant_redeem_local(self, sender, amount_lp):
+        """Burn up to `amount_lp` of `sender`, capped by deltaCredit. Returns the underlying paid out."""
+        amount_lp = min(amount_lp, self.amount_sd_to_lp(self.delta_credit))
+        _require(self.total_supply > 0, "Stargate: cant burn when totalSupply == 0")
+        amount_sd = self.amount_lp_to_sd(amount_lp)
+        _require(
+            self.balance_of(sender) >= amount_lp, "ERC20: burn amount exceeds balance"
+        )
+        self.total_liquidity -= amount_sd
+        self.total_supply -= amount_lp
+        self.balances[sender] -= amount_lp
+        self.delta_credit -= amount_sd
+        return amount_sd * self.convert_rate
+
+    def accrue_fees(self, amount_ld):
+        self.total_liquidity += amount_ld // self.convert_rate
+
+
+class Router:
+    @staticmethod
+    def add_liquidity(pool, amount_ld, to):
+        """Returns the underlying actually taken (rounded down to the pool's convert rate)."""
+        amount_ld = amount_ld // pool.convert_rate * pool.convert_rate
+        pool.mint(to, amount_ld)
+        return amount_ld
+
+    @staticmethod
+    def instant_redeem_local(pool, amount_lp, sender):
+        _require(amount_lp > 0, "Stargate: not enough lp to redeem")
+        return pool.instant_redeem_local(sender, amount_lp)
+
+
+@dataclass
+class ConstantProductSwapper:
+    """A reward/want Uniswap V2 pair, the venue of UniswapV2Swapper on a single-hop path."""
+
+    reserve_in: int  # reward
+    reserve_out: int  # want
+
+    def quote(self, amount_in):
+        _require(
+            self.reserve_in > 0 and self.reserve_out > 0,
+            "UniswapV2Library: INSUFFICIENT_LIQUIDITY",
+        )
+        amount_in_with_fee = amount_in * 997
+        return (
+            amount_in_with_fee
+            * self.reserve_out
+            // (self.reserve_in * 1000 + amount_in_with_fee)
+        )
+
+    def swap(self, amount_in, min_amount_out):
+        """Returns the want paid out."""
+        amount_out = self.quote(amount_in)
+        _require(
+            amount_out >= min_amount_out, "UniswapV2Router: INSUFFICIENT_OUTPUT_AMOUNT"
+        )
+        self.reserve_in += amount_in
+        self.reserve_out -= amount_out
+        return amount_out
+
+
+@dataclass
+class StakingPool:
+    alloc_point: int
+    last_reward_block: int
+    acc_per_share: int = 0
+    lp_supply: int = 0  # LP held by LPStaking for this pool
+    amounts: dict = field(default_factory=dict)
+    reward_debts: dict = field(default_factory=dict)
+
+
+@dataclass
+class LPStaking:
+    reward_per_block: int
+    total_alloc_point: int
+    reward_balance: int  # rewards left to pay out
+    pools: dict = field(default_factory=dict)  # LPStaking pool id -> StakingPool
+
+    def _pool_reward(self, pool, block):
+        return (
+            (block - pool.last_reward_block)
+            * self.reward_per_block
+            * pool.alloc_point
+            // self.total_alloc_point
+        )
+
+    def pending(self, pid, user, block):
+        pool = self.pools[pid]
+        acc_per_share = pool.acc_per_share
+        if block > pool.last_reward_block and pool.lp_supply != 0:
+            acc_per_share += (
+                self._pool_reward(pool, block) * ACC_PRECISION // pool.lp_supply
+            )
+        accumulated = pool.amounts.get(user, 0) * acc_per_share // ACC_PRECISION
+        return accumulated - pool.reward_debts.get(user, 0)
+
+    def update_pool(self, pid, block):
+        pool = self.pools[pid]
+        if block <= pool.last_reward_block:
+            return
+        if pool.lp_supply == 0:
+            pool.last_reward_block = block
+            return
+        pool.acc_per_share += (
+            self._pool_reward(pool, block) * ACC_PRECISION // pool.lp_supply
+        )
+        pool.last_reward_block = block
+
+    def _pay(self, amount):
+        amount = min(amount, self.reward_balance)
+        self.reward_balance -= amount
+        return amount
+
+    def deposit(self, pid, user, amount, block):
+        """Stake `amount` LP (0 to just claim). Returns the rewards paid to `user`."""
+        pool = self.pools[pid]
+        self.update_pool(pid, block)
+        staked = pool.amounts.get(user, 0)
+        paid = 0
+        if staked > 0:
+            paid = self._pay(
+                staked * pool.acc_per_share // ACC_PRECISION
+                - pool.reward_debts.get(user, 0)
+            )
+        pool.lp_supply += amount
+        pool.amounts[user] = staked + amount
+        pool.reward_debts[user] = (
+            pool.amounts[user] * pool.acc_per_share // ACC_PRECISION
+        )
+        return paid
+
+    def withdraw(self, pid, user, amount, block):
+        """Unstake `amount` LP. Returns the rewards paid to `user`."""
+        pool = self.pools[pid]
+        staked = pool.amounts.get(user, 0)
+        _require(staked >= amount, "withdraw: _amount is too large")
+        self.update_pool(pid, block)
+        paid = self._pay(
+            staked * pool.acc_per_share // ACC_PRECISION
+            - pool.reward_debts.get(user, 0)
+        )
+        pool.lp_supply -= amount
+        pool.amounts[user] = staked - amount
+        pool.reward_debts[user] = (
+            pool.amounts[user] * pool.acc_per_share // ACC_PRECISION
+        )
+        return paid
+
+
+@dataclass
+class StargateModel:
+    """One strategy on one pool: the pool, its LPStaking entry and the strategy's balances."""
+
+    pool: Pool
+    lp_staking: LPStaking
+    pid: int
+    block: int
+    want_balance: int = 0
+    reward_balance: int = 0
+    total_debt: int = 0  # vault.strategies(strategy).totalDebt
+    min_reward_to_claim: int = 0
+    queued_redeem_ld: int = 0
+    swapper: ConstantProductSwapper = None  # rewards wait for yswaps without one
+    max_slippage: int = 100  # basis points
+    reward_price: int = 0  # want per 10 ** 18 of reward, from priceOracle
+
+    def copy(self):
+        pool = self.pool
+        staking_pool = self.lp_staking.pools[self.pid]
+        return StargateModel(
+            pool=Pool(
+                pool.convert_rate,
+                pool.total_liquidity,
+                pool.total_supply,
+                pool.delta_credit,
+                dict(pool.balances),
+            ),
+            lp_staking=LPStaking(
+                self.lp_staking.reward_per_block,
+                self.lp_staking.total_alloc_point,
+                self.lp_staking.reward_balance,
+                {
+                    self.pid: StakingPool(
+                        staking_pool.alloc_point,
+                        staking_pool.last_reward_block,
+                        staking_pool.acc_per_share,
+                        staking_pool.lp_supply,
+                        dict(staking_pool.amounts),
+                        dict(staking_pool.reward_debts),
+                    )
+                },
+            ),
+            pid=self.pid,
+            block=self.block,
+            want_balance=self.want_balance,
+            reward_balance=self.reward_balance,
+            total_debt=self.total_debt,
+            min_reward_to_claim=self.min_reward_to_claim,
+            queued_redeem_ld=self.queued_redeem_ld,
+            swapper=None if self.swapper is None else replace(self.swapper),
+            max_slippage=self.max_slippage,
+            reward_price=self.reward_price,
+        )
+
+    # ----------------- STRATEGY VIEWS ---------------------
+
+    @property
+    def unstaked_lp(self):
+        return self.pool.balance_of(STRATEGY)
+
+    @property
+    def staked_lp(self):
+        return self.lp_staking.pools[self.pid].amounts.get(STRATEGY, 0)
+
+    def pending_rewards(self):
+        return self.lp_staking.pending(self.pid, STRATEGY, self.block)
+
+    def estimated_total_assets(self):
+        return (
+            self.want_balance
+            + self.pool.amount_lp_to_ld(self.unstaked_lp + self.staked_lp)
+            + self.queued_redeem_ld
+        )
+
+    def _redeemable_lp(self, amount_ld):
+        # Strategy._redeemableLP: LP for amount_ld, capped by what deltaCredit lets out now
+        _require(self.pool.total_liquidity > 0, "")
+        amount_sd = min(amount_ld // self.pool.convert_rate, self.pool.delta_credit)
+        return amount_sd * self.pool.total_supply // self.pool.total_liquidity
+
+    # ----------------- STRATEGY ACTIONS ---------------------
+
+    def _unstake(self, amount):
+        self.reward_balance += self.lp_staking.withdraw(
+            self.pid, STRATEGY, amount, self.block
+        )
+        self.pool.transfer(LP_STAKING, STRATEGY, amount)
+
+    def _stake(self, amount):
+        self.pool.transfer(STRATEGY, LP_STAKING, amount)
+        self.reward_balance += self.lp_staking.deposit(
+            self.pid, STRATEGY, amount, self.block
+        )
+
+    def _redeem(self, amount_lp):
+        self.want_balance += Router.instant_redeem_local(self.pool, amount_lp, STRATEGY)
+
+    def claim_rewards(self):
+        # harvests leave pending rewards below min_reward_to_claim in LPStaking
+        pending = self.pending_rewards()
+        if pending > 0 and pending >= self.min_reward_to_claim:
+            self._stake(0)
+
+    def sell_rewards(self):
+        """
+        Strategy._sellRewards: the whole reward balance for want through the swapper, at most
+        max_slippage below the oracle price.
+        """
+        if self.reward_balance == 0:
+            return
+        value = self.reward_balance * self.reward_price // 10 ** 18
+        if value == 0:
+            return
+        self.want_balance += self.swapper.swap(
+            self.reward_balance, value * (BPS - self.max_slippage) // BPS
+        )
+        self.reward_balance = 0
+
+    def withdraw_some(self, amount_needed, unstaked_lp=None, staked_lp=None):
+        """Strategy._withdrawSome. Returns (liquidated, loss, remaining LP value)."""
+        unstaked_lp = self.unstaked_lp if unstaked_lp is None else unstaked_lp
+        staked_lp = self.staked_lp if staked_lp is None else staked_lp
+        pre_withdraw_want = self.want_balance
+        if amount_needed > 0:
+            to_redeem = min(self._redeemable_lp(amount_needed), unstaked_lp + staked_lp)
+            if unstaked_lp < to_redeem:
+                to_unstake = to_redeem - unstaked_lp
+                self._unstake(to_unstake)
+                unstaked_lp += to_unstake
+                staked_lp -= to_unstake
+            if to_redeem > 0:
+                self._redeem(to_redeem)
+                unstaked_lp -= to_redeem
+
+        remaining_lp_value = self.pool.amount_lp_to_ld(unstaked_lp + staked_lp)
+        liquid = self.want_balance - pre_withdraw_want
+        loss = 0
+        if amount_needed > liquid:
+            liquidated = liquid
+            potential_loss = amount_needed - liquid
+            # want still on its way from a queued redeem is not lost
+            held_value = remaining_lp_value + self.queued_redeem_ld
+            if potential_loss > held_value:
+                loss = potential_loss - held_value
+        else:
+            liquidated = amount_needed
+        return liquidated, loss, remaining_lp_value
+
+    def prepare_return(self, debt_outstanding):
+        """Strategy.prepareReturn. Returns (profit, loss, debt payment)."""
+        self.claim_rewards()
+        if self.swapper is not None:
+            self.sell_rewards()
+        vault_debt = self.total_debt
+        want = self.want_balance
+        unstaked_lp = self.unstaked_lp
+        staked_lp = self.staked_lp
+        total_assets = (
+            want
+            + self.pool.amount_lp_to_ld(unstaked_lp + staked_lp)
+            + self.queued_redeem_ld
+        )
+
+        profit = total_assets - vault_debt if total_assets > vault_debt else 0
+        loss = 0
+        if debt_outstanding + profit > want:
+            _, loss, remaining_lp_value = self.withdraw_some(
+                debt_outstanding + profit - want, unstaked_lp, staked_lp
+            )
+            want = self.want_balance
+            total_assets = want + remaining_lp_value + self.queued_redeem_ld
+
+        if want <= profit:
+            profit = want
+            debt_payment = 0
+        else:
+            debt_payment = min(want - profit, debt_outstanding)
+
+        loss += vault_debt - total_assets if vault_debt > total_assets else 0
+        if loss > profit:
+            return 0, loss - profit, debt_payment
+        return profit - loss, 0, debt_payment
+
+    def adjust_position(self, debt_outstanding):
+        if self.want_balance > debt_outstanding:
+            self.want_balance -= Router.add_liquidity(
+                self.pool, self.want_balance - debt_outstanding, STRATEGY
+            )
+        if self.unstaked_lp > 0:
+            self._stake(self.unstaked_lp)
+
+    def tend(self, debt_outstanding=0):
+        """
+        BaseStrategy.tend: adjustPosition, which for a tend first claims and sells the rewards
+        when a swapper is set (Strategy._tend). Nothing is reported to the vault.
+        """
+        if self.swapper is not None:
+            self.claim_rewards()
+            self.sell_rewards()
+        self.adjust_position(debt_outstanding)
+
+    def liquidate_position(self, amount_needed):
+        """Strategy.liquidatePosition. Returns (liquidated, loss)."""
+        loss = 0
+        if self.want_balance < amount_needed:
+            _, loss, _ = self.withdraw_some(amount_needed - self.want_balance)
+        liquidated = min(amount_needed, self.want_balance)
+        _require(amount_needed >= liquidated + loss, "!check")
+        return liquidated, loss
+
+    def withdraw(self, amount_needed):
+        """BaseStrategy.withdraw: liquidate and hand the want to the vault. Returns the loss."""
+        liquidated, loss = self.liquidate_position(amount_needed)
+        self.want_balance -= liquidated
+        self.total_debt -= min(self.total_debt, liquidated + loss)
+        return loss
+
+    def harvest(self, debt_outstanding=0, credit=0):
+        """
+        prepareReturn, a simplified vault report (no fees: losses and the debt payment come off
+        totalDebt, profit and debt payment go to the vault, `credit` comes in) and adjustPosition.
+        Returns (profit, loss, debt payment).
+        """
+        profit, loss, debt_payment = self.prepare_return(debt_outstanding)
+        debt_payment = min(debt_payment, debt_outstanding)
+        self.total_debt -= loss + debt_payment
+        self.want_balance -= profit + debt_payment
+        self.want_balance += credit
+        self.total_debt += credit
+        self.adjust_position(debt_outstanding - debt_payment)
+        return profit, loss, debt_payment
+
+
+def _view(address, name):
+    # uint256 getters that are not part of the interfaces in interfaces/Stargate
+    from brownie import Contract
+
+    abi = [
+        {
+            "inputs": [],
+            "name": name,
+            "outputs": [{"name": "", "type": "uint256"}],
+            "stateMutability": "view",
+            "type": "function",
+        }
+    ]
+    return getattr(Contract.from_abi(name, address, abi), name)()
+
+
+def model_from_chain(
+    strategy, vault, reward_per_block_getter="rewardPerBlock", swapper=None
+):
+    """
+    Snapshot a deployed strategy, its pool and its LPStaking entry into a StargateModel.
+    Stargate's own LPStaking calls the emission rate `stargatePerBlock`, pass that name as
+    `reward_per_block_getter` when snapshotting a fork. A strategy that sells its rewards in
+    the harvest needs `swapper`, a ConstantProductSwapper with the reserves of the pair its
+    swapper trades on. Its oracle price is read for 10 ** 18 of reward, an oracle that rounds
+    differently for other amounts can shift the sale's minimum by a few wei.
+    """
+    from brownie import ZERO_ADDRESS, chain, interface
+
+    if strategy.swapper() != ZERO_ADDRESS and swapper is None:
+        raise ValueError("the strategy sells rewards through a swapper, pass its pair")
+
+    reward_price = 0
+    if strategy.priceOracle() != ZERO_ADDRESS:
+        reward_price = interface.IPriceOracle(strategy.priceOracle()).quote(
+            strategy.reward(), strategy.want(), 10 ** 18
+        )
+
+    pool = interface.IPool(strategy.liquidityPool())
+    lp_token = interface.IERC20Metadata(pool.address)
+    lp_staker = interface.ILPStaking(strategy.lpStaker())
+    pid = strategy.liquidityPoolIDInLPStaking()
+    _, alloc_point, last_reward_block, acc_per_share = lp_staker.poolInfo(pid)
+    amount, reward_debt = lp_staker.userInfo(pid, strategy)
+    lp_staked = lp_token.balanceOf(lp_staker)
+
+    return StargateModel(
+        pool=Pool(
+            convert_rate=pool.convertRate(),
+            total_liquidity=pool.totalLiquidity(),
+            total_supply=pool.totalSupply(),
+            delta_credit=pool.deltaCredit(),
+            balances={
+                STRATEGY: lp_token.balanceOf(strategy),
+                LP_STAKING: lp_staked,
+            },
+        ),
+        lp_staking=LPStaking(
+            reward_per_block=_view(lp_staker.address, reward_per_block_getter),
+            total_alloc_point=_view(lp_staker.address, "totalAllocPoint"),
+            reward_balance=interface.IERC20Metadata(strategy.reward()).balanceOf(
+                lp_staker
+            ),
+            pools={
+                pid: StakingPool(
+                    alloc_point=alloc_point,
+                    last_reward_block=last_reward_block,
+                    acc_per_share=acc_per_share,
+                    lp_supply=lp_staked,
+                    amounts={STRATEGY: amount},
+                    reward_debts={STRATEGY: reward_debt},
+                )
+            },
+        ),
+        pid=pid,
+        block=chain.height,
+        want_balance=strategy.balanceOfWant(),
+        reward_balance=strategy.balanceOfReward(),
+        total_debt=vault.strategies(strategy)["totalDebt"],
+        min_reward_to_claim=strategy.minRewardToClaim(),
+        queued_redeem_ld=strategy.queuedRedeemLD(),
+        swapper=None if strategy.swapper() == ZERO_ADDRESS else swapper,
+        max_slippage=strategy.maxSlippage(),
+        reward_price=reward_price,
+    )
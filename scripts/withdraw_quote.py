@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+
+from brownie import Strategy, multicall
+
+# Withdrawal quotes for front-ends and routers: Strategy.quoteWithdraw for any number of
+# strategies in one multicall, and a split of a withdrawal across strategies of the same want
+# that only asks each one for what it can free right now.
+
+
+@dataclass
+class WithdrawQuote:
+    strategy: str
+    requested: int
+    withdrawable: int  # loose want plus what deltaCredit lets us redeem
+    blocked_by_delta_credit: int  # held as LP, not redeemable right now
+    lp_to_redeem: int
+
+
+def quote_withdrawals(strategies, amount, block=None):
+    """Quote withdrawing `amount` from each strategy, in one eth_call."""
+    strategies = [
+        strategy if hasattr(strategy, "quoteWithdraw") else Strategy.at(strategy)
+        for strategy in strategies
+    ]
+    with multicall(block_identifier=block):
+        quotes = [strategy.quoteWithdraw(amount) for strategy in strategies]
+    return [
+        WithdrawQuote(strategy.address, int(amount), *[int(value) for value in quote])
+        for strategy, quote in zip(strategies, quotes)
+    ]
+
+
+def route_withdrawal(strategies, amount, block=None):
+    """
+    Split `amount` across `strategies`, largest instant liquidity first. Returns
+    [(strategy address, amount)] and the part of `amount` no strategy can free right now.
+    """
+    quotes = quote_withdrawals(strategies, amount, block)
+    route = []
+    remaining = int(amount)
+    for quote in sorted(quotes, key=lambda quote: -quote.withdrawable):
+        if remaining == 0:
+            break
+        part = min(quote.withdrawable, remaining)
+        if part > 0:
+            route.append((quote.strategy, part))
+            remaining -= part
+    return route, remaining
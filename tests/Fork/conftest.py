@@ -0,0 +1,384 @@
+import pytest
+from brownie import config
+from brownie import Contract, ZERO_ADDRESS
+from brownie._config import CONFIG
+
+# Forked tier: the same scenarios against the live Stargate deployments of every network in
+# NETWORKS, e.g. `brownie test tests/Fork --network eth-main-fork` or `--network
+# optimism-main-fork`. Everything network specific lives in the table below.
+
+token_prices = {
+    "WBTC": 35_000,
+    "WETH": 2_000,
+    "USDT": 1,
+    "USDC": 1,
+    "DAI": 1,
+}
+
+NETWORKS = {
+    "mainnet": {
+        # want token -> address, LPStaking pool id, want whale, LP token whale
+        "tokens": {
+            "USDC": {
+                "address": "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",
+                "pool_id": 0,
+                "whale": "0x0a59649758aa4d66e25f08dd01271e891fe52199",
+                "lp_whale": "0xb0d502e938ed5f4df2e681fe6e419ff29631d62b",
+            },
+            "USDT": {
+                "address": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+                "pool_id": 1,
+                "whale": "0x47ac0Fb4F2D84898e4D9E7b4DaB3C24507a6D503",
+                "lp_whale": "0xb0d502e938ed5f4df2e681fe6e419ff29631d62b",
+            },
+            # WETH != SGETH 0x72E2F4830b9E45d52F80aC08CB2bEC0FeF72eD9c
+            "WETH": {
+                "address": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+                "pool_id": 2,
+                "whale": "0x2f0b23f53734252bda2277357e97e1517d6b042a",
+                "lp_whale": "0xb0d502e938ed5f4df2e681fe6e419ff29631d62b",
+            },
+        },
+        "gov": "0xFEB4acf3df3cDEA7399794D0869ef76A6EfAff52",
+        "lp_staker": "0xB0D502E938ed5f4df2E681fE6E419ff29631d62b",
+        "stargate_router": "0x8731d54E9D02c286767d56ac03e8037C07e01e98",
+        # Mainnet has STG rewards
+        "emission_token_is_stg": True,
+        "reward_token": "0xAf5191B0De278C7286d6C7CC6ab6BB8A73bA2Cd6",
+        "reward_whale": "0x28C6c06298d514Db089934071355E5743bf21d60",
+        "weth": "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",
+        "usdc": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+        "health_check": "0xDDCea799fF1699e98EDF118e0629A974Df7DF012",
+        # the strategy's hard-coded base fee oracle exists here
+        "base_fee_oracle": True,
+        "trade_factory": "0x99d8679bE15011dEAD893EB4F5df474a4e6a8b29",
+        "ymechs_safe": "0x2C01B4AD51a67E2d8F02208F54dF9aC4c0B778B6",
+        "multicall_swapper": "0xB2F65F254Ab636C96fb785cc9B4485cbeD39CDAA",
+        "curve_pool": "0x3211C6cBeF1429da3D0d58494938299C92Ad5860",
+        "univ2_router": "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D",
+        "velodrome_router": None,
+    },
+    "optimism": {
+        "tokens": {
+            "USDC": {
+                "address": "0x7F5c764cBc14f9669B88837ca1490cCa17c31607",
+                "pool_id": 0,
+                "whale": "0xd6216fc19db775df9774a6e33526131da7d19a2c",
+                "lp_whale": "0x392AC17A9028515a3bFA6CCe51F8b70306C6bd43",
+            },
+            # WETH != SGETH 0xb69c8CBCD90A39D8D3d3ccf0a3E968511C3856A0
+            "WETH": {
+                "address": "0x4200000000000000000000000000000000000006",
+                "pool_id": 1,
+                "whale": "0xBA12222222228d8Ba445958a75a0704d566BF2C8",
+                "lp_whale": "0x1D7C6783328C145393e84fb47a7f7C548f5Ee28d",
+            },
+        },
+        "gov": "0xF5d9D6133b698cE29567a90Ab35CfB874204B3A7",
+        "lp_staker": "0x4DeA9e918c6289a52cd469cAC652727B7b412Cd2",
+        "stargate_router": "0xB0D502E938ed5f4df2E681fE6E419ff29631d62b",
+        # Optimism has OP rewards, not STG rewards
+        "emission_token_is_stg": False,
+        "reward_token": "0x4200000000000000000000000000000000000042",
+        "reward_whale": "0x790b4086d106eafd913e71843aed987efe291c92",
+        "weth": "0x4200000000000000000000000000000000000006",
+        "usdc": "0x7F5c764cBc14f9669B88837ca1490cCa17c31607",
+        "health_check": "0x3d8F58774611676fd196D26149C71a9142C45296",
+        "base_fee_oracle": False,
+        "trade_factory": "0x21d7B09Bcf08F7b6b872BED56cB32416AE70bCC8",
+        # no yMechs safe, the trade factory's governance adds a mech instead
+        "ymechs_safe": None,
+        "multicall_swapper": "0xcA11bde05977b3631167028862bE2a173976CA11",
+        "curve_pool": None,
+        "univ2_router": None,
+        "velodrome_router": "0xa132DAB612dB5cB9fC9Ac426A0Cc215A3423F9c9",
+    },
+}
+
+
+def network_name(config):
+    # brownie fills CONFIG.argv only in its own pytest_configure, so read the option itself
+    network = config.getoption("--network", None)
+    network_id = network[0] if network else CONFIG.settings["networks"]["default"]
+    return "optimism" if network_id.startswith("optimism") else "mainnet"
+
+
+def pytest_generate_tests(metafunc):
+    # the token params have to be known at collection time, before brownie connects
+    if "token" in metafunc.fixturenames:
+        tokens = NETWORKS[network_name(metafunc.config)]["tokens"]
+        metafunc.parametrize("token", list(tokens), indirect=True, scope="session")
+
+
+def network_contract(network, key):
+    if network[key] is None:
+        pytest.skip(f"no {key} on this network")
+    return Contract(network[key])
+
+
+@pytest.fixture(scope="session")
+def network(request):
+    yield NETWORKS[network_name(request.config)]
+
+
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.fixture(scope="module", autouse=True)
+def shared_setup(module_isolation):
+    pass
+
+
+@pytest.fixture(scope="session", autouse=True)
+def token(request, network):
+    yield Contract(network["tokens"][request.param]["address"])
+
+
+@pytest.fixture(scope="session")
+def emissionTokenIsSTG(network):
+    yield network["emission_token_is_stg"]
+
+
+@pytest.fixture(scope="session")
+def token_lp(token, lp_staker, liquidity_pool_id_in_lp_staking):
+    yield Contract(lp_staker.poolInfo(liquidity_pool_id_in_lp_staking)["lpToken"])
+
+
+@pytest.fixture(scope="session")
+def wantIsWeth(token, weth):
+    yield token == weth
+
+
+@pytest.fixture(scope="session", autouse=True)
+def token_whale(accounts, token, network):
+    yield accounts.at(network["tokens"][token.symbol()]["whale"], force=True)
+
+
+@pytest.fixture(scope="session")
+def token_LP_whale(accounts, token, network):
+    yield accounts.at(network["tokens"][token.symbol()]["lp_whale"], force=True)
+
+
+@pytest.fixture(autouse=True)
+def amount(token, token_whale, user):
+    # this will get the number of tokens (around $100k worth of token)
+    amillion = round(100_000 / token_prices[token.symbol()])
+    amount = amillion * 10 ** token.decimals()
+    # # In order to get some funds for the token you are about to use,
+    # # it impersonate a whale address
+    if amount > token.balanceOf(token_whale):
+        amount = token.balanceOf(token_whale)
+    token.transfer(user, amount, {"from": token_whale})
+    yield amount
+
+@pytest.fixture(autouse=True)
+def amount2(token, token_whale, user2):
+    # this will get the number of tokens (around $100k worth of token)
+    amillion = round(100_000 / token_prices[token.symbol()])
+    amount = amillion * 10 ** token.decimals()
+    # # In order to get some funds for the token you are about to use,
+    # # it impersonate a whale address
+    if amount > token.balanceOf(token_whale):
+        amount = token.balanceOf(token_whale)
+    token.transfer(user2, amount, {"from": token_whale})
+    yield amount
+
+@pytest.fixture(autouse=True)
+def amountBIG(token, token_whale, userBIG):
+    # this will get the number of tokens (around $1m worth of token)
+    amillion = round(1_000_000 / token_prices[token.symbol()])
+    amount = amillion * 10 ** token.decimals()
+    # # In order to get some funds for the token you are about to use,
+    # # it impersonate a whale address
+    if amount > token.balanceOf(token_whale):
+        amount = token.balanceOf(token_whale)
+    token.transfer(userBIG, amount, {"from": token_whale})
+    yield amount
+
+@pytest.fixture(scope="session")
+def gov(accounts, network):
+    yield accounts.at(network["gov"], force=True)
+
+
+@pytest.fixture(scope="session")
+def user(accounts):
+    yield accounts[0]
+
+@pytest.fixture(scope="session")
+def user2(accounts):
+    yield accounts[6]
+
+@pytest.fixture(scope="session")
+def userBIG(accounts):
+    yield accounts[7]
+
+@pytest.fixture(scope="session")
+def rewards(accounts):
+    yield accounts[1]
+
+
+@pytest.fixture(scope="session")
+def guardian(accounts):
+    yield accounts[2]
+
+
+@pytest.fixture(scope="session")
+def management(accounts):
+    yield accounts[3]
+
+
+@pytest.fixture(scope="session")
+def strategist(accounts):
+    yield accounts[4]
+
+
+@pytest.fixture(scope="session")
+def keeper(accounts):
+    yield accounts[5]
+
+
+@pytest.fixture(scope="session")
+def usdc(network):
+    yield Contract(network["usdc"])
+
+
+@pytest.fixture(scope="session")
+def weth(network):
+    yield Contract(network["weth"])
+
+
+@pytest.fixture(scope="session")
+def reward_token(network):
+    yield Contract(network["reward_token"])
+
+
+@pytest.fixture(scope="session")
+def reward_whale(accounts, network):
+    yield accounts.at(network["reward_whale"], force=True)
+
+
+@pytest.fixture(scope="session")
+def lp_staker(network):
+    yield Contract(network["lp_staker"])
+
+
+@pytest.fixture(scope="session")
+def stargate_router(network):
+    yield Contract(network["stargate_router"])
+
+
+@pytest.fixture(scope="session")
+def stargate_token_pool(token_lp):
+    yield token_lp
+
+
+@pytest.fixture(scope="session")
+def liquidity_pool_id_in_lp_staking(token, network):
+    yield network["tokens"][token.symbol()]["pool_id"]
+
+
+@pytest.fixture(scope="session")
+def health_check(network):
+    yield network["health_check"]
+
+
+@pytest.fixture(scope="session")
+def trade_factory(network):
+    yield Contract(network["trade_factory"])
+
+
+@pytest.fixture(scope="module")
+def ymechs_safe(accounts, trade_factory, network):
+    if network["ymechs_safe"] is not None:
+        yield Contract(network["ymechs_safe"])
+    else:
+        trade_factory_gov = accounts.at(trade_factory.governance(), force=True)
+        trade_factory.addMech(accounts[8], {"from": trade_factory_gov})
+        yield accounts[8]
+
+
+@pytest.fixture(scope="session")
+def multicall_swapper(interface, network):
+    yield interface.MultiCallOptimizedSwapper(network["multicall_swapper"])
+
+
+@pytest.fixture(scope="session")
+def curve_pool(network):
+    yield network_contract(network, "curve_pool")
+
+
+@pytest.fixture(scope="session")
+def univ2_router(network):
+    yield network_contract(network, "univ2_router")
+
+
+@pytest.fixture(scope="session")
+def velodrome_router(network):
+    yield network_contract(network, "velodrome_router")
+
+
+# Deployments are shared by the tests of a module: fn_isolation reverts whatever a test does
+# to them and module_isolation drops them with the rest of the module's state.
+@pytest.fixture(scope="module")
+def vault(pm, gov, rewards, guardian, management, token):
+    Vault = pm(config["dependencies"][0]).Vault
+    vault = guardian.deploy(Vault)
+    vault.initialize(token, gov, rewards, "", "", guardian, management, {"from": gov})
+    vault.setDepositLimit(2 ** 256 - 1, {"from": gov})
+    vault.setManagement(management, {"from": gov})
+    yield vault
+
+@pytest.fixture(scope="module")
+def strategy(
+    strategist,
+    token,
+    keeper,
+    vault,
+    Strategy,
+    gov,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    trade_factory,
+    ymechs_safe,
+    wantIsWeth,
+    emissionTokenIsSTG,
+    BaseFeeDummy,
+    network,
+):
+    strategy = strategist.deploy(
+        Strategy,
+        vault,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        f"StrategyStargate{token.symbol()}",
+    )
+    strategy.setKeeper(keeper, {"from": gov})
+    strategy.setDoHealthCheck(False, {"from": gov})
+    strategy.setHealthCheck(ZERO_ADDRESS, {"from": gov})
+    if not network["base_fee_oracle"]:
+        baseFeeDummy = BaseFeeDummy.deploy(gov, {"from": strategist})
+        strategy.setBaseFeeOracle(baseFeeDummy, {"from": gov})
+    vault.addStrategy(strategy, 10_000, 0, 2 ** 256 - 1, 1_000, {"from": gov})
+    if network["ymechs_safe"] is not None:
+        trade_factory.grantRole(
+            trade_factory.STRATEGY(),
+            strategy.address,
+            {"from": ymechs_safe, "gas_price": "0 gwei"},
+        )
+    strategy.setTradeFactory(trade_factory.address, {"from": gov})
+
+    yield strategy
+
+
+@pytest.fixture(scope="module")
+def strategy_factory(strategist, strategy, StrategyFactory):
+    yield strategist.deploy(StrategyFactory, strategy)
+
+
+@pytest.fixture(scope="session")
+def RELATIVE_APPROX():
+    yield 1e-5
@@ -2,9 +2,12 @@ import pytest
 
 from brownie import chain, Wei, reverts, Contract
 
+CLONE_SALT = "0x" + "00" * 31 + "01"
+
 
 def test_double_init_should_revert(
     strategy,
+    strategy_factory,
     vault,
     strategist,
     token,
@@ -12,12 +15,11 @@ def test_double_init_should_revert(
     liquidity_pool_id_in_lp_staking,
     gov,
     keeper,
-    price_feed,
     rewards,
     wantIsWeth,
     emissionTokenIsSTG,
 ):
-    clone_tx = strategy.clone(
+    clone_tx = strategy_factory.clone(
         vault,
         strategist,
         rewards,
@@ -28,6 +30,7 @@ def test_double_init_should_revert(
         emissionTokenIsSTG,
         #price_feed,
         "ClonedStrategy",
+        CLONE_SALT,
         {"from": strategist},
     )
 
@@ -41,10 +44,6 @@ def test_double_init_should_revert(
             strategist,
             rewards,
             keeper,
-            lp_staker,
-            liquidity_pool_id_in_lp_staking,
-            wantIsWeth,
-            emissionTokenIsSTG,
             #price_feed,
             "RevertedStrat",
             {"from": gov},
@@ -56,10 +55,6 @@ def test_double_init_should_revert(
             strategist,
             rewards,
             keeper,
-            lp_staker,
-            liquidity_pool_id_in_lp_staking,
-            wantIsWeth,
-            emissionTokenIsSTG,
             #price_feed,
             "ClonedRevertedStrat",
             {"from": gov},
@@ -68,6 +63,7 @@ def test_double_init_should_revert(
 
 def test_clone(
     strategy,
+    strategy_factory,
     vault,
     strategist,
     token,
@@ -77,12 +73,12 @@ def test_clone(
     keeper,
     rewards,
     token_whale,
-    price_feed,
     amount,
     wantIsWeth,
     emissionTokenIsSTG,
+    health_check,
 ):
-    clone_tx = strategy.clone(
+    clone_tx = strategy_factory.clone(
         vault,
         strategist,
         rewards,
@@ -93,12 +89,14 @@ def test_clone(
         emissionTokenIsSTG,
         #price_feed,
         "ClonedStrategy",
+        CLONE_SALT,
         {"from": strategist},
     )
 
     cloned_strategy = Contract.from_abi(
         "Strategy", clone_tx.events["Cloned"]["clone"], strategy.abi
     )
+    cloned_strategy.setHealthCheck(health_check, {"from": gov})
 
     vault.updateStrategyDebtRatio(strategy, 0, {"from": gov})
     vault.addStrategy(cloned_strategy, 10_000, 0, 2 ** 256 - 1, 0, {"from": gov})
@@ -17,7 +17,6 @@ def test_migration(
     user,
     RELATIVE_APPROX,
     lp_staker,
-    price_feed,
     liquidity_pool_id_in_lp_staking,
     wantIsWeth,
     emissionTokenIsSTG,
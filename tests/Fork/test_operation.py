@@ -340,7 +340,7 @@ def test_equal_distribution_of_losses_100_percent_loss(
 
 
 def test_limited_delta_credit_no_loss(
-    chain, accounts, token, vault, strategy, user, strategist, amount, RELATIVE_APPROX, gov, token_LP_whale,
+    chain, accounts, token, vault, strategy, user, strategist, amount, RELATIVE_APPROX, gov, token_LP_whale, token_lp,
 ):
     # Deposit to the vault
     user_balance_before = token.balanceOf(user)
@@ -356,7 +356,7 @@ def test_limited_delta_credit_no_loss(
 
     liquidityPool = Contract(strategy.liquidityPool())
     router = Contract(liquidityPool.router())
-    router.instantRedeemLocal(liquidityPool.poolId(), liquidityPool.deltaCredit(), strategist, {"from":token_LP_whale})
+    router.instantRedeemLocal(liquidityPool.poolId(), min(liquidityPool.deltaCredit(), token_lp.balanceOf(token_LP_whale)), strategist, {"from":token_LP_whale})
 
     assert liquidityPool.deltaCredit() < amount
     vault.updateStrategyDebtRatio(strategy.address, 0, {"from": gov})
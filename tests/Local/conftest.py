@@ -0,0 +1,263 @@
+import pytest
+from brownie import config, ZERO_ADDRESS
+
+from scripts.mock_stargate import (
+    add_liquidity,
+    deploy_reward_market,
+    deploy_stargate_stack,
+    fund_account,
+)
+
+# Hermetic tier: every Stargate contract is a local mock (contracts/mocks), so this suite runs
+# on a plain dev chain with `brownie test tests/Local --network development`.
+
+token_prices = {
+    "WETH": 2_000,
+    "USDT": 1,
+    "USDC": 1,
+}
+
+# USD prices of the price_oracle fixture, the reward market below has STG at the same price
+ETH = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
+PRICES = {"ETH": 2_000, "STG": 0.5, "USDC": 1, "USDT": 1, "WETH": 2_000}
+
+token_isWeth = {
+    "USDC": False,  # USDC
+    "USDT": False,  # USDT
+    "WETH": True,  # WETH
+}
+
+
+@pytest.fixture(autouse=True)
+def isolation(fn_isolation):
+    pass
+
+
+@pytest.fixture(scope="module", autouse=True)
+def shared_setup(module_isolation):
+    pass
+
+
+# module_isolation resets the chain, so the mock stack has to live at module scope.
+@pytest.fixture(scope="module")
+def stargate_stack(shared_setup, accounts):
+    yield deploy_stargate_stack(accounts[9])
+
+
+@pytest.fixture(
+    params=[
+        "USDC",  # USDC
+        "USDT",  # USDT
+        "WETH",  # WETH
+    ],
+    scope="module",
+    autouse=True,
+)
+def token(request, stargate_stack):
+    yield stargate_stack.tokens[request.param]
+
+
+# The mock stack has STG-style rewards:
+@pytest.fixture
+def emissionTokenIsSTG():
+    yield True
+
+
+@pytest.fixture
+def token_lp(token, stargate_stack):
+    yield stargate_stack.pools[token.symbol()]
+
+
+@pytest.fixture
+def wantIsWeth(token):
+    yield token_isWeth[token.symbol()]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def token_whale(accounts, token, stargate_stack):
+    # the whale holds the want supply and seeds the pool, so there is LP and deltaCredit to play with
+    whale = accounts[9]
+    units = round(10_000_000 / token_prices[token.symbol()]) * 10 ** token.decimals()
+    fund_account(stargate_stack, token.symbol(), whale, units)
+    add_liquidity(stargate_stack, token.symbol(), whale, units)
+    yield whale
+
+
+@pytest.fixture
+def token_LP_whale(token_whale):
+    yield token_whale
+
+
+@pytest.fixture(autouse=True)
+def amount(token, token_whale, user):
+    amount = round(100_000 / token_prices[token.symbol()]) * 10 ** token.decimals()
+    token.transfer(user, amount, {"from": token_whale})
+    yield amount
+
+
+@pytest.fixture(autouse=True)
+def amount2(token, token_whale, user2):
+    amount = round(100_000 / token_prices[token.symbol()]) * 10 ** token.decimals()
+    token.transfer(user2, amount, {"from": token_whale})
+    yield amount
+
+
+@pytest.fixture(autouse=True)
+def amountBIG(token, token_whale, userBIG):
+    amount = round(1_000_000 / token_prices[token.symbol()]) * 10 ** token.decimals()
+    token.transfer(userBIG, amount, {"from": token_whale})
+    yield amount
+
+
+@pytest.fixture
+def gov(accounts):
+    yield accounts[8]
+
+
+@pytest.fixture
+def user(accounts):
+    yield accounts[0]
+
+
+@pytest.fixture
+def user2(accounts):
+    yield accounts[6]
+
+
+@pytest.fixture
+def userBIG(accounts):
+    yield accounts[7]
+
+
+@pytest.fixture
+def rewards(accounts):
+    yield accounts[1]
+
+
+@pytest.fixture
+def guardian(accounts):
+    yield accounts[2]
+
+
+@pytest.fixture
+def management(accounts):
+    yield accounts[3]
+
+
+@pytest.fixture
+def strategist(accounts):
+    yield accounts[4]
+
+
+@pytest.fixture
+def keeper(accounts):
+    yield accounts[5]
+
+
+@pytest.fixture
+def stg_token(stargate_stack):
+    yield stargate_stack.reward
+
+
+@pytest.fixture
+def lp_staker(stargate_stack):
+    yield stargate_stack.lp_staker
+
+
+@pytest.fixture
+def stargate_router(stargate_stack):
+    yield stargate_stack.router
+
+
+@pytest.fixture
+def stargate_token_pool(token_lp):
+    yield token_lp
+
+
+@pytest.fixture
+def liquidity_pool_id_in_lp_staking(token, stargate_stack):
+    yield stargate_stack.lp_staking_ids[token.symbol()]
+
+
+@pytest.fixture
+def weth(stargate_stack):
+    yield stargate_stack.tokens["WETH"]
+
+
+@pytest.fixture
+def vault(pm, gov, rewards, guardian, management, token):
+    Vault = pm(config["dependencies"][0]).Vault
+    vault = guardian.deploy(Vault)
+    vault.initialize(token, gov, rewards, "", "", guardian, management, {"from": gov})
+    vault.setDepositLimit(2 ** 256 - 1, {"from": gov})
+    vault.setManagement(management, {"from": gov})
+    yield vault
+
+
+@pytest.fixture
+def strategy(
+    strategist,
+    token,
+    keeper,
+    vault,
+    Strategy,
+    gov,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    wantIsWeth,
+    emissionTokenIsSTG,
+    BaseFeeDummy,
+):
+    strategy = strategist.deploy(
+        Strategy,
+        vault,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        f"StrategyStargate{token.symbol()}",
+    )
+    strategy.setKeeper(keeper, {"from": gov})
+    strategy.setDoHealthCheck(False, {"from": gov})
+    strategy.setHealthCheck(ZERO_ADDRESS, {"from": gov})
+    # the hard-coded base fee oracle does not exist on a dev chain
+    baseFeeDummy = BaseFeeDummy.deploy(gov, {"from": strategist})
+    strategy.setBaseFeeOracle(baseFeeDummy, {"from": gov})
+    vault.addStrategy(strategy, 10_000, 0, 2 ** 256 - 1, 1_000, {"from": gov})
+
+    yield strategy
+
+
+@pytest.fixture
+def strategy_factory(strategist, strategy, StrategyFactory):
+    yield strategist.deploy(StrategyFactory, strategy)
+
+
+# a reward/want constant-product pair with the reward token at $0.50
+@pytest.fixture
+def uniswap_router(stargate_stack, token, accounts):
+    reward_amount = 1_000_000 * 10 ** 18
+    want_amount = round(500_000 / token_prices[token.symbol()]) * 10 ** token.decimals()
+    yield deploy_reward_market(
+        stargate_stack, token.symbol(), accounts[9], reward_amount, want_amount
+    )
+
+
+@pytest.fixture
+def swapper(uniswap_router, gov, UniswapV2Swapper):
+    yield gov.deploy(UniswapV2Swapper, uniswap_router)
+
+
+# STG and native ETH at PRICES, in want
+@pytest.fixture
+def price_oracle(gov, token, stg_token, MockPriceOracle):
+    oracle = gov.deploy(MockPriceOracle)
+    for token_in, symbol in ((ETH, "ETH"), (stg_token, "STG")):
+        rate = int(PRICES[symbol] * 10 ** token.decimals() / PRICES[token.symbol()])
+        oracle.setRate(token_in, token, rate, {"from": gov})
+    yield oracle
+
+
+@pytest.fixture(scope="session")
+def RELATIVE_APPROX():
+    yield 1e-5
@@ -0,0 +1,134 @@
+import brownie
+import pytest
+
+
+@pytest.fixture
+def deposited(chain, token, vault, strategy, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+
+def test_rewards_wait_for_yswaps_by_default(chain, strategy, gov, deposited):
+    assert strategy.swapper() == brownie.ZERO_ADDRESS
+    chain.mine(10)
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert strategy.balanceOfReward() > 0
+    assert tx.events["Harvested"]["profit"] == 0
+
+
+def test_harvest_sells_rewards_in_line(
+    chain,
+    token,
+    vault,
+    strategy,
+    swapper,
+    price_oracle,
+    stg_token,
+    gov,
+    amount,
+    RELATIVE_APPROX,
+    deposited,
+):
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    strategy.setSwapper(swapper, {"from": gov})
+    chain.mine(10)
+    chain.sleep(1)
+    pending = strategy.pendingRewards()
+    tx = strategy.harvest({"from": gov})
+
+    assert strategy.balanceOfReward() == 0
+    assert stg_token.allowance(strategy, swapper) > 0
+    profit = tx.events["Harvested"]["profit"]
+    assert profit >= price_oracle.quote(stg_token, token, pending) * 99 // 100
+    # the profit went back into the pool in the same transaction
+    assert strategy.balanceOfWant() == 0
+    assert (
+        pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX)
+        == amount + profit
+    )
+    assert vault.strategies(strategy)["totalGain"] == profit
+
+
+def test_harvest_reverts_beyond_max_slippage(
+    chain, strategy, swapper, price_oracle, uniswap_router, gov, deposited
+):
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    strategy.setSwapper(swapper, {"from": gov})
+    uniswap_router.setSkim(200, {"from": gov})
+    chain.mine(10)
+    chain.sleep(1)
+    with brownie.reverts("UniswapV2Router: INSUFFICIENT_OUTPUT_AMOUNT"):
+        strategy.harvest({"from": gov})
+
+    strategy.setMaxSlippage(300, {"from": gov})
+    strategy.harvest({"from": gov})
+    assert strategy.balanceOfReward() == 0
+
+
+def test_harvest_reverts_after_the_pool_is_moved(
+    chain,
+    token,
+    strategy,
+    swapper,
+    price_oracle,
+    uniswap_router,
+    stg_token,
+    gov,
+    user,
+    deposited,
+):
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    strategy.setSwapper(swapper, {"from": gov})
+    chain.mine(10)
+    chain.sleep(1)
+    # dump STG into the pair right before the harvest: the pool now pays ~30% less want for it
+    dump = uniswap_router.reserves(stg_token, token) // 5
+    stg_token.mint(user, dump, {"from": user})
+    stg_token.approve(uniswap_router, dump, {"from": user})
+    uniswap_router.swapExactTokensForTokens(
+        dump, 0, [stg_token, token], user, chain.time() + 60, {"from": user}
+    )
+    rewards = strategy.pendingRewards() + strategy.balanceOfReward()
+    assert (
+        swapper.quote(stg_token, token, rewards)
+        < price_oracle.quote(stg_token, token, rewards)
+        * (10_000 - strategy.maxSlippage())
+        // 10_000
+    )
+
+    with brownie.reverts("UniswapV2Router: INSUFFICIENT_OUTPUT_AMOUNT"):
+        strategy.harvest({"from": gov})
+
+
+def test_swap_route(strategy, swapper, stg_token, token, weth, gov):
+    assert swapper.path(stg_token, token) == [stg_token.address, token.address]
+    route = [stg_token.address, weth.address, token.address]
+    swapper.setPath(route, {"from": gov})
+    assert swapper.path(stg_token, token) == route
+    # the mock router only has the STG/want pair, so one leg of the new route has no liquidity
+    with brownie.reverts("UniswapV2Library: INSUFFICIENT_LIQUIDITY"):
+        swapper.quote(stg_token, token, 10 ** 18)
+    with brownie.reverts("Ownable: caller is not the owner"):
+        swapper.setPath([stg_token, token], {"from": strategy.strategist()})
+
+
+def test_unset_swapper(strategy, swapper, price_oracle, stg_token, gov, management):
+    # swaps are bounded by the oracle, so there is no swapper without one
+    with brownie.reverts():
+        strategy.setSwapper(swapper, {"from": gov})
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    with brownie.reverts():
+        strategy.setSwapper(swapper, {"from": management})
+    strategy.setSwapper(swapper, {"from": gov})
+    with brownie.reverts():
+        strategy.setPriceOracle(brownie.ZERO_ADDRESS, {"from": gov})
+    strategy.setSwapper(brownie.ZERO_ADDRESS, {"from": gov})
+    assert strategy.swapper() == brownie.ZERO_ADDRESS
+    assert stg_token.allowance(strategy, swapper) == 0
+    strategy.setPriceOracle(brownie.ZERO_ADDRESS, {"from": gov})
+
+    with brownie.reverts():
+        strategy.setMaxSlippage(10_001, {"from": gov})
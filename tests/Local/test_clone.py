@@ -0,0 +1,175 @@
+from brownie import chain, reverts, Contract, ZERO_ADDRESS
+
+CLONE_SALT = "0x" + "00" * 31 + "01"
+
+
+def test_double_init_should_revert(
+    strategy,
+    strategy_factory,
+    vault,
+    strategist,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    gov,
+    keeper,
+    rewards,
+    wantIsWeth,
+    emissionTokenIsSTG,
+):
+    clone_tx = strategy_factory.clone(
+        vault,
+        strategist,
+        rewards,
+        keeper,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        "ClonedStrategy",
+        CLONE_SALT,
+        {"from": strategist},
+    )
+
+    cloned_strategy = Contract.from_abi(
+        "Strategy", clone_tx.events["Cloned"]["clone"], strategy.abi
+    )
+
+    with reverts():
+        strategy.initialize(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            "RevertedStrat",
+            {"from": gov},
+        )
+
+    with reverts():
+        cloned_strategy.initialize(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            "ClonedRevertedStrat",
+            {"from": gov},
+        )
+
+
+def test_clone(
+    strategy,
+    strategy_factory,
+    vault,
+    strategist,
+    token,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    gov,
+    keeper,
+    rewards,
+    token_whale,
+    amount,
+    wantIsWeth,
+    emissionTokenIsSTG,
+):
+    clone_tx = strategy_factory.clone(
+        vault,
+        strategist,
+        rewards,
+        keeper,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        "ClonedStrategy",
+        CLONE_SALT,
+        {"from": strategist},
+    )
+
+    cloned_strategy = Contract.from_abi(
+        "Strategy", clone_tx.events["Cloned"]["clone"], strategy.abi
+    )
+    # the hard-coded health check and base fee oracle do not exist on a dev chain
+    cloned_strategy.setBaseFeeOracle(strategy.baseFeeOracle(), {"from": gov})
+    cloned_strategy.setHealthCheck(ZERO_ADDRESS, {"from": gov})
+
+    vault.updateStrategyDebtRatio(strategy, 0, {"from": gov})
+    vault.addStrategy(cloned_strategy, 10_000, 0, 2 ** 256 - 1, 0, {"from": gov})
+
+    token.approve(vault, 2 ** 256 - 1, {"from": token_whale})
+    vault.deposit(amount, {"from": token_whale})
+
+    chain.sleep(1)
+    cloned_strategy.harvest({"from": gov})
+
+    # Sleep for 2 days
+    chain.sleep(60 * 60 * 24 * 2)
+    chain.mine(1)
+    cloned_strategy.harvest({"from": gov})
+
+    assert (
+        vault.strategies(cloned_strategy).dict()["totalLoss"] < 10
+    )  # might be a loss from rounding
+
+
+def test_clone_address_and_config(
+    strategy,
+    strategy_factory,
+    vault,
+    strategist,
+    rewards,
+    keeper,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    wantIsWeth,
+    emissionTokenIsSTG,
+):
+    args = strategy_factory.cloneArgs(
+        lp_staker, liquidity_pool_id_in_lp_staking, wantIsWeth, emissionTokenIsSTG
+    )
+    predicted = strategy_factory.predictCloneAddress(strategist, args, CLONE_SALT)
+    clone_tx = strategy_factory.clone(
+        vault,
+        strategist,
+        rewards,
+        keeper,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        "ClonedStrategy",
+        CLONE_SALT,
+        {"from": strategist},
+    )
+    assert clone_tx.events["Cloned"]["clone"] == predicted
+
+    cloned_strategy = Contract.from_abi("Strategy", predicted, strategy.abi)
+    assert cloned_strategy.original() == strategy
+    assert cloned_strategy.lpStaker() == strategy.lpStaker()
+    assert cloned_strategy.liquidityPool() == strategy.liquidityPool()
+    assert cloned_strategy.stargateRouter() == strategy.stargateRouter()
+    assert cloned_strategy.reward() == strategy.reward()
+    assert (
+        cloned_strategy.liquidityPoolIDInLPStaking()
+        == strategy.liquidityPoolIDInLPStaking()
+    )
+    assert cloned_strategy.liquidityPoolID() == strategy.liquidityPoolID()
+    assert cloned_strategy.wantIsWETH() == strategy.wantIsWETH()
+    assert cloned_strategy.emissionTokenIsSTG() == strategy.emissionTokenIsSTG()
+    assert cloned_strategy.name() == "ClonedStrategy"
+
+    # a salt can only be used once per deployer, but another deployer gets its own address
+    with reverts():
+        strategy_factory.clone(
+            vault,
+            strategist,
+            rewards,
+            keeper,
+            lp_staker,
+            liquidity_pool_id_in_lp_staking,
+            wantIsWeth,
+            emissionTokenIsSTG,
+            "ClonedStrategy",
+            CLONE_SALT,
+            {"from": strategist},
+        )
+    assert strategy_factory.predictCloneAddress(keeper, args, CLONE_SALT) != predicted
@@ -0,0 +1,251 @@
+import pytest
+from brownie import ZERO_ADDRESS
+
+from scripts.mock_stargate import accrue_fees
+
+
+def test_limited_delta_credit_profit(
+    chain,
+    token,
+    vault,
+    strategy,
+    user,
+    amount,
+    RELATIVE_APPROX,
+    gov,
+    token_LP_whale,
+    stargate_token_pool,
+):
+    # 1- Deposit to the vault
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    assert token.balanceOf(vault.address) == amount
+
+    # 2- Harvest
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
+
+    # 3- Simulate profit via want airdrop of S*token
+    chain.sleep(1)
+    stargate_token_pool.transfer(strategy.address, amount, {"from": token_LP_whale})
+
+    # 4- Ensure that there is no sufficient deltaCredit
+    stargate_token_pool.setDeltaCredit(0, {"from": gov})
+
+    # 5- Call another harvest and see if profit is repported correctly
+    assert stargate_token_pool.deltaCredit() < amount
+    vault.updateStrategyDebtRatio(strategy.address, 0, {"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert vault.debtOutstanding(strategy) > 0
+
+
+def test_partial_delta_credit_redeems_what_is_available(
+    chain, token, vault, strategy, user, amount, gov, stargate_token_pool
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    staked = strategy.balanceOfStakedLPToken()
+
+    # a third of our position can be redeemed instantly
+    available = amount // 3 // stargate_token_pool.convertRate()
+    stargate_token_pool.setDeltaCredit(available, {"from": gov})
+
+    vault.updateStrategyDebtRatio(strategy.address, 0, {"from": gov})
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+
+    assert tx.events["StrategyReported"]["loss"] == 0
+    assert stargate_token_pool.deltaCredit() < available // 100
+    # only the redeemable LP left the farm
+    assert 0 < strategy.balanceOfStakedLPToken() < staked
+    assert strategy.balanceOfUnstakedLPToken() == 0
+    assert vault.debtOutstanding(strategy) > 0
+
+
+def test_harvest_trigger_skips_without_delta_credit(
+    chain,
+    token,
+    vault,
+    strategy,
+    user,
+    amount,
+    gov,
+    management,
+    stargate_stack,
+    stargate_token_pool,
+    lp_staker,
+    price_oracle,
+    token_whale,
+):
+    # no rewards accrue, so only LP fees are left to harvest
+    lp_staker.setRewardPerBlock(0, {"from": gov})
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    vault.updateStrategyDebtRatio(strategy.address, 0, {"from": gov})
+    credit = stargate_token_pool.deltaCredit()
+    stargate_token_pool.setDeltaCredit(0, {"from": gov})
+
+    # fees worth many harvests, but none of them can be redeemed
+    accrue_fees(stargate_stack, token.symbol(), token_whale, amount // 100)
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    call_cost = 10 ** 9
+    assert strategy.pendingRewards() + strategy.balanceOfReward() == 0
+    assert not strategy.harvestTrigger(call_cost)
+
+    # a manual harvest is still let through
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    assert strategy.harvestTrigger(call_cost)
+    strategy.setForceHarvestTriggerOnce(False, {"from": gov})
+
+    # so is unstaked LP a harvest would stake
+    strategy.unstakeLP(strategy.balanceOfStakedLPToken() // 2, {"from": management})
+    assert strategy.harvestTrigger(call_cost)
+    strategy.tend({"from": gov})
+    assert not strategy.harvestTrigger(call_cost)
+
+    # and so are rewards, sold in the harvest or claimed there for yswaps
+    lp_staker.setRewardPerBlock(10 ** 18, {"from": gov})
+    chain.mine(1)
+    assert strategy.swapper() == ZERO_ADDRESS
+    assert strategy.harvestTrigger(call_cost)
+    lp_staker.setRewardPerBlock(0, {"from": gov})
+    strategy.harvest({"from": gov})
+    strategy.sweep(strategy.reward(), {"from": gov})
+    assert not strategy.harvestTrigger(call_cost)
+
+    stargate_token_pool.setDeltaCredit(credit, {"from": gov})
+    assert strategy.harvestTrigger(call_cost)
+
+    # the delays harvest no matter what, e.g. to claim the rewards yswaps sells
+    stargate_token_pool.setDeltaCredit(0, {"from": gov})
+    assert not strategy.harvestTrigger(call_cost)
+    chain.sleep(strategy.minReportDelay() + 1)
+    chain.mine()
+    assert strategy.harvestTrigger(call_cost)
+
+
+def test_queue_redeem_local_frees_debt_without_delta_credit(
+    chain,
+    token,
+    vault,
+    strategy,
+    user,
+    amount,
+    gov,
+    stargate_token_pool,
+    stargate_router,
+    RELATIVE_APPROX,
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    stargate_token_pool.setDeltaCredit(0, {"from": gov})
+    vault.updateStrategyDebtRatio(strategy.address, 0, {"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert pytest.approx(vault.debtOutstanding(strategy), rel=RELATIVE_APPROX) == amount
+
+    # queue the whole position with a remote chain, and have it answer
+    assets = strategy.estimatedTotalAssets()
+    strategy.queueRedeemLocal(
+        101, stargate_token_pool.poolId(), strategy.balanceOfAllLPToken(), {"from": gov}
+    )
+    assert strategy.balanceOfAllLPToken() == 0
+    assert strategy.estimatedTotalAssets() == assets
+    stargate_router.deliverRedeemLocal(
+        stargate_router.queuedRedeemsLength() - 1, {"from": gov}
+    )
+
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert tx.events["StrategyReported"]["loss"] < 10
+    assert vault.debtOutstanding(strategy) < 10
+    assert pytest.approx(token.balanceOf(vault), rel=RELATIVE_APPROX) == amount
+    assert strategy.queuedRedeemLD() == 0
+
+
+def test_harvest_before_queued_redeem_arrives_books_no_loss(
+    chain,
+    token,
+    vault,
+    strategy,
+    user,
+    amount,
+    gov,
+    stargate_token_pool,
+    stargate_router,
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    stargate_token_pool.setDeltaCredit(0, {"from": gov})
+    lp = strategy.balanceOfAllLPToken() // 2
+    value = stargate_token_pool.amountLPtoLD(lp)
+    strategy.queueRedeemLocal(101, stargate_token_pool.poolId(), lp, {"from": gov})
+    assert strategy.queuedRedeemLD() == value
+
+    # the remote chain has not answered yet
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert tx.events["StrategyReported"]["loss"] == 0
+    assert vault.strategies(strategy)["totalDebt"] == amount
+
+    # and a withdrawal that cannot be paid now is not booked as a loss either
+    vault.withdraw(vault.balanceOf(user) // 4, user, 10_000, {"from": user})
+    assert vault.strategies(strategy)["totalLoss"] == 0
+
+    stargate_router.deliverRedeemLocal(
+        stargate_router.queuedRedeemsLength() - 1, {"from": gov}
+    )
+    chain.sleep(1)
+    assert strategy.harvest({"from": gov}).events["StrategyReported"]["loss"] == 0
+    assert strategy.queuedRedeemLD() == 0
+
+
+def test_harvest_after_queued_redeem_arrives_reports_no_profit(
+    chain,
+    token,
+    vault,
+    strategy,
+    user,
+    amount,
+    gov,
+    stargate_token_pool,
+    stargate_router,
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    stargate_token_pool.setDeltaCredit(0, {"from": gov})
+    lp = strategy.balanceOfAllLPToken() // 2
+    strategy.queueRedeemLocal(101, stargate_token_pool.poolId(), lp, {"from": gov})
+    assets = strategy.estimatedTotalAssets()
+
+    # the payout is not counted a second time, neither before nor by the harvest that settles it
+    stargate_router.deliverRedeemLocal(
+        stargate_router.queuedRedeemsLength() - 1, {"from": gov}
+    )
+    assert strategy.estimatedTotalAssets() == assets
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert tx.events["StrategyReported"]["gain"] == 0
+    assert tx.events["StrategyReported"]["loss"] == 0
+    assert vault.strategies(strategy)["totalDebt"] == amount
+    assert strategy.queuedRedeemLD() == 0
+
+    # nor is there anything left to settle by hand that a later harvest books as a loss
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert tx.events["StrategyReported"]["loss"] == 0
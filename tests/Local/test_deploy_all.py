@@ -0,0 +1,68 @@
+from brownie import config
+
+from scripts.deploy_all import deploy_all
+
+SYMBOLS = ("USDC", "USDT", "WETH")
+
+
+def deploy_vaults(pm, stargate_stack, gov, rewards, guardian, management):
+    Vault = pm(config["dependencies"][0]).Vault
+    vaults = []
+    for symbol in SYMBOLS:
+        vault = guardian.deploy(Vault)
+        vault.initialize(
+            stargate_stack.tokens[symbol],
+            gov,
+            rewards,
+            "",
+            "",
+            guardian,
+            management,
+            {"from": gov},
+        )
+        vaults.append(vault)
+    return vaults
+
+
+def test_deploy_all(pm, stargate_stack, gov, rewards, guardian, management, strategist):
+    vaults = deploy_vaults(pm, stargate_stack, gov, rewards, guardian, management)
+
+    strategies, factory = deploy_all(
+        strategist, [vault.address for vault in vaults], stargate_stack.lp_staker
+    )
+
+    assert len(strategies) == 3
+    assert all(strategy.original() == strategies[0] for strategy in strategies)
+    assert factory.original() == strategies[0]
+    for symbol, vault, strategy in zip(SYMBOLS, vaults, strategies):
+        assert strategy.vault() == vault
+        assert strategy.want() == stargate_stack.tokens[symbol]
+        assert strategy.liquidityPool() == stargate_stack.pools[symbol]
+        assert (
+            strategy.liquidityPoolIDInLPStaking()
+            == stargate_stack.lp_staking_ids[symbol]
+        )
+        assert strategy.wantIsWETH() == (symbol == "WETH")
+        assert strategy.strategist() == strategist
+        assert strategy.name() == f"StrategyStargate{symbol}"
+
+
+def test_deploy_all_hands_over_roles(
+    pm, stargate_stack, gov, rewards, guardian, management, strategist, keeper, user
+):
+    # the deployer is neither the vaults' governance nor any of the strategies' roles
+    vaults = deploy_vaults(pm, stargate_stack, gov, rewards, guardian, management)
+
+    strategies, _ = deploy_all(
+        user,
+        [vault.address for vault in vaults],
+        stargate_stack.lp_staker,
+        strategist=strategist,
+        rewards=rewards,
+        keeper=keeper,
+    )
+
+    for strategy in strategies:
+        assert strategy.strategist() == strategist
+        assert strategy.keeper() == keeper
+        assert strategy.rewards() == rewards
@@ -0,0 +1,66 @@
+import json
+
+import pytest
+import yaml
+from brownie import Strategy
+
+from scripts.deploy import deploy_from_manifest, load_manifest
+
+MANIFEST = "manifests/development.yml"
+
+
+def test_deploy_from_manifest(tmp_path):
+    record_path = tmp_path / "development.json"
+    record = deploy_from_manifest(MANIFEST, record_path)
+
+    assert json.loads(record_path.read_text()) == record
+    assert len(record["strategies"]) == 3
+    assert all(action["tx"] is not None for action in record["governance_actions"])
+    for symbol, entry in zip(("USDC", "USDT", "WETH"), record["strategies"]):
+        strategy = Strategy.at(entry["strategy"])
+        assert strategy.original() == record["original"]
+        assert strategy.vault() == entry["vault"]
+        assert strategy.want() == entry["want"]
+        assert strategy.liquidityPoolIDInLPStaking() == entry["pool_id"]
+        assert strategy.wantIsWETH() == (symbol == "WETH")
+        assert strategy.name() == f"StrategyStargate{symbol}"
+
+
+def test_deploy_from_manifest_hands_over_roles(tmp_path, strategist, keeper, rewards):
+    manifest = load_manifest(MANIFEST)
+    manifest.update(
+        strategist=strategist.address, keeper=keeper.address, rewards=rewards.address
+    )
+    path = tmp_path / "manifest.yml"
+    path.write_text(yaml.safe_dump(manifest))
+
+    record = deploy_from_manifest(path, tmp_path / "development.json")
+
+    for entry in record["strategies"]:
+        strategy = Strategy.at(entry["strategy"])
+        assert strategy.strategist() == strategist
+        assert strategy.keeper() == keeper
+        assert strategy.rewards() == rewards
+
+
+def test_manifest_errors_are_reported_together(tmp_path, stargate_stack, strategist):
+    manifest = {
+        "network": "development",
+        "lp_staker": stargate_stack.lp_staker.address,
+        "keeper": "not-an-address",
+        "strategies": [
+            {"want": stargate_stack.tokens["USDC"].address},
+            {"vault": strategist.address},
+        ],
+    }
+    path = tmp_path / "manifest.yml"
+    path.write_text(yaml.safe_dump(manifest))
+
+    with pytest.raises(ValueError) as error:
+        deploy_from_manifest(path, tmp_path / "record.json")
+
+    assert "keeper: 'not-an-address'" in str(error.value)
+    assert f"strategies[1].vault: no contract at {strategist.address}" in str(
+        error.value
+    )
+    assert not (tmp_path / "record.json").exists()
@@ -0,0 +1,112 @@
+from brownie import ZERO_ADDRESS, Contract, chain, interface
+
+from scripts.event_indexer import LP_RATE_UNIT, EventIndexer, EventStore
+
+CLONE_SALT = "0x" + "00" * 31 + "01"
+
+
+def test_indexes_harvests_reports_and_clones(
+    tmp_path,
+    strategy,
+    strategy_factory,
+    vault,
+    token,
+    user,
+    amount,
+    gov,
+    strategist,
+    rewards,
+    keeper,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    wantIsWeth,
+    emissionTokenIsSTG,
+):
+    start = chain.height + 1
+    token.approve(vault, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    harvest = strategy.harvest({"from": gov})
+
+    indexer = EventIndexer(
+        tmp_path / "index.sqlite",
+        [strategy_factory],
+        [strategy],
+        from_block=start,
+        batch_size=2,
+        harvest_state=True,
+    )
+    assert indexer.sync() > 0
+    assert indexer.store.checkpoint == chain.height
+    (row,) = indexer.store.rows("harvests", strategy.address)
+    assert row["tx_hash"] == harvest.txid
+    assert int(row["profit"]) == harvest.events["Harvested"]["profit"]
+    (report,) = indexer.store.rows("reports", strategy.address)
+    assert report["vault"] == vault.address
+    assert int(report["total_debt"]) == vault.strategies(strategy)["totalDebt"]
+    (state,) = indexer.store.rows("harvest_state", strategy.address)
+    assert int(state["lp_balance"]) == strategy.balanceOfAllLPToken()
+    assert int(state["lp_rate"]) == interface.IPool(
+        strategy.liquidityPool()
+    ).amountLPtoLD(LP_RATE_UNIT)
+    (deposit,) = indexer.store.rows("lp_staking", strategy.address)
+    assert deposit["event"] == "Deposit"
+    assert deposit["lp_staker"] == lp_staker.address
+    assert int(deposit["amount"]) == harvest.events["Deposit"]["amount"]
+    assert (
+        indexer.store.db.execute(
+            "SELECT timestamp FROM blocks WHERE number = ?", (harvest.block_number,)
+        ).fetchone()[0]
+        == chain[harvest.block_number].timestamp
+    )
+
+    # nothing new: the checkpoint moves, no rows are added twice
+    chain.mine(3)
+    assert indexer.sync() == 0
+    assert len(indexer.store.rows("harvests")) == 1
+
+    # a clone of the factory is picked up from its Cloned event, in the same range as its
+    # first harvest
+    clone_tx = strategy_factory.clone(
+        vault,
+        strategist,
+        rewards,
+        keeper,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        "ClonedStrategy",
+        CLONE_SALT,
+        {"from": strategist},
+    )
+    clone = Contract.from_abi(
+        "Strategy", clone_tx.events["Cloned"]["clone"], strategy.abi
+    )
+    # the hard-coded health check and base fee oracle do not exist on a dev chain
+    clone.setBaseFeeOracle(strategy.baseFeeOracle(), {"from": gov})
+    clone.setHealthCheck(ZERO_ADDRESS, {"from": gov})
+    vault.updateStrategyDebtRatio(strategy, 0, {"from": gov})
+    vault.addStrategy(clone, 10_000, 0, 2 ** 256 - 1, 0, {"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    clone_harvest = clone.harvest({"from": gov})
+
+    # a fresh indexer on the same store resumes from the checkpoint
+    indexer.store.close()
+    resumed = EventIndexer(EventStore(tmp_path / "index.sqlite"), [strategy_factory])
+    resumed.sync()
+    (cloned,) = resumed.store.rows("clones")
+    assert cloned["clone"] == clone.address
+    assert cloned["factory"] == strategy_factory.address
+    assert resumed.store.strategies()[clone.address]["vault"] == vault.address
+    assert [
+        row["tx_hash"] for row in resumed.store.rows("harvests", clone.address)
+    ] == [clone_harvest.txid]
+    assert len(resumed.store.rows("harvests", strategy.address)) == 2
+    assert {
+        row["event"] for row in resumed.store.rows("lp_staking", strategy.address)
+    } >= {
+        "Deposit",
+        "Withdraw",
+    }
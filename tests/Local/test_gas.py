@@ -0,0 +1,249 @@
+import os
+
+import pytest
+from brownie import Contract, ZERO_ADDRESS
+
+from scripts.gas_benchmark import GasReport
+from scripts.gas_profiler import GasProfile
+
+CLONE_SALT = "0x" + "00" * 31 + "01"
+
+# Gas regression suite for the Strategy entry points. Every scenario is checked against
+# tests/Local/gas_baseline.json and the full table is written to reports/gas_benchmark.{json,md}.
+# A scenario missing from the baseline fails, and every scenario is skipped while there is no
+# baseline file at all; UPDATE_GAS_BASELINE=1 records the baseline instead of checking it. With GAS_PROFILE=1 the call trace of every scenario is profiled into
+# reports/gas_profile/.
+UPDATE_BASELINE = bool(os.environ.get("UPDATE_GAS_BASELINE"))
+
+
+@pytest.fixture(scope="module")
+def gas_report():
+    report = GasReport()
+    yield report
+    report.write()
+    if UPDATE_BASELINE:
+        report.save_baseline()
+
+
+@pytest.fixture
+def record_gas(gas_report, token):
+    def record(name, tx):
+        scenario = f"{name}[{token.symbol()}]"
+        gas_report.record(scenario, tx.gas_used)
+        if os.environ.get("GAS_PROFILE"):
+            GasProfile.from_tx(tx).write(scenario)
+        if UPDATE_BASELINE:
+            return
+        if not gas_report.baseline_path.exists():
+            pytest.skip(
+                f"no gas baseline at {gas_report.baseline_path}, record it with "
+                "UPDATE_GAS_BASELINE=1 and commit it"
+            )
+        gas_report.check(scenario)
+
+    yield record
+
+
+@pytest.fixture
+def deposited(chain, token, vault, strategy, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+
+def test_gas_harvest_deposit(
+    chain, token, vault, strategy, user, amount, gov, record_gas
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    record_gas("harvest_deposit", strategy.harvest({"from": gov}))
+
+
+def test_gas_harvest_staked_rewards(chain, strategy, gov, deposited, record_gas):
+    chain.mine(10)
+    chain.sleep(1)
+    assert strategy.pendingRewards() > 0
+    record_gas("harvest_staked_rewards", strategy.harvest({"from": gov}))
+
+
+def test_gas_harvest_staked_no_rewards(
+    chain, strategy, gov, lp_staker, deposited, record_gas
+):
+    lp_staker.setRewardPerBlock(0, {"from": gov})
+    strategy.claimRewards({"from": gov})
+    chain.mine(10)
+    chain.sleep(1)
+    assert strategy.pendingRewards() == 0
+    record_gas("harvest_staked_no_rewards", strategy.harvest({"from": gov}))
+
+
+def test_gas_harvest_unstaked(chain, strategy, gov, deposited, record_gas):
+    strategy.unstakeLP(strategy.balanceOfStakedLPToken(), {"from": gov})
+    chain.sleep(1)
+    assert strategy.balanceOfUnstakedLPToken() > 0
+    record_gas("harvest_unstaked", strategy.harvest({"from": gov}))
+
+
+def test_gas_tend(chain, strategy, gov, deposited, record_gas):
+    chain.mine(10)
+    record_gas("tend", strategy.tend({"from": gov}))
+
+
+def test_gas_withdraw(vault, user, deposited, record_gas):
+    record_gas(
+        "withdraw_half", vault.withdraw(vault.balanceOf(user) // 2, {"from": user})
+    )
+
+
+def test_gas_withdraw_all(vault, user, deposited, record_gas):
+    record_gas("withdraw_all", vault.withdraw({"from": user}))
+
+
+def test_gas_withdraw_unstaked(vault, strategy, user, gov, deposited, record_gas):
+    # no LPStaking calls, what is left are the pool reads and the redeem
+    strategy.unstakeLP(strategy.balanceOfStakedLPToken(), {"from": gov})
+    record_gas(
+        "withdraw_unstaked",
+        vault.withdraw(vault.balanceOf(user) // 2, {"from": user}),
+    )
+
+
+def test_gas_withdraw_limited_delta_credit(
+    vault, strategy, user, gov, stargate_token_pool, deposited, record_gas
+):
+    # only part of the request can be redeemed, the rest stays staked
+    stargate_token_pool.setDeltaCredit(
+        stargate_token_pool.deltaCredit() // 4, {"from": gov}
+    )
+    record_gas(
+        "withdraw_limited_delta_credit",
+        vault.withdraw(vault.balanceOf(user) // 2, user, 10_000, {"from": user}),
+    )
+    assert strategy.balanceOfStakedLPToken() > 0
+
+
+def test_gas_deploy(
+    token,
+    Strategy,
+    vault,
+    strategist,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    wantIsWeth,
+    emissionTokenIsSTG,
+    record_gas,
+):
+    # a full deployment, the cost a clone saves
+    strategy = strategist.deploy(
+        Strategy,
+        vault,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        f"StrategyStargate{token.symbol()}",
+    )
+    record_gas("deploy", strategy.tx)
+
+
+def test_gas_clone(
+    strategy_factory,
+    vault,
+    strategist,
+    rewards,
+    keeper,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    wantIsWeth,
+    emissionTokenIsSTG,
+    record_gas,
+):
+    tx = strategy_factory.clone(
+        vault,
+        strategist,
+        rewards,
+        keeper,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        "ClonedStrategy",
+        CLONE_SALT,
+        {"from": strategist},
+    )
+    record_gas("clone", tx)
+
+
+def test_gas_harvest_clone(
+    chain,
+    token,
+    strategy,
+    strategy_factory,
+    vault,
+    strategist,
+    rewards,
+    keeper,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    wantIsWeth,
+    emissionTokenIsSTG,
+    user,
+    amount,
+    gov,
+    record_gas,
+):
+    clone_tx = strategy_factory.clone(
+        vault,
+        strategist,
+        rewards,
+        keeper,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        "ClonedStrategy",
+        CLONE_SALT,
+        {"from": strategist},
+    )
+    cloned_strategy = Contract.from_abi(
+        "Strategy", clone_tx.events["Cloned"]["clone"], strategy.abi
+    )
+    cloned_strategy.setHealthCheck(ZERO_ADDRESS, {"from": gov})
+    vault.updateStrategyDebtRatio(strategy, 0, {"from": gov})
+    vault.addStrategy(cloned_strategy, 10_000, 0, 2 ** 256 - 1, 0, {"from": gov})
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    cloned_strategy.harvest({"from": gov})
+
+    chain.mine(10)
+    chain.sleep(1)
+    record_gas("harvest_clone_staked_rewards", cloned_strategy.harvest({"from": gov}))
+
+
+def test_gas_migration(
+    token,
+    vault,
+    strategy,
+    Strategy,
+    strategist,
+    gov,
+    lp_staker,
+    liquidity_pool_id_in_lp_staking,
+    wantIsWeth,
+    emissionTokenIsSTG,
+    deposited,
+    record_gas,
+):
+    new_strategy = strategist.deploy(
+        Strategy,
+        vault,
+        lp_staker,
+        liquidity_pool_id_in_lp_staking,
+        wantIsWeth,
+        emissionTokenIsSTG,
+        f"StrategyStargate{token.symbol()}",
+    )
+    record_gas("migrate", vault.migrateStrategy(strategy, new_strategy, {"from": gov}))
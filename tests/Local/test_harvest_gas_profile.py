@@ -0,0 +1,30 @@
+from scripts.gas_profiler import GasProfile
+
+# The profiler's accounting is checked on synthetic traces in tests/unit/test_gas_profiler.py,
+# this checks it against the trace of a real harvest.
+
+
+def test_profile_harvest(chain, token, vault, strategy, user, amount, gov):
+    token.approve(vault, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    chain.mine(10)
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+
+    profile = GasProfile.from_tx(tx)
+    functions = profile.functions()
+    assert functions["Strategy.harvest"]["total"] == profile.execution_gas
+    assert profile.execution_gas < tx.gas_used
+    for fn in [
+        "Vault.report",
+        "MockLPStaking.deposit",
+        "MockLPStaking.userInfo",
+        "MockPool.totalLiquidity",
+        "MockPool.convertRate",
+    ]:
+        assert functions[fn]["calls"] > 0
+    assert {"Strategy", "Vault", "MockLPStaking", "MockPool"} <= set(
+        profile.contracts()
+    )
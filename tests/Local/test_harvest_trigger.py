@@ -0,0 +1,152 @@
+import brownie
+import pytest
+
+from scripts.mock_stargate import accrue_fees
+
+PRICES = {"ETH": 2_000, "STG": 0.5, "USDC": 1, "USDT": 1, "WETH": 2_000}
+
+
+@pytest.fixture
+def deposited(chain, token, vault, strategy, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+
+def call_cost_for(strategy, want_amount):
+    # the call cost in ETH that the strategy values at `want_amount`
+    return want_amount * 10 ** 18 // strategy.ethToWant(10 ** 18)
+
+
+def test_eth_to_want(token, strategy, price_oracle, gov):
+    assert strategy.ethToWant(10 ** 18) == 0
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    assert (
+        strategy.ethToWant(10 ** 18)
+        == PRICES["ETH"] * 10 ** token.decimals() // PRICES[token.symbol()]
+    )
+
+
+def test_rewards_trigger_once_worth_the_call(
+    chain, token, strategy, stg_token, price_oracle, gov, deposited
+):
+    chain.mine(10)
+    assert not strategy.harvestTrigger(10 ** 18)
+
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    value = price_oracle.quote(
+        stg_token, token, strategy.pendingRewards() + strategy.balanceOfReward()
+    )
+    assert value > 0
+    factor = strategy.harvestProfitFactor()
+    assert not strategy.harvestTrigger(call_cost_for(strategy, value * 2 // factor))
+    assert strategy.harvestTrigger(call_cost_for(strategy, value // 2 // factor))
+    # a keeper that does not price its call gets the delays only
+    assert not strategy.harvestTrigger(0)
+
+    strategy.setHarvestProfitFactor(factor * 4, {"from": gov})
+    assert not strategy.harvestTrigger(call_cost_for(strategy, value // 2 // factor))
+
+
+def test_lp_fees_trigger(
+    vault,
+    token,
+    strategy,
+    stg_token,
+    stargate_stack,
+    price_oracle,
+    gov,
+    token_whale,
+    deposited,
+):
+    # rewards are worth nothing here, only the fees count
+    price_oracle.setRate(stg_token, token, 0, {"from": gov})
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    fees = vault.strategies(strategy)["totalDebt"] // 100
+    accrue_fees(stargate_stack, token.symbol(), token_whale, fees)
+
+    gain = strategy.estimatedTotalAssets() - vault.strategies(strategy)["totalDebt"]
+    assert gain > 0
+    factor = strategy.harvestProfitFactor()
+    assert not strategy.harvestTrigger(call_cost_for(strategy, gain * 2 // factor))
+    assert strategy.harvestTrigger(call_cost_for(strategy, gain // 2 // factor))
+
+
+def test_trigger_pricing_access(strategy, price_oracle, management, gov):
+    with brownie.reverts():
+        strategy.setPriceOracle(price_oracle, {"from": management})
+    strategy.setHarvestProfitFactor(3, {"from": management})
+    assert strategy.harvestProfitFactor() == 3
+
+
+def test_tend_trigger_deploys_loose_want(
+    vault, token, strategy, amount, gov, management, token_whale, deposited
+):
+    # want that lands between harvests, e.g. rewards sold through yswaps
+    loose = amount // 10
+    token.transfer(strategy, loose, {"from": token_whale})
+    assert not strategy.tendTrigger(0)
+
+    strategy.setTendThreshold(loose // 2, {"from": management})
+    assert strategy.tendTrigger(0)
+    debt = vault.strategies(strategy)["totalDebt"]
+    staked = strategy.balanceOfStakedLPToken()
+    tx = strategy.tend({"from": gov})
+
+    assert "StrategyReported" not in tx.events
+    assert vault.strategies(strategy)["totalDebt"] == debt
+    assert strategy.balanceOfWant() == 0
+    assert strategy.balanceOfStakedLPToken() > staked
+    assert not strategy.tendTrigger(0)
+
+
+def test_tend_trigger_restakes_unstaked_lp(strategy, gov, management, deposited):
+    strategy.unstakeLP(strategy.balanceOfStakedLPToken() // 2, {"from": gov})
+    strategy.setTendThreshold(
+        strategy.estimatedTotalAssets() // 4, {"from": management}
+    )
+    assert strategy.tendTrigger(0)
+
+    strategy.tend({"from": gov})
+    assert strategy.balanceOfUnstakedLPToken() == 0
+    assert not strategy.tendTrigger(0)
+
+
+def test_tend_compounds_rewards(
+    chain, vault, token, strategy, stg_token, swapper, price_oracle, gov, deposited
+):
+    chain.mine(10)
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    value = price_oracle.quote(
+        stg_token, token, strategy.pendingRewards() + strategy.balanceOfReward()
+    )
+    factor = strategy.harvestProfitFactor()
+    # the rewards can only be compounded once there is a swapper to sell them
+    assert not strategy.tendTrigger(call_cost_for(strategy, value // 2 // factor))
+    strategy.setSwapper(swapper, {"from": gov})
+    assert strategy.tendTrigger(call_cost_for(strategy, value // 2 // factor))
+    assert not strategy.tendTrigger(call_cost_for(strategy, value * 2 // factor))
+
+    debt = vault.strategies(strategy)["totalDebt"]
+    assets = strategy.estimatedTotalAssets()
+    tx = strategy.tend({"from": gov})
+    assert "StrategyReported" not in tx.events
+    assert strategy.balanceOfReward() == 0
+    assert strategy.balanceOfWant() == 0
+    assert strategy.estimatedTotalAssets() > assets
+    assert vault.strategies(strategy)["totalDebt"] == debt
+
+    # the compounded rewards are reported by the next harvest
+    chain.sleep(1)
+    assert strategy.harvest({"from": gov}).events["Harvested"]["profit"] > 0
+
+
+def test_tend_trigger_off_in_emergency_exit(
+    token, strategy, amount, gov, management, token_whale, deposited
+):
+    token.transfer(strategy, amount // 10, {"from": token_whale})
+    strategy.setTendThreshold(1, {"from": management})
+    assert strategy.tendTrigger(0)
+    strategy.setEmergencyExit({"from": gov})
+    assert not strategy.tendTrigger(0)
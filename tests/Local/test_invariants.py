@@ -0,0 +1,153 @@
+import os
+
+from brownie import chain
+from brownie.test import strategy as st
+
+from scripts.mock_stargate import accrue_fees
+
+# Stateful fuzzing of the strategy against the mock Stargate stack: Hypothesis draws random
+# sequences of deposits, withdrawals, harvests, debt ratio changes, reward and fee accruals,
+# deltaCredit shocks and emergency exits, and the invariants are checked after every step.
+# Every sequence starts from the same chain snapshot, so a run costs only its transactions.
+#
+#   FUZZ_EXAMPLES=2000 brownie test tests/Local/test_invariants.py --network development
+#
+# A failing sequence is shrunk to a minimal one and printed step by step.
+
+FUZZ_EXAMPLES = int(os.environ.get("FUZZ_EXAMPLES", 25))
+FUZZ_STEPS = int(os.environ.get("FUZZ_STEPS", 20))
+# LP mints and burns round down by up to a unit of the pool's shared decimals per call, which
+# the vault only learns about at the next report
+DUST_PER_STEP = 2
+
+
+class StrategyStateMachine:
+
+    st_user = st("uint8", max_value=1)
+    st_bps = st("uint256", min_value=1, max_value=10_000)
+    st_debt_ratio = st("uint256", max_value=10_000)
+    st_blocks = st("uint256", min_value=1, max_value=50)
+    st_fee_bps = st("uint256", min_value=1, max_value=100)
+    st_delta_credit_bps = st("uint256", max_value=10_000)
+
+    def __init__(
+        cls, stargate_stack, token, token_lp, vault, strategy, lp_staker, users, gov
+    ):
+        cls.stack = stargate_stack
+        cls.token = token
+        cls.pool = token_lp
+        cls.vault = vault
+        cls.strategy = strategy
+        cls.lp_staker = lp_staker
+        cls.pid = strategy.liquidityPoolIDInLPStaking()
+        cls.users = users
+        cls.gov = gov
+        cls.dust_unit = DUST_PER_STEP * token_lp.convertRate()
+
+    def setup(self):
+        self.steps = 0
+
+    def rule_deposit(self, user="st_user", bps="st_bps"):
+        user = self.users[user]
+        amount = self.token.balanceOf(user) * bps // 10_000
+        if amount == 0:
+            return
+        self.token.approve(self.vault, amount, {"from": user})
+        self.vault.deposit(amount, {"from": user})
+
+    def rule_withdraw(self, user="st_user", bps="st_bps"):
+        user = self.users[user]
+        shares = self.vault.balanceOf(user) * bps // 10_000
+        if shares == 0:
+            return
+        requested = shares * self.vault.totalAssets() // self.vault.totalSupply()
+        debt = self.vault.strategies(self.strategy)["totalDebt"]
+        # accept any loss: liquidatePosition has to settle every request without "!check"
+        tx = self.vault.withdraw(shares, user, 10_000, {"from": user})
+        assert tx.status == 1
+        # what the strategy handed over plus the loss it reported is within what was asked
+        freed = debt - self.vault.strategies(self.strategy)["totalDebt"]
+        assert freed <= requested
+        self.steps += 1
+
+    def rule_harvest(self):
+        chain.sleep(1)
+        self.strategy.harvest({"from": self.gov})
+        self.steps += 1
+
+    def rule_debt_ratio(self, debt_ratio="st_debt_ratio"):
+        self.vault.updateStrategyDebtRatio(
+            self.strategy, debt_ratio, {"from": self.gov}
+        )
+
+    def rule_accrue_rewards(self, blocks="st_blocks"):
+        chain.mine(blocks)
+
+    def rule_accrue_fees(self, fee_bps="st_fee_bps"):
+        # up to 1% of the pool's liquidity as swap fees
+        amount = (
+            self.pool.totalLiquidity() * self.pool.convertRate() * fee_bps // 10_000
+        )
+        accrue_fees(self.stack, self.token.symbol(), self.gov, amount)
+
+    def rule_delta_credit_shock(self, bps="st_delta_credit_bps"):
+        # anything from a drained pool to all of its liquidity being redeemable
+        self.pool.setDeltaCredit(
+            self.pool.totalLiquidity() * bps // 10_000, {"from": self.gov}
+        )
+
+    def rule_emergency_exit(self):
+        if not self.strategy.emergencyExit():
+            self.strategy.setEmergencyExit({"from": self.gov})
+
+    def invariant_estimated_total_assets(self):
+        lp_balance = self.pool.balanceOf(self.strategy)
+        staked = self.lp_staker.userInfo(self.pid, self.strategy)["amount"]
+        assert self.strategy.balanceOfAllLPToken() == lp_balance + staked
+        assert self.strategy.valueOfLPTokens() == self.pool.amountLPtoLD(
+            lp_balance + staked
+        )
+        assert (
+            self.strategy.estimatedTotalAssets()
+            == self.token.balanceOf(self.strategy) + self.strategy.valueOfLPTokens()
+        )
+
+    def invariant_no_unreported_loss(self):
+        # the vault never books more debt than the strategy holds, beyond rounding
+        debt = self.vault.strategies(self.strategy)["totalDebt"]
+        assert (
+            debt <= self.strategy.estimatedTotalAssets() + self.steps * self.dust_unit
+        )
+
+
+def test_invariants(
+    state_machine,
+    stargate_stack,
+    token,
+    token_lp,
+    vault,
+    strategy,
+    lp_staker,
+    swapper,
+    price_oracle,
+    user,
+    user2,
+    amount,
+    amount2,
+    gov,
+):
+    # rewards are sold in the harvest, so reward accruals show up as profit
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    strategy.setSwapper(swapper, {"from": gov})
+    state_machine(
+        StrategyStateMachine,
+        stargate_stack,
+        token,
+        token_lp,
+        vault,
+        strategy,
+        lp_staker,
+        [user, user2],
+        gov,
+        settings={"max_examples": FUZZ_EXAMPLES, "stateful_step_count": FUZZ_STEPS},
+    )
@@ -0,0 +1,58 @@
+from scripts.keeper import Keeper
+
+DAY = 24 * 60 * 60
+
+
+def test_keeper_harvests_when_trigger_flips(
+    chain, gov, vault, strategy, token, amount, user, keeper
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    strategy.setMinReportDelay(DAY, {"from": gov})
+
+    bot = Keeper([strategy], keeper)
+    assert bot.config[strategy.address].want == token.address
+    assert bot.tick() == []
+    state = bot.state[strategy.address]
+    assert state.estimated_total_assets == strategy.estimatedTotalAssets()
+    assert not state.harvest_trigger
+
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    txs = bot.tick()
+    assert len(txs) == 1
+    assert txs[0].fn_name == "harvest"
+    assert not strategy.forceHarvestTriggerOnce()
+
+    # the harvest reset the trigger, so nothing is sent until it flips again
+    assert bot.tick() == []
+    chain.sleep(DAY + 1)
+    chain.mine()
+    assert len(bot.tick()) == 1
+
+
+def test_keeper_skips_triggers_that_stay_on(chain, gov, strategy, keeper):
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    bot = Keeper([strategy], keeper)
+    bot.state = bot.poll()
+    assert bot.state[strategy.address].harvest_trigger
+
+    chain.mine()
+    assert bot.tick() == []
+
+
+def test_keeper_retries_failed_sends(chain, gov, strategy, keeper, user):
+    strategy.setForceHarvestTriggerOnce(True, {"from": gov})
+    # not a keeper of the strategy, so the harvest reverts
+    bot = Keeper([strategy], user)
+    assert bot.tick() == []
+    assert strategy.forceHarvestTriggerOnce()
+    assert strategy.address not in bot.state
+
+    # the trigger never went off, but the failed harvest is sent again
+    chain.mine()
+    bot.keeper = keeper
+    txs = bot.tick()
+    assert [tx.fn_name for tx in txs] == ["harvest"]
+    assert bot.state[strategy.address].harvest_trigger
@@ -1,7 +1,3 @@
-# TODO: Add tests that show proper migration of the strategy to a newer one
-#       Use another copy of the strategy to simulate the migration
-#       Show that nothing is lost!
-
 import pytest
 
 
@@ -17,7 +13,6 @@ def test_migration(
     user,
     RELATIVE_APPROX,
     lp_staker,
-    price_feed,
     liquidity_pool_id_in_lp_staking,
     wantIsWeth,
     emissionTokenIsSTG,
@@ -37,8 +32,7 @@ def test_migration(
         liquidity_pool_id_in_lp_staking,
         wantIsWeth,
         emissionTokenIsSTG,
-        #price_feed,
-        "StrategyStargateUSDC",
+        f"StrategyStargate{token.symbol()}",
     )
     previous_debt = vault.strategies(strategy).dict()["totalDebt"]
     vault.migrateStrategy(strategy, new_strategy, {"from": gov})
@@ -0,0 +1,51 @@
+import brownie
+
+
+def test_harvest_skips_dust_claim(chain, token, vault, strategy, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    chain.mine(10)
+    pending = strategy.pendingRewards()
+    assert pending > 0
+    strategy.setMinRewardToClaim(pending * 100, {"from": gov})
+    reward_balance = strategy.balanceOfReward()
+
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert tx.events["RewardClaimSkipped"]["pendingRewards"] > 0
+    assert tx.events["RewardClaimSkipped"]["minRewardToClaim"] == pending * 100
+    assert strategy.balanceOfReward() == reward_balance
+    assert strategy.pendingRewards() > pending
+
+    # once the threshold is met the harvest claims again
+    strategy.setMinRewardToClaim(0, {"from": gov})
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert "RewardClaimSkipped" not in tx.events
+    assert strategy.balanceOfReward() > reward_balance
+    assert strategy.pendingRewards() == 0
+
+
+def test_manual_claim_ignores_threshold(
+    chain, token, vault, strategy, user, amount, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    strategy.setMinRewardToClaim(2 ** 256 - 1, {"from": gov})
+    chain.mine(10)
+    strategy.claimRewards({"from": gov})
+    assert strategy.balanceOfReward() > 0
+    assert strategy.pendingRewards() == 0
+
+
+def test_set_min_reward_to_claim_access(strategy, user, management):
+    with brownie.reverts():
+        strategy.setMinRewardToClaim(1, {"from": user})
+    strategy.setMinRewardToClaim(1, {"from": management})
+    assert strategy.minRewardToClaim() == 1
@@ -0,0 +1,267 @@
+import brownie
+import pytest
+
+# OZ ERC20 refuses transfers to the zero address, so burn LP to the dead address instead
+BURN_ADDRESS = "0x000000000000000000000000000000000000dEaD"
+
+
+def test_operation(
+    chain,
+    accounts,
+    token,
+    vault,
+    strategy,
+    user,
+    strategist,
+    amount,
+    RELATIVE_APPROX,
+    gov,
+):
+    # Deposit to the vault
+    user_balance_before = token.balanceOf(user)
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    assert token.balanceOf(vault.address) == amount
+
+    # harvest
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
+
+    # tend()
+    strategy.tend({"from": gov})
+
+    # withdrawal
+    vault.withdraw({"from": user})
+    assert (
+        pytest.approx(token.balanceOf(user), rel=RELATIVE_APPROX) == user_balance_before
+    )
+
+
+def test_change_debt(
+    chain, gov, token, vault, strategy, user, strategist, amount, RELATIVE_APPROX
+):
+    # Deposit to the vault and harvest
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    vault.updateStrategyDebtRatio(strategy.address, 5_000, {"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    half = int(amount / 2)
+
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == half
+
+    vault.updateStrategyDebtRatio(strategy.address, 10_000, {"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
+
+    vault.updateStrategyDebtRatio(strategy.address, 5_000, {"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == half
+
+
+def test_sweep(gov, vault, strategy, token, user, amount):
+    # Strategy want token doesn't work
+    token.transfer(strategy, amount, {"from": user})
+    assert token.address == strategy.want()
+    assert token.balanceOf(strategy) > 0
+    with brownie.reverts("!want"):
+        strategy.sweep(token, {"from": gov})
+
+    # Vault share token doesn't work
+    with brownie.reverts("!shares"):
+        strategy.sweep(vault.address, {"from": gov})
+
+
+def test_triggers(chain, gov, vault, strategy, token, amount, user):
+    # Deposit to the vault and harvest
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    vault.updateStrategyDebtRatio(strategy.address, 5_000, {"from": gov})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    strategy.harvestTrigger(0)
+    strategy.tendTrigger(0)
+
+
+def test_claim_rewards(chain, gov, vault, strategy, token, amount, user, stg_token):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+    # LPStaking emits per block
+    chain.mine(10)
+    assert strategy.pendingRewards() > 0
+
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert strategy.balanceOfReward() > 0
+    assert stg_token.balanceOf(strategy) == strategy.balanceOfReward()
+
+
+def test_losses(
+    chain,
+    accounts,
+    token,
+    vault,
+    strategy,
+    user,
+    amount,
+    RELATIVE_APPROX,
+    lp_staker,
+    stargate_token_pool,
+    gov,
+):
+    # Deposit to the vault
+    user_balance_before = token.balanceOf(user)
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    assert token.balanceOf(vault.address) == amount
+
+    # harvest
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
+
+    # simulate getting rekt
+    strategy_account = accounts.at(strategy.address, force=True)
+
+    lp_staker.emergencyWithdraw(
+        strategy.liquidityPoolIDInLPStaking(), {"from": strategy_account}
+    )
+    stargate_token_pool.transfer(
+        BURN_ADDRESS,
+        stargate_token_pool.balanceOf(strategy),
+        {"from": strategy_account},
+    )
+
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+
+    assert (
+        pytest.approx(tx.events["StrategyReported"]["loss"], rel=RELATIVE_APPROX)
+        == amount
+    )
+
+    # withdrawal
+    vault.withdraw({"from": user})
+    assert (
+        pytest.approx(token.balanceOf(user), rel=RELATIVE_APPROX)
+        == user_balance_before - amount
+    )
+
+
+@pytest.mark.parametrize("loss_percentage", [0.02, 0.3, 1])
+def test_equal_distribution_of_losses(
+    chain,
+    accounts,
+    token,
+    vault,
+    strategy,
+    user,
+    amount,
+    RELATIVE_APPROX,
+    lp_staker,
+    stargate_token_pool,
+    gov,
+    amount2,
+    user2,
+    userBIG,
+    amountBIG,
+    loss_percentage,
+):
+    # Deposit to the vault
+    token.approve(vault.address, amount, {"from": user})
+    token.approve(vault.address, amount2, {"from": user2})
+    token.approve(vault.address, amountBIG, {"from": userBIG})
+    vault.deposit(amount, {"from": user})
+    vault.deposit(amount2, {"from": user2})
+    vault.deposit(amountBIG, {"from": userBIG})
+    assert token.balanceOf(vault.address) == amount + amount2 + amountBIG
+    token.transfer(gov, token.balanceOf(user), {"from": user})
+    token.transfer(gov, token.balanceOf(user2), {"from": user2})
+    token.transfer(gov, token.balanceOf(userBIG), {"from": userBIG})
+
+    # harvest
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert (
+        pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX)
+        == amount + amount2 + amountBIG
+    )
+
+    # simulate getting rekt
+    strategy_account = accounts.at(strategy.address, force=True)
+    lp_staker.emergencyWithdraw(
+        strategy.liquidityPoolIDInLPStaking(), {"from": strategy_account}
+    )
+    stargate_token_pool.transfer(
+        BURN_ADDRESS,
+        int(stargate_token_pool.balanceOf(strategy) * loss_percentage),
+        {"from": strategy_account},
+    )
+
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert (
+        pytest.approx(tx.events["StrategyReported"]["loss"], rel=RELATIVE_APPROX)
+        == (amount + amount2 + amountBIG) * loss_percentage
+    )
+
+    # withdrawal
+    vault.withdraw({"from": user})
+    vault.withdraw({"from": userBIG})
+    vault.withdraw({"from": user2})
+
+    def holdings(account):
+        return token.balanceOf(account) + (
+            vault.balanceOf(account) * vault.pricePerShare() / (10 ** token.decimals())
+        )
+
+    assert pytest.approx(holdings(user), rel=RELATIVE_APPROX) == holdings(user2)
+    assert pytest.approx(holdings(user), rel=RELATIVE_APPROX) == amount * (
+        1 - loss_percentage
+    )
+    assert pytest.approx(holdings(user2), rel=RELATIVE_APPROX) == amount2 * (
+        1 - loss_percentage
+    )
+    assert pytest.approx(holdings(userBIG), rel=RELATIVE_APPROX) == amountBIG * (
+        1 - loss_percentage
+    )
+
+
+def test_limited_delta_credit_no_loss(
+    chain,
+    token,
+    vault,
+    strategy,
+    user,
+    amount,
+    RELATIVE_APPROX,
+    gov,
+    stargate_token_pool,
+):
+    # Deposit to the vault
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    assert token.balanceOf(vault.address) == amount
+
+    # harvest
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
+
+    # other chains drained all the credit available for instant redeems
+    stargate_token_pool.setDeltaCredit(0, {"from": gov})
+
+    vault.updateStrategyDebtRatio(strategy.address, 0, {"from": gov})
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
+    assert (
+        tx.events["StrategyReported"]["loss"] < 10
+    )  # might have a small loss due to rounding error
+    assert pytest.approx(vault.debtOutstanding(strategy), rel=RELATIVE_APPROX) == amount
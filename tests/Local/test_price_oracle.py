@@ -0,0 +1,98 @@
+import brownie
+import pytest
+
+ETH = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
+DAY = 24 * 60 * 60
+USD_PRICES = {"ETH": 2_000, "STG": 0.5, "USDC": 1, "USDT": 1, "WETH": 2_000}
+
+
+@pytest.fixture
+def feeds(gov, MockPriceFeed):
+    # */USD feeds with Chainlink's 8 decimals
+    yield {
+        symbol: gov.deploy(MockPriceFeed, 8, int(price * 10 ** 8))
+        for symbol, price in (("ETH", 2_000), ("STG", 0.5), ("USD", 1))
+    }
+
+
+@pytest.fixture
+def chainlink_oracle(gov, token, stg_token, feeds, ChainlinkOracle):
+    oracle = gov.deploy(ChainlinkOracle)
+    want_feed = feeds["ETH"] if token.symbol() == "WETH" else feeds["USD"]
+    for asset, feed in (
+        (ETH, feeds["ETH"]),
+        (stg_token, feeds["STG"]),
+        (token, want_feed),
+    ):
+        oracle.setFeed(asset, feed, DAY, {"from": gov})
+    yield oracle
+
+
+def in_want(token, symbol, amount):
+    # `amount` whole tokens of `symbol`, in want base units
+    return int(
+        amount
+        * USD_PRICES[symbol]
+        * 10 ** token.decimals()
+        / USD_PRICES[token.symbol()]
+    )
+
+
+def test_quote_across_decimals(token, stg_token, chainlink_oracle):
+    assert chainlink_oracle.quote(ETH, token, 10 ** 18) == in_want(token, "ETH", 1)
+    assert chainlink_oracle.quote(stg_token, token, 10 ** 18) == in_want(
+        token, "STG", 1
+    )
+    assert (
+        chainlink_oracle.quote(token, stg_token, in_want(token, "STG", 1)) == 10 ** 18
+    )
+    assert chainlink_oracle.quote(ETH, token, 0) == 0
+
+
+def test_bad_answers_revert(chain, token, user, gov, feeds, chainlink_oracle):
+    with brownie.reverts("!feed"):
+        chainlink_oracle.quote(user, token, 10 ** 18)
+
+    chain.sleep(DAY + 1)
+    chain.mine()
+    with brownie.reverts("stale"):
+        chainlink_oracle.quote(ETH, token, 10 ** 18)
+    for feed in feeds.values():
+        feed.setAnswer(feed.latestAnswer(), {"from": gov})
+    assert chainlink_oracle.quote(ETH, token, 10 ** 18) == in_want(token, "ETH", 1)
+
+    feeds["ETH"].setAnswer(0, {"from": gov})
+    with brownie.reverts("!price"):
+        chainlink_oracle.quote(ETH, token, 10 ** 18)
+
+
+def test_strategy_prices_through_oracle(
+    chain, token, vault, strategy, stg_token, chainlink_oracle, user, amount, gov
+):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    chain.mine(10)
+    assert strategy.ethToWant(10 ** 18) == 0
+    assert strategy.pendingRewardsInWant() == 0
+
+    strategy.setPriceOracle(chainlink_oracle, {"from": gov})
+    assert strategy.ethToWant(10 ** 18) == in_want(token, "ETH", 1)
+    rewards = strategy.pendingRewards() + strategy.balanceOfReward()
+    assert rewards > 0
+    assert strategy.pendingRewardsInWant() == chainlink_oracle.quote(
+        stg_token, token, rewards
+    )
+
+    # a stale feed falls back to the delays instead of breaking the trigger
+    chain.sleep(DAY + 1)
+    chain.mine()
+    assert strategy.ethToWant(10 ** 18) == 0
+    assert strategy.pendingRewardsInWant() == 0
+    assert not strategy.harvestTrigger(10 ** 15)
+
+
+def test_set_feed_access(token, feeds, chainlink_oracle, user):
+    with brownie.reverts("Ownable: caller is not the owner"):
+        chainlink_oracle.setFeed(token, feeds["USD"], DAY, {"from": user})
@@ -11,8 +11,6 @@ def test_revoke_strategy_from_vault(
     strategy.harvest({"from": gov})
     assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
 
-    # In order to pass this tests, you will need to implement prepareReturn.
-    # TODO: uncomment the following lines.
     vault.revokeStrategy(strategy.address, {"from": gov})
     chain.sleep(1)
     strategy.harvest({"from": gov})
@@ -29,7 +27,7 @@ def test_revoke_strategy_from_strategy(
     strategy.harvest({"from": gov})
     assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
 
-    strategy.setEmergencyExit()
+    strategy.setEmergencyExit({"from": gov})
     chain.sleep(1)
     strategy.harvest({"from": gov})
     assert pytest.approx(token.balanceOf(vault.address), rel=RELATIVE_APPROX) == amount
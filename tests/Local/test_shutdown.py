@@ -1,7 +1,3 @@
-# TODO: Add tests that show proper operation of this strategy through "emergencyExit"
-#       Make sure to demonstrate the "worst case losses" as well as the time it takes
-
-from brownie import ZERO_ADDRESS
 import pytest
 
 
@@ -14,12 +10,10 @@ def test_vault_shutdown_can_withdraw(
     assert token.balanceOf(vault.address) == amount
 
     if token.balanceOf(user) > 0:
-        token.transfer(
-            "0x7abe0ce388281d2acf297cb089caef3819b13448",
-            token.balanceOf(user),
-            {"from": user},
-        )
+        token.transfer(gov, token.balanceOf(user), {"from": user})
 
+    chain.mine(1)
+    chain.sleep(60)
     # Harvest 1: Send funds through the strategy
     strategy.harvest({"from": gov})
     chain.sleep(3600 * 7)
@@ -27,7 +21,7 @@ def test_vault_shutdown_can_withdraw(
     assert pytest.approx(strategy.estimatedTotalAssets(), rel=RELATIVE_APPROX) == amount
 
     ## Set Emergency
-    vault.setEmergencyShutdown(True)
+    vault.setEmergencyShutdown(True, {"from": gov})
 
     ## Withdraw (does it work, do you get what you expect)
     vault.withdraw({"from": user})
@@ -43,6 +37,8 @@ def test_basic_shutdown(
     vault.deposit(amount, {"from": user})
     assert token.balanceOf(vault.address) == amount
 
+    chain.mine(1)
+    chain.sleep(60)
     # Harvest 1: Send funds through the strategy
     strategy.harvest({"from": gov})
     chain.mine(100)
@@ -57,9 +53,10 @@ def test_basic_shutdown(
     chain.sleep(3600 * 6)  # 6 hrs needed for profits to unlock
     chain.mine(1)
 
-    ## Set emergency
+    ## Set emergency
     strategy.setEmergencyExit({"from": strategist})
-
+    chain.mine(1)
+    chain.sleep(60)
     strategy.harvest({"from": gov})  ## Remove funds from strategy
 
     assert token.balanceOf(strategy) == 0
@@ -67,4 +64,3 @@ def test_basic_shutdown(
     assert (
         pytest.approx(token.balanceOf(vault), rel=RELATIVE_APPROX) == amount
     )  ## The vault has all funds
-    ## NOTE: May want to tweak this based on potential loss during migration
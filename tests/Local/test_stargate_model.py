@@ -0,0 +1,152 @@
+import pytest
+from brownie import accounts
+
+from scripts.mock_stargate import accrue_fees
+from scripts.stargate_model import ConstantProductSwapper, model_from_chain
+
+# The Python model has to agree with the contracts to the wei, so every check below replays
+# the same action on chain and in a snapshot of it, then compares the full state.
+
+
+def assert_matches_chain(model, strategy, vault):
+    chain_model = model_from_chain(strategy, vault, swapper=model.swapper)
+    assert model.want_balance == chain_model.want_balance
+    assert model.reward_balance == chain_model.reward_balance
+    assert model.unstaked_lp == chain_model.unstaked_lp
+    assert model.staked_lp == chain_model.staked_lp
+    assert model.total_debt == chain_model.total_debt
+    assert model.pool.total_liquidity == chain_model.pool.total_liquidity
+    assert model.pool.total_supply == chain_model.pool.total_supply
+    assert model.pool.delta_credit == chain_model.pool.delta_credit
+
+
+def reward_pair(uniswap_router, stargate_stack, token):
+    return ConstantProductSwapper(
+        uniswap_router.reserves(stargate_stack.reward, token),
+        uniswap_router.reserves(token, stargate_stack.reward),
+    )
+
+
+@pytest.fixture
+def invested(chain, token, vault, strategy, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+    chain.mine(10)
+
+
+@pytest.mark.parametrize("delta_credit_share", [0, 0.3, 1])
+def test_harvest_matches_chain(
+    chain,
+    token,
+    vault,
+    strategy,
+    gov,
+    token_lp,
+    token_whale,
+    stargate_stack,
+    invested,
+    delta_credit_share,
+):
+    # fees for a profit to free, and a debt to pay back, against a drained deltaCredit
+    fees = vault.strategies(strategy)["totalDebt"] // 100
+    accrue_fees(stargate_stack, token.symbol(), token_whale, fees)
+    vault.updateStrategyDebtRatio(strategy, 5_000, {"from": gov})
+    token_lp.setDeltaCredit(
+        int(token_lp.deltaCredit() * delta_credit_share), {"from": gov}
+    )
+    debt_outstanding = vault.debtOutstanding(strategy)
+
+    model = model_from_chain(strategy, vault)
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    model.block = tx.block_number
+
+    profit, loss, debt_payment = model.prepare_return(debt_outstanding)
+    report = tx.events["StrategyReported"]
+    assert (profit, loss, debt_payment) == (
+        report["gain"],
+        report["loss"],
+        report["debtPaid"],
+    )
+
+
+@pytest.mark.parametrize("delta_credit_share", [0, 0.3, 1])
+def test_liquidate_position_matches_chain(
+    token, vault, strategy, gov, token_lp, invested, delta_credit_share
+):
+    token_lp.setDeltaCredit(
+        int(token_lp.deltaCredit() * delta_credit_share), {"from": gov}
+    )
+    amount_needed = vault.strategies(strategy)["totalDebt"] // 2
+
+    model = model_from_chain(strategy, vault)
+    tx = strategy.withdraw(amount_needed, {"from": accounts.at(vault, force=True)})
+    model.block = tx.block_number
+
+    assert model.withdraw(amount_needed) == tx.return_value
+    # called directly, the strategy leaves the vault's books alone
+    model.total_debt = vault.strategies(strategy)["totalDebt"]
+    assert_matches_chain(model, strategy, vault)
+
+
+def test_harvest_selling_rewards_matches_chain(
+    chain,
+    token,
+    vault,
+    strategy,
+    gov,
+    swapper,
+    price_oracle,
+    uniswap_router,
+    stargate_stack,
+    invested,
+):
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    strategy.setSwapper(swapper, {"from": gov})
+    debt_outstanding = vault.debtOutstanding(strategy)
+
+    model = model_from_chain(
+        strategy, vault, swapper=reward_pair(uniswap_router, stargate_stack, token)
+    )
+    chain.sleep(1)
+    tx = strategy.harvest({"from": gov})
+    model.block = tx.block_number
+
+    profit, loss, debt_payment = model.prepare_return(debt_outstanding)
+    report = tx.events["StrategyReported"]
+    assert (profit, loss, debt_payment) == (
+        report["gain"],
+        report["loss"],
+        report["debtPaid"],
+    )
+    # the sold rewards are the profit
+    assert profit > 0
+    assert model.swapper == reward_pair(uniswap_router, stargate_stack, token)
+
+
+def test_tend_matches_chain(
+    token,
+    vault,
+    strategy,
+    gov,
+    swapper,
+    price_oracle,
+    uniswap_router,
+    stargate_stack,
+    invested,
+):
+    strategy.setPriceOracle(price_oracle, {"from": gov})
+    strategy.setSwapper(swapper, {"from": gov})
+    debt_outstanding = vault.debtOutstanding(strategy)
+
+    model = model_from_chain(
+        strategy, vault, swapper=reward_pair(uniswap_router, stargate_stack, token)
+    )
+    tx = strategy.tend({"from": gov})
+    model.block = tx.block_number
+
+    model.tend(debt_outstanding)
+    assert_matches_chain(model, strategy, vault)
+    assert model.swapper == reward_pair(uniswap_router, stargate_stack, token)
@@ -0,0 +1,53 @@
+import pytest
+from brownie import accounts
+
+from scripts.withdraw_quote import quote_withdrawals, route_withdrawal
+
+
+@pytest.fixture
+def invested(chain, token, vault, strategy, user, amount, gov):
+    token.approve(vault.address, amount, {"from": user})
+    vault.deposit(amount, {"from": user})
+    chain.sleep(1)
+    strategy.harvest({"from": gov})
+
+
+@pytest.mark.parametrize("delta_credit_share", [0, 0.25, 1])
+def test_quote_matches_liquidation(
+    token, vault, strategy, gov, stargate_token_pool, invested, delta_credit_share
+):
+    total = strategy.estimatedTotalAssets()
+    stargate_token_pool.setDeltaCredit(
+        int(total // stargate_token_pool.convertRate() * delta_credit_share),
+        {"from": gov},
+    )
+    amount_needed = total // 2
+    withdrawable, blocked, lp_to_redeem = strategy.quoteWithdraw(amount_needed)
+    lp_before = strategy.balanceOfAllLPToken()
+
+    vault_account = accounts.at(vault, force=True)
+    before = token.balanceOf(vault)
+    strategy.withdraw(amount_needed, {"from": vault_account})
+
+    assert token.balanceOf(vault) - before == withdrawable
+    assert lp_before - strategy.balanceOfAllLPToken() == lp_to_redeem
+    assert withdrawable + blocked == amount_needed
+
+
+def test_quote_loose_want(token, strategy, token_whale, amount):
+    token.transfer(strategy, amount, {"from": token_whale})
+    assert strategy.quoteWithdraw(amount // 2) == (amount // 2, 0, 0)
+
+
+def test_route_withdrawal(strategy, gov, stargate_token_pool, invested):
+    total = strategy.estimatedTotalAssets()
+    stargate_token_pool.setDeltaCredit(
+        total // 4 // stargate_token_pool.convertRate(), {"from": gov}
+    )
+
+    (quote,) = quote_withdrawals([strategy], total)
+    assert quote.withdrawable == strategy.quoteWithdraw(total)[0]
+
+    route, unrouted = route_withdrawal([strategy], total)
+    assert route == [(strategy.address, quote.withdrawable)]
+    assert unrouted == total - quote.withdrawable
@@ -0,0 +1,20 @@
+import os
+
+import pytest
+from brownie._config import CONFIG
+
+
+def network_id(config):
+    # brownie fills CONFIG.argv["network"] only in its own pytest_configure, read the option
+    network = config.getoption("--network", None)
+    return network[0] if network else CONFIG.settings["networks"]["default"]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # scripts/run_shards.py runs several suites at once, one local chain per shard. Each shard
+    # gets its own port, set here before the brownie plugin launches the chain.
+    if os.environ.get("BROWNIE_PORT"):
+        CONFIG.networks[network_id(config)]["cmd_settings"]["port"] = int(
+            os.environ["BROWNIE_PORT"]
+        )
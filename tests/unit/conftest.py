@@ -0,0 +1,12 @@
+import sys
+from pathlib import Path
+
+# Chain-free tier: the tests here check the Python tooling in scripts/ on synthetic data and
+# need neither a chain nor the mock Stargate stack, so they run without the brownie plugin:
+#
+#   python -m pytest tests/unit -p no:pytest-brownie
+#
+# `brownie test tests/unit` runs them as well, but launches a dev chain first.
+
+# `scripts` is imported from the project root, wherever pytest is started from
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
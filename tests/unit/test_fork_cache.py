@@ -0,0 +1,95 @@
+import json
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from scripts.fork_cache import ForkCacheProxy
+
+BLOCK = 15_500_000
+
+
+class FakeArchiveNode:
+    """Upstream that answers every request with its method and params and counts the calls."""
+
+    def __init__(self):
+        self.calls = []
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                request = json.loads(
+                    self.rfile.read(int(self.headers["Content-Length"]))
+                )
+                node.calls.append(request)
+                result = None if request["method"] == "eth_getBlockByHash" else request
+                body = json.dumps(
+                    {"jsonrpc": "2.0", "id": request["id"], "result": result}
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        host, port = self.server.server_address
+        self.url = f"http://{host}:{port}"
+
+
+@pytest.fixture
+def archive_node():
+    node = FakeArchiveNode()
+    yield node
+    node.server.shutdown()
+
+
+def rpc(url, method, *params):
+    request = urllib.request.Request(
+        url,
+        json.dumps(
+            {"jsonrpc": "2.0", "id": 7, "method": method, "params": list(params)}
+        ).encode(),
+        {"Content-Type": "application/json"},
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+def test_second_session_is_served_from_disk(tmp_path, archive_node):
+    slot = ("0xdAC17F958D2ee523a2206206994597C13D831ec7", "0x0", hex(BLOCK))
+    with ForkCacheProxy(archive_node.url, BLOCK, 1, tmp_path, port=0) as proxy:
+        first = rpc(proxy.url, "eth_getStorageAt", *slot)
+        assert rpc(proxy.url, "eth_getStorageAt", *slot) == first
+        assert len(archive_node.calls) == 1
+        # block tags are pinned, so they share the cached answer
+        assert rpc(proxy.url, "eth_getStorageAt", *slot[:2], "latest") == first
+        assert len(archive_node.calls) == 1
+        assert rpc(proxy.url, "eth_blockNumber")["result"] == hex(BLOCK)
+
+    with ForkCacheProxy(None, BLOCK, 1, tmp_path, offline=True, port=0) as proxy:
+        assert rpc(proxy.url, "eth_getStorageAt", *slot) == first
+        missing = rpc(proxy.url, "eth_getCode", slot[0], hex(BLOCK))
+        assert missing["error"]["message"] == "eth_getCode not in fork cache"
+    assert len(archive_node.calls) == 1
+
+
+def test_cache_is_per_block_and_skips_empty_answers(tmp_path, archive_node):
+    with ForkCacheProxy(archive_node.url, BLOCK, 1, tmp_path, port=0) as proxy:
+        rpc(proxy.url, "eth_chainId")
+        rpc(proxy.url, "eth_getBlockByHash", "0x" + "11" * 32, False)
+        rpc(proxy.url, "eth_getBlockByHash", "0x" + "11" * 32, False)
+        assert len(archive_node.calls) == 3
+        # not a pinned-block read, always forwarded
+        rpc(proxy.url, "eth_gasPrice")
+        rpc(proxy.url, "eth_gasPrice")
+        assert len(archive_node.calls) == 5
+        assert proxy.hits == 0
+
+    with ForkCacheProxy(archive_node.url, BLOCK + 1, 1, tmp_path, port=0) as proxy:
+        rpc(proxy.url, "eth_chainId")
+        assert len(archive_node.calls) == 6
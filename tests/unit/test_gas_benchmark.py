@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+from scripts.gas_benchmark import GasReport
+
+
+def test_check_fails_on_regressions_and_missing_baselines(tmp_path):
+    baseline_path = tmp_path / "gas_baseline.json"
+    baseline_path.write_text(json.dumps({"harvest[USDC]": 100_000}))
+    report = GasReport(baseline_path, tolerance=500)
+
+    report.record("harvest[USDC]", 100_500)
+    report.check("harvest[USDC]")
+    report.record("harvest[USDC]", 100_501)
+    with pytest.raises(AssertionError, match="tolerance"):
+        report.check("harvest[USDC]")
+
+    # a scenario that is not in the baseline cannot pass unnoticed
+    report.record("tend[USDC]", 50_000)
+    with pytest.raises(AssertionError, match="no baseline"):
+        report.check("tend[USDC]")
+
+    report.save_baseline()
+    assert json.loads(baseline_path.read_text()) == {
+        "harvest[USDC]": 100_501,
+        "tend[USDC]": 50_000,
+    }
@@ -0,0 +1,13 @@
+from scripts.gas_compare import compare
+
+
+def test_compare_reports_deltas_against_the_base_revision():
+    report = compare(
+        {"harvest[USDC]": 200_000, "clone[USDC]": 300_000},
+        {"harvest[USDC]": 190_000, "withdraw_all[USDC]": 150_000},
+    )
+    assert report.delta("harvest[USDC]") == -10_000
+    table = report.to_markdown()
+    assert "| harvest[USDC] | 190000 | 200000 | -10000 |" in table
+    assert "| withdraw_all[USDC] | 150000 | - | new |" in table
+    assert "clone" not in table
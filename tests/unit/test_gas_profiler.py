@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+from scripts.gas_profiler import GasProfile, diff_to_markdown
+
+
+def step(depth, jump_depth, fn, gas, gas_cost=3, op="PUSH1"):
+    return {
+        "depth": depth,
+        "jumpDepth": jump_depth,
+        "fn": fn,
+        "gas": gas,
+        "gasCost": gas_cost,
+        "op": op,
+    }
+
+
+HARVEST = "Strategy.harvest"
+CLAIM = "Strategy._claimRewards"
+DEPOSIT = "MockLPStaking.deposit"
+
+TRACE = [
+    step(0, 0, HARVEST, 1_000),
+    step(0, 0, HARVEST, 997, 8, "JUMP"),
+    step(0, 1, CLAIM, 989),
+    # the CALL's gasCost includes the gas forwarded to the callee, it is not used here
+    step(0, 1, CLAIM, 986, 900, "CALL"),
+    step(1, 0, DEPOSIT, 800, 100, "SLOAD"),
+    step(1, 0, DEPOSIT, 700, 0, "RETURN"),
+    step(0, 1, CLAIM, 830, 8, "JUMP"),
+    step(0, 0, HARVEST, 822, 0, "STOP"),
+]
+
+
+def test_profile_splits_gas_by_call_path():
+    profile = GasProfile.from_tx(SimpleNamespace(trace=TRACE, gas_used=21_500))
+    assert profile.stacks == {
+        (HARVEST,): 3 + 8 + 0,
+        (HARVEST, CLAIM): 3 + (986 - 830 - 100) + 8,
+        (HARVEST, CLAIM, DEPOSIT): 100,
+    }
+    # the steps account for all gas the call used
+    assert profile.execution_gas == 1_000 - 822
+
+    functions = profile.functions()
+    assert functions[HARVEST] == {"self": 11, "total": 178, "calls": 1}
+    assert functions[CLAIM] == {"self": 67, "total": 167, "calls": 1}
+    assert functions[DEPOSIT] == {"self": 100, "total": 100, "calls": 1}
+    assert profile.contracts() == {"Strategy": 78, "MockLPStaking": 100}
+    assert profile.folded().splitlines() == [
+        f"{HARVEST} 11",
+        f"{HARVEST};{CLAIM} 67",
+        f"{HARVEST};{CLAIM};{DEPOSIT} 100",
+    ]
+
+
+def test_profiles_round_trip_and_diff(tmp_path):
+    base = GasProfile.from_tx(SimpleNamespace(trace=TRACE, gas_used=21_500))
+    base.write("harvest", tmp_path)
+    assert (tmp_path / "harvest.folded").read_text() == base.folded()
+    loaded = GasProfile.load(tmp_path / "harvest.json")
+    assert loaded.stacks == base.stacks
+    assert loaded.calls == base.calls
+    assert loaded.gas_used == 21_500
+
+    # a build that stakes without the internal call
+    new = GasProfile(
+        {(HARVEST,): 30, (HARVEST, DEPOSIT): 100},
+        {(HARVEST,): 1, (HARVEST, DEPOSIT): 1},
+        21_450,
+    )
+    assert base.diff(new) == [
+        ((HARVEST,), 11, 30),
+        ((HARVEST, DEPOSIT), 0, 100),
+        ((HARVEST, CLAIM), 67, 0),
+        ((HARVEST, CLAIM, DEPOSIT), 100, 0),
+    ]
+    assert "(-50)" in diff_to_markdown(base, new)
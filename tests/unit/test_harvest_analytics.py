@@ -0,0 +1,149 @@
+import sqlite3
+import time
+
+import numpy as np
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+from scripts.event_indexer import SCHEMA
+from scripts.harvest_analytics import (
+    LP_RATE_UNIT,
+    YEAR,
+    harvest_periods,
+    load_history,
+    strategy_summary,
+)
+
+DAY = 24 * 60 * 60
+
+
+def history(rows):
+    return pd.DataFrame(
+        rows,
+        columns=[
+            "chain",
+            "strategy",
+            "timestamp",
+            "gain",
+            "loss",
+            "total_debt",
+            "lp_balance",
+            "lp_rate",
+        ],
+    )
+
+
+def test_periods_split_fee_and_emission_yield():
+    rate = LP_RATE_UNIT
+    periods = harvest_periods(
+        history(
+            [
+                # out of order on purpose, periods follow the timestamps per strategy
+                ("mainnet", "A", 2 * YEAR, 300, 0, 1_300, 1_000, 1.1 * rate),
+                ("mainnet", "A", 0, 0, 0, 1_000, 1_000, 1.0 * rate),
+                ("mainnet", "A", YEAR, 150, 0, 1_000, 1_000, 1.05 * rate),
+                ("optimism", "A", 0, 0, 0, 1_000, 1_000, rate),
+                ("optimism", "A", YEAR // 2, 0, 100, 1_000, 1_000, rate),
+            ]
+        )
+    )
+    mainnet = periods[periods["chain"] == "mainnet"]
+    assert list(mainnet["pnl"]) == [150, 300]
+    # 1_000 LP x 0.05 of LP price growth per period, the rest came from rewards
+    assert mainnet["fee_yield"].to_numpy() == pytest.approx([50, 50])
+    assert mainnet["emission_yield"].to_numpy() == pytest.approx([100, 250])
+    assert mainnet["apr"].to_numpy() == pytest.approx([0.15, 0.3])
+    assert list(mainnet["drawdown"]) == [0, 0]
+
+    optimism = periods[periods["chain"] == "optimism"]
+    assert optimism["apr"].to_numpy() == pytest.approx([-0.2])
+    assert optimism["drawdown"].to_numpy() == pytest.approx([0.1])
+
+    summary = strategy_summary(periods)
+    assert summary.loc[("mainnet", "A"), "apr"] == pytest.approx(450 / 2_000)
+    assert summary.loc[("mainnet", "A"), "fee_apr"] == pytest.approx(100 / 2_000)
+    assert summary.loc[("mainnet", "A"), "emission_apr"] == pytest.approx(350 / 2_000)
+    assert summary.loc[("optimism", "A"), "max_drawdown"] == pytest.approx(0.1)
+
+
+def test_drawdown_recovers_from_running_peak():
+    rate = LP_RATE_UNIT
+    rows = [("mainnet", "A", 0, 0, 0, 1_000, 0, rate)]
+    # +10%, -20%, +10%
+    for day, (gain, loss) in enumerate([(100, 0), (0, 200), (100, 0)], start=1):
+        rows.append(("mainnet", "A", day * DAY, gain, loss, 1_000, 0, rate))
+    periods = harvest_periods(history(rows))
+    assert periods["drawdown"].to_numpy() == pytest.approx(
+        [0, 0.2, 1 - 1.1 * 0.8 * 1.1 / 1.1]
+    )
+    # no LP held, everything is emission yield
+    assert list(periods["fee_yield"]) == [0, 0, 0]
+
+
+def test_periods_without_harvest_state_have_no_split():
+    periods = harvest_periods(
+        history(
+            [
+                ("mainnet", "A", 0, 0, 0, 1_000, np.nan, np.nan),
+                ("mainnet", "A", YEAR, 100, 0, 1_000, np.nan, np.nan),
+            ]
+        )
+    )
+    summary = strategy_summary(periods)
+    assert summary.loc[("mainnet", "A"), "apr"] == pytest.approx(0.1)
+    assert np.isnan(summary.loc[("mainnet", "A"), "fee_apr"])
+
+
+def test_years_of_history_on_every_clone_in_under_a_second():
+    # daily harvests for three years, 200 strategies on each of two chains
+    rng = np.random.default_rng(1)
+    strategies, days = 200, 3 * 365
+    rows = 2 * strategies * days
+    frame = pd.DataFrame(
+        {
+            "chain": np.repeat(["mainnet", "optimism"], strategies * days),
+            "strategy": np.tile(np.repeat(np.arange(strategies), days), 2).astype(str),
+            "timestamp": np.tile(np.arange(days) * DAY, 2 * strategies),
+            "gain": rng.uniform(0, 10, rows),
+            "loss": np.where(rng.uniform(size=rows) < 0.01, 20.0, 0.0),
+            "total_debt": rng.uniform(9_000, 11_000, rows),
+            "lp_balance": np.full(rows, 10_000.0),
+            "lp_rate": LP_RATE_UNIT
+            * (1 + np.tile(np.arange(days), 2 * strategies) * 1e-5),
+        }
+    )
+
+    start = time.time()
+    summary = strategy_summary(harvest_periods(frame))
+    assert time.time() - start < 1
+    assert len(summary) == 2 * strategies
+    assert (summary["periods"] == days - 1).all()
+
+
+def test_load_history_from_event_index(tmp_path):
+    path = tmp_path / "mainnet.sqlite"
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    db.executemany(
+        "INSERT INTO reports (block, tx_hash, log_index, strategy, gain, loss, total_debt) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [
+            (10, "0x01", 3, "A", "0", "0", str(10 ** 24)),
+            (20, "0x02", 1, "A", "5", "0", str(10 ** 24 + 5)),
+        ],
+    )
+    db.executemany("INSERT INTO blocks VALUES (?, ?)", [(10, 1000), (20, 2000)])
+    db.execute(
+        "INSERT INTO harvest_state VALUES (20, '0x02', 0, 'A', '7', ?)",
+        (str(LP_RATE_UNIT + 1),),
+    )
+    db.commit()
+    db.close()
+
+    loaded = load_history(path)
+    assert list(loaded["chain"]) == ["mainnet", "mainnet"]
+    assert list(loaded["timestamp"]) == [1000, 2000]
+    assert loaded["total_debt"][0] == 1e24
+    assert np.isnan(loaded["lp_balance"][0])
+    assert loaded["lp_balance"][1] == 7
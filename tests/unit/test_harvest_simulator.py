@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from scripts.harvest_simulator import (
+    HarvestParams,
+    MarketParams,
+    generate_paths,
+    prepare_return,
+    simulate,
+)
+from scripts.stargate_model import LPStaking, Pool, StakingPool, StargateModel
+
+
+@pytest.mark.parametrize(
+    "want,lp,total_debt,debt_outstanding,delta_credit",
+    [
+        (0, 1_000_000, 900_000, 0, 1_000_000),
+        (0, 1_000_000, 900_000, 500_000, 1_000_000),
+        (50_000, 1_000_000, 900_000, 500_000, 120_000),
+        (0, 1_000_000, 1_100_000, 200_000, 0),
+        (300_000, 600_000, 1_000_000, 50_000, 10_000),
+    ],
+)
+def test_prepare_return_matches_model(
+    want, lp, total_debt, debt_outstanding, delta_credit
+):
+    # with one LP per want the scalar model and the vectorized accounting must agree exactly
+    pool = Pool(convert_rate=1)
+    pool.mint("other", 10 * lp)
+    pool.mint("strategy", lp)
+    pool.delta_credit = delta_credit
+    model = StargateModel(
+        pool=pool,
+        lp_staking=LPStaking(0, 1, 0, {0: StakingPool(1, 0)}),
+        pid=0,
+        block=0,
+        want_balance=want,
+        total_debt=total_debt,
+    )
+    expected = model.prepare_return(debt_outstanding)
+
+    profit, loss, debt_payment, loose, lp_value = prepare_return(
+        np.array([want], dtype=float),
+        np.array([lp], dtype=float),
+        np.array([total_debt], dtype=float),
+        np.array([debt_outstanding], dtype=float),
+        np.array([delta_credit], dtype=float),
+    )
+    assert (profit[0], loss[0], debt_payment[0]) == expected
+    assert loose[0] == model.want_balance
+    assert lp_value[0] == model.unstaked_lp
+
+
+def test_simulation_respects_report_delays():
+    market = MarketParams(days=200, max_acceptable_base_fee_gwei=0)
+    paths = generate_paths(market, 500, seed=1)
+    frequent, rare = simulate(
+        market, paths, [HarvestParams(1, 10, 1e6), HarvestParams(1, 60, 1e6)]
+    )
+
+    # with the base fee never acceptable only maxReportDelay triggers harvests
+    assert np.all(frequent.harvests == 200 // 11)
+    assert np.all(rare.harvests == 200 // 61)
+    assert np.all(frequent.gas_spent > rare.gas_spent)
+
+
+def test_simulation_is_reproducible():
+    market = MarketParams(days=30)
+    grid = [HarvestParams(3, 30, 1e5)]
+    first = simulate(market, generate_paths(market, 100, seed=7), grid)[0]
+    second = simulate(market, generate_paths(market, 100, seed=7), grid)[0]
+    assert np.array_equal(first.net, second.net)
+    assert first.summary() == second.summary()
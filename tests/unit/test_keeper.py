@@ -0,0 +1,93 @@
+import pytest
+
+from scripts import keeper
+from scripts.keeper import Keeper
+
+
+class FakeMulticall:
+    """Stands in for brownie's multicall, which returns None for a call that reverted."""
+
+    def __call__(self, block_identifier=None):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+class FakeTx:
+    txid = "0x01"
+    events = {}
+
+    def __init__(self, fn_name):
+        self.fn_name = fn_name
+
+
+class FakeStrategy:
+    def __init__(self, address, harvest_trigger=False):
+        self.address = address
+        self.harvest_trigger = harvest_trigger
+        self.reverts = False
+
+    def name(self):
+        return f"Strategy{self.address}"
+
+    def vault(self):
+        return "vault"
+
+    def want(self):
+        return "want"
+
+    def harvestTrigger(self, call_cost):
+        return None if self.reverts else self.harvest_trigger
+
+    def tendTrigger(self, call_cost):
+        return False
+
+    def pendingRewards(self):
+        return None if self.reverts else 10
+
+    def pendingRewardsInWant(self):
+        return 5
+
+    def estimatedTotalAssets(self):
+        return 1_000
+
+    def harvest(self, tx_params):
+        return FakeTx("harvest")
+
+    def tend(self, tx_params):
+        return FakeTx("tend")
+
+
+@pytest.fixture(autouse=True)
+def fake_multicall(monkeypatch):
+    monkeypatch.setattr(keeper, "multicall", FakeMulticall())
+
+
+def test_reverting_strategy_is_skipped_for_the_block(capsys):
+    broken, healthy = FakeStrategy("0xa"), FakeStrategy("0xb")
+    bot = Keeper([broken, healthy], "keeper")
+    bot.tick(block=1)
+
+    broken.reverts = True
+    broken.harvest_trigger = healthy.harvest_trigger = True
+    txs = bot.tick(block=2)
+    assert [tx.fn_name for tx in txs] == ["harvest"]
+    assert "Strategy0xa: skipped at block 2" in capsys.readouterr().out
+    # the last state read is kept, so the flip is still seen once the calls succeed again
+    assert bot.state["0xa"].block == 1
+
+    broken.reverts = False
+    assert [tx.fn_name for tx in bot.tick(block=3)] == ["harvest"]
+    assert bot.state["0xa"].block == 3
+
+
+def test_strategy_reverting_from_the_start_has_no_state():
+    broken = FakeStrategy("0xa", harvest_trigger=True)
+    broken.reverts = True
+    bot = Keeper([broken], "keeper")
+    assert bot.tick(block=1) == []
+    assert bot.state == {}
@@ -0,0 +1,92 @@
+import importlib.util
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from brownie import network
+from brownie._config import CONFIG
+
+from scripts import run_shards
+from scripts.run_shards import ShardResult, junit_summary, merge_gas_reports, shards
+
+JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="1" failures="2" skipped="3" tests="20">
+</testsuite></testsuites>
+"""
+
+
+def root_conftest():
+    path = Path(__file__).parent.parent / "conftest.py"
+    spec = importlib.util.spec_from_file_location("root_conftest", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_matrix_has_one_port_per_shard():
+    matrix = shards()
+    assert {shard.name for shard in matrix} >= {"Local-USDC", "Optimism-WETH"}
+    assert "Optimism-USDT" not in {shard.name for shard in matrix}
+    assert len({shard.port for shard in matrix}) == len(matrix)
+
+    (shard,) = shards(["Mainnet"], ["USDT"], base_port=9000)
+    assert shard.port == 9000
+    assert shard.command(["-x"])[:7] == [
+        "brownie",
+        "test",
+        "tests/Fork",
+        "--network",
+        "eth-main-fork",
+        "-k",
+        "USDT",
+    ]
+    assert shard.command(["-x"])[-1] == "-x"
+    assert shard.env()["BROWNIE_PORT"] == "9000"
+
+
+def test_junit_summary(tmp_path):
+    path = tmp_path / "junit.xml"
+    path.write_text(JUNIT)
+    assert junit_summary(path) == (20, 2, 1, 3)
+
+
+def test_merge_gas_reports(tmp_path, monkeypatch):
+    monkeypatch.setattr(run_shards, "REPORT_DIR", tmp_path)
+    results = []
+    for shard, gas in zip(shards(["Local"]), (100, 200, 300)):
+        shard.report_dir.mkdir(parents=True)
+        (shard.report_dir / "gas_benchmark.json").write_text(
+            json.dumps({f"tend[{shard.token}]": {"gas": gas}})
+        )
+        results.append(ShardResult(shard, 0, 1.0))
+
+    report = merge_gas_reports(results, tmp_path)
+    assert report.results == {"tend[USDC]": 100, "tend[USDT]": 200, "tend[WETH]": 300}
+    assert (tmp_path / "gas_benchmark.md").exists()
+
+
+@pytest.mark.skipif(
+    network.is_connected(), reason="brownie test already launched a chain"
+)
+def test_shard_port_reaches_the_launched_chain(monkeypatch):
+    (shard,) = shards(["Local"], ["USDT"], base_port=9100)
+    cmd_settings = CONFIG.networks[shard.network]["cmd_settings"]
+    # restores the configured port at teardown
+    monkeypatch.setitem(cmd_settings, "port", cmd_settings["port"])
+    monkeypatch.setenv("BROWNIE_PORT", shard.env()["BROWNIE_PORT"])
+    root_conftest().pytest_configure(
+        SimpleNamespace(getoption=lambda name, default=None: [shard.network])
+    )
+
+    launched = {}
+    monkeypatch.setattr(
+        network.rpc, "launch", lambda cmd, **kwargs: launched.update(kwargs)
+    )
+    try:
+        network.connect(shard.network)
+        assert launched["port"] == 9100
+        assert network.web3.provider.endpoint_uri.endswith(":9100")
+    finally:
+        CONFIG.clear_active()
+        network.web3.disconnect()